@@ -5,10 +5,12 @@ from io import StringIO
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlmodel import func, select
 
 from app.api.deps import CurrentUser, SessionDep, get_current_active_superuser
 from app.core.config import settings
+from app.core.responses import list_json_body, raw_json_response
 from app.domains.operations.cash_register_polling import (
     CashRegisterNotFoundError,
     cash_register_offline_reason_ru,
@@ -23,12 +25,14 @@ from app.domains.operations.schemas import (
     CashRegisterUpdate,
 )
 from app.domains.shared.schemas import Message
-from app.services.cache import get_cached_model, invalidate_entity_cache, set_cached_model
+from app.services.cache import get_cached_json, invalidate_entity_cache, set_cached_json
 from app.services.internal_services import _proxy_request
 from app.services.smart_search import build_ilike_filter
 
 CACHE_TTL = 30
 
+_CASH_REGISTER_LIST_ADAPTER = TypeAdapter(list[CashRegisterPublic])
+
 
 async def _invalidate_cache() -> None:
     await invalidate_entity_cache("cash_registers")
@@ -44,10 +48,10 @@ async def read_cash_registers(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=200, ge=1, le=500),
     q: str | None = Query(default=None),
-) -> CashRegistersPublic:
+) -> Response:
     cache_key = f"cash_registers:{q or ''}:{skip}:{limit}"
-    if cached := await get_cached_model(cache_key, CashRegistersPublic):
-        return cached
+    if cached := await get_cached_json(cache_key):
+        return raw_json_response(cached)
 
     del current_user
     statement = select(CashRegister)
@@ -69,11 +73,10 @@ async def read_cash_registers(
             count_stmt = count_stmt.where(flt)
     count = session.exec(count_stmt).one()
     rows = session.exec(statement.order_by(CashRegister.kkm_number).offset(skip).limit(limit)).all()
-    result = CashRegistersPublic(data=rows, count=count)
-
-    await set_cached_model(cache_key, result, ttl=CACHE_TTL)
-
-    return result
+    items = _CASH_REGISTER_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    body = list_json_body(_CASH_REGISTER_LIST_ADAPTER, items, count)
+    await set_cached_json(cache_key, body, ttl=CACHE_TTL)
+    return raw_json_response(body)
 
 
 @router.post("/", response_model=CashRegisterPublic, dependencies=[Depends(get_current_active_superuser)])
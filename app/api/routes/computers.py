@@ -3,17 +3,19 @@ import logging
 import uuid
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy import func
 from sqlmodel import select
 
 from app.api.deps import CurrentUser, SessionDep, get_current_active_superuser
 from app.core.config import settings
+from app.core.responses import list_json_body, list_json_response, raw_json_response
 from app.domains.inventory.models import Computer
 from app.domains.inventory.reachability import probe_host_ports
 from app.domains.inventory.schemas import ComputerCreate, ComputerPublic, ComputersPublic, ComputerUpdate
 from app.domains.shared.schemas import Message
-from app.services.cache import get_cached_model, invalidate_entity_cache, set_cached_model
+from app.services.cache import get_cached_json, invalidate_entity_cache, set_cached_json
 from app.services.smart_search import build_ilike_filter
 
 router = APIRouter(tags=["computers"])
@@ -22,6 +24,8 @@ logger = logging.getLogger(__name__)
 
 CACHE_TTL = 30
 
+_COMPUTER_LIST_ADAPTER = TypeAdapter(list[ComputerPublic])
+
 
 async def _invalidate_cache() -> None:
     await invalidate_entity_cache("computers")
@@ -59,11 +63,11 @@ async def read_computers(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=200, ge=1, le=500),
     q: str | None = Query(default=None),
-) -> ComputersPublic:
+) -> Response:
     del current_user
     cache_key = f"computers:{q or ''}:{skip}:{limit}"
-    if cached := await get_cached_model(cache_key, ComputersPublic):
-        return cached
+    if cached := await get_cached_json(cache_key):
+        return raw_json_response(cached)
 
     statement = select(Computer)
     count_stmt = select(func.count()).select_from(Computer)
@@ -77,11 +81,10 @@ async def read_computers(
             count_stmt = count_stmt.where(flt)
     rows = session.exec(statement.order_by(Computer.hostname).offset(skip).limit(limit)).all()
     count = session.exec(count_stmt).one()
-    result = ComputersPublic(data=rows, count=count)
-
-    await set_cached_model(cache_key, result, ttl=CACHE_TTL)
-
-    return result
+    items = _COMPUTER_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    body = list_json_body(_COMPUTER_LIST_ADAPTER, items, count)
+    await set_cached_json(cache_key, body, ttl=CACHE_TTL)
+    return raw_json_response(body)
 
 
 @router.post("/", response_model=ComputerPublic, dependencies=[Depends(get_current_active_superuser)])
@@ -148,7 +151,7 @@ async def poll_computer(computer_id: uuid.UUID, session: SessionDep, current_use
 
 
 @router.post("/poll-all", response_model=ComputersPublic)
-async def poll_all_computers(session: SessionDep, current_user: CurrentUser) -> ComputersPublic:
+async def poll_all_computers(session: SessionDep, current_user: CurrentUser) -> Response:
     del current_user
     rows = session.exec(select(Computer)).all()
     probe_results = await _probe_computers_bulk(rows)
@@ -161,4 +164,5 @@ async def poll_all_computers(session: SessionDep, current_user: CurrentUser) ->
         session.add(row)
     session.commit()
     await _invalidate_cache()
-    return ComputersPublic(data=rows, count=len(rows))
+    items = _COMPUTER_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return list_json_response(_COMPUTER_LIST_ADAPTER, items, len(items))
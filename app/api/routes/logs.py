@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
+from pydantic import TypeAdapter
 from sqlmodel import func, select
 
 from app.api.deps import CurrentUser, SessionDep
+from app.core.responses import list_json_response
 from app.domains.operations.models import EventLog
-from app.domains.operations.schemas import EventLogsPublic
+from app.domains.operations.schemas import EventLogPublic, EventLogsPublic
 from app.services.smart_search import build_ilike_filter
 
 router = APIRouter(tags=["logs"])
 
+_EVENT_LOG_LIST_ADAPTER = TypeAdapter(list[EventLogPublic])
+
 
 @router.get("/", response_model=EventLogsPublic)
 def read_logs(
@@ -18,7 +22,7 @@ def read_logs(
     severity: str | None = Query(default=None),
     device_kind: str | None = Query(default=None),
     q: str | None = Query(default=None),
-) -> EventLogsPublic:
+) -> Response:
     del current_user
     statement = select(EventLog)
     count_stmt = select(func.count()).select_from(EventLog)
@@ -46,4 +50,5 @@ def read_logs(
 
     count = session.exec(count_stmt).one()
     logs = session.exec(statement.order_by(EventLog.created_at.desc()).offset(skip).limit(limit)).all()
-    return EventLogsPublic(data=logs, count=count)
+    items = _EVENT_LOG_LIST_ADAPTER.validate_python(logs, from_attributes=True)
+    return list_json_response(_EVENT_LOG_LIST_ADAPTER, items, count)
@@ -3,11 +3,13 @@ import logging
 import uuid
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, UploadFile
+from pydantic import TypeAdapter
 from sqlmodel import func, select
 
 from app.api.deps import CurrentUser, SessionDep, get_current_active_superuser
 from app.core.config import settings
+from app.core.responses import list_json_body, raw_json_response
 from app.domains.inventory.media_polling import (
     MediaPlayerNotFoundError,
     invalidate_media_player_cache,
@@ -29,7 +31,7 @@ from app.domains.shared.schemas import Message
 from app.observability.metrics import (
     media_player_ops_total,
 )
-from app.services.cache import get_cached_model, set_cached_model
+from app.services.cache import get_cached_json, set_cached_json
 from app.services.discovery import get_discovery_progress, get_discovery_results, run_discovery_scan
 from app.services.event_log import write_event_log
 from app.services.iconbit import (
@@ -53,7 +55,7 @@ from app.services.iconbit import (
 from app.services.iconbit import (
     upload_file as iconbit_upload_file,
 )
-from app.services.internal_services import _proxy_request
+from app.services.internal_services import _parse_proxy_payload, _proxy_request, _proxy_request_bytes
 from app.services.smart_search import build_ilike_filter
 
 logger = logging.getLogger(__name__)
@@ -62,6 +64,8 @@ router = APIRouter(tags=["media-players"])
 
 CACHE_TTL = 30
 
+_MEDIA_PLAYER_LIST_ADAPTER = TypeAdapter(list[MediaPlayerPublic])
+
 
 async def _run_iconbit_discovery(subnet: str, ports: str, known_players: list[dict]) -> None:
     try:
@@ -82,10 +86,10 @@ async def read_media_players(
     limit: int = Query(default=200, le=500),
     name: str | None = None,
     device_type: str | None = None,
-) -> MediaPlayersPublic:
+) -> Response:
     cache_key = f"media_players:{device_type or ''}:{name or ''}:{skip}:{limit}"
-    if cached := await get_cached_model(cache_key, MediaPlayersPublic):
-        return cached
+    if cached := await get_cached_json(cache_key):
+        return raw_json_response(cached)
 
     statement = select(MediaPlayer)
     count_stmt = select(func.count()).select_from(MediaPlayer)
@@ -111,11 +115,10 @@ async def read_media_players(
 
     count = session.exec(count_stmt).one()
     players = session.exec(statement.offset(skip).limit(limit).order_by(MediaPlayer.name)).all()
-    result = MediaPlayersPublic(data=players, count=count)
-
-    await set_cached_model(cache_key, result, ttl=CACHE_TTL)
-
-    return result
+    items = _MEDIA_PLAYER_LIST_ADAPTER.validate_python(players, from_attributes=True)
+    body = list_json_body(_MEDIA_PLAYER_LIST_ADAPTER, items, count)
+    await set_cached_json(cache_key, body, ttl=CACHE_TTL)
+    return raw_json_response(body)
 
 
 @router.post("/", response_model=MediaPlayerPublic, dependencies=[Depends(get_current_active_superuser)])
@@ -166,15 +169,15 @@ async def discover_iconbit_status(current_user: CurrentUser) -> dict:
 
 
 @router.get("/discover/results", response_model=DiscoveryResults)
-async def discover_iconbit_results(current_user: CurrentUser) -> dict:
+async def discover_iconbit_results(current_user: CurrentUser) -> DiscoveryResults | dict:
     del current_user
     if settings.DISCOVERY_SERVICE_ENABLED:
-        payload = await _proxy_request(
+        payload = await _proxy_request_bytes(
             base_url=settings.DISCOVERY_SERVICE_URL,
             method="GET",
             path="/discover/iconbit/results",
         )
-        return DiscoveryResults.model_validate(payload).model_dump()
+        return _parse_proxy_payload(DiscoveryResults.from_json_bytes, payload)
     progress = await get_discovery_progress("iconbit")
     devices = await get_discovery_results("iconbit")
     return {"progress": progress, "devices": devices}
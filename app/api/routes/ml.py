@@ -3,17 +3,28 @@ from __future__ import annotations
 import uuid
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlmodel import select
 
 from app.api.deps import CurrentUser, SessionDep, get_current_active_superuser
 from app.core.config import settings
+from app.core.responses import list_json_response
 from app.domains.ml.models import MLModelRegistry, MLOfflineRiskPrediction, MLTonerPrediction
-from app.domains.ml.schemas import MLModelsStatusPublic, MLOfflineRiskPredictionsPublic, MLTonerPredictionsPublic
+from app.domains.ml.schemas import (
+    MLModelsStatusPublic,
+    MLOfflineRiskPredictionPublic,
+    MLOfflineRiskPredictionsPublic,
+    MLTonerPredictionPublic,
+    MLTonerPredictionsPublic,
+)
 from app.domains.shared.schemas import Message
 
 router = APIRouter(tags=["ml"])
 
+_TONER_PREDICTION_LIST_ADAPTER = TypeAdapter(list[MLTonerPredictionPublic])
+_OFFLINE_RISK_PREDICTION_LIST_ADAPTER = TypeAdapter(list[MLOfflineRiskPredictionPublic])
+
 
 @router.get("/predictions/toner", response_model=MLTonerPredictionsPublic)
 def read_toner_predictions(
@@ -21,13 +32,14 @@ def read_toner_predictions(
     current_user: CurrentUser,
     printer_id: uuid.UUID | None = Query(default=None),
     limit: int = Query(default=200, ge=1, le=500),
-) -> MLTonerPredictionsPublic:
+) -> Response:
     del current_user
     statement = select(MLTonerPrediction).order_by(MLTonerPrediction.created_at.desc())
     if printer_id is not None:
         statement = statement.where(MLTonerPrediction.printer_id == printer_id)
     rows = session.exec(statement.limit(limit)).all()
-    return MLTonerPredictionsPublic(data=rows, count=len(rows))
+    items = _TONER_PREDICTION_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return list_json_response(_TONER_PREDICTION_LIST_ADAPTER, items, len(items))
 
 
 @router.get("/predictions/offline-risk", response_model=MLOfflineRiskPredictionsPublic)
@@ -36,13 +48,14 @@ def read_offline_risk_predictions(
     current_user: CurrentUser,
     device_kind: str | None = Query(default=None),
     limit: int = Query(default=300, ge=1, le=1000),
-) -> MLOfflineRiskPredictionsPublic:
+) -> Response:
     del current_user
     statement = select(MLOfflineRiskPrediction).order_by(MLOfflineRiskPrediction.created_at.desc())
     if device_kind is not None:
         statement = statement.where(MLOfflineRiskPrediction.device_kind == device_kind)
     rows = session.exec(statement.limit(limit)).all()
-    return MLOfflineRiskPredictionsPublic(data=rows, count=len(rows))
+    items = _OFFLINE_RISK_PREDICTION_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return list_json_response(_OFFLINE_RISK_PREDICTION_LIST_ADAPTER, items, len(items))
 
 
 @router.get("/models/status", response_model=MLModelsStatusPublic)
@@ -2,11 +2,13 @@ import logging
 import uuid
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlmodel import func, select
 
 from app.api.deps import CurrentUser, SessionDep, get_current_active_superuser
 from app.core.config import settings
+from app.core.responses import list_json_body, list_json_response, raw_json_response
 from app.domains.inventory.models import Printer
 from app.domains.inventory.printer_polling import (
     PrinterNotFoundError,
@@ -17,7 +19,7 @@ from app.domains.inventory.printer_polling import (
 )
 from app.domains.inventory.schemas import PrinterCreate, PrinterPublic, PrintersPublic, PrinterUpdate
 from app.domains.shared.schemas import Message
-from app.services.cache import get_cached_model, set_cached_model
+from app.services.cache import get_cached_json, set_cached_json
 from app.services.internal_services import _proxy_request
 from app.services.smart_search import build_ilike_filter
 
@@ -27,6 +29,8 @@ router = APIRouter(tags=["printers"])
 
 CACHE_TTL = 30
 
+_PRINTER_LIST_ADAPTER = TypeAdapter(list[PrinterPublic])
+
 
 @router.get("/", response_model=PrintersPublic)
 async def read_printers(
@@ -36,10 +40,10 @@ async def read_printers(
     limit: int = Query(default=200, le=500),
     store_name: str | None = None,
     printer_type: str = Query(default="laser"),
-) -> PrintersPublic:
+) -> Response:
     cache_key = f"printers:{printer_type}:{store_name or ''}:{skip}:{limit}"
-    if cached := await get_cached_model(cache_key, PrintersPublic):
-        return cached
+    if cached := await get_cached_json(cache_key):
+        return raw_json_response(cached)
 
     statement = select(Printer).where(Printer.printer_type == printer_type)
     count_stmt = select(func.count()).select_from(Printer).where(Printer.printer_type == printer_type)
@@ -59,11 +63,10 @@ async def read_printers(
             count_stmt = count_stmt.where(flt)
     count = session.exec(count_stmt).one()
     printers = session.exec(statement.offset(skip).limit(limit).order_by(Printer.store_name)).all()
-    result = PrintersPublic(data=printers, count=count)
-
-    await set_cached_model(cache_key, result, ttl=CACHE_TTL)
-
-    return result
+    items = [PrinterPublic.from_orm_trusted(printer) for printer in printers]
+    body = list_json_body(_PRINTER_LIST_ADAPTER, items, count)
+    await set_cached_json(cache_key, body, ttl=CACHE_TTL)
+    return raw_json_response(body)
 
 
 @router.post("/", response_model=PrinterPublic, dependencies=[Depends(get_current_active_superuser)])
@@ -142,7 +145,7 @@ async def poll_all_printers(
     session: SessionDep,
     current_user: CurrentUser,
     printer_type: str = Query(default="laser"),
-) -> PrintersPublic:
+) -> Response:
     del current_user
     if settings.POLLING_SERVICE_ENABLED:
         payload = await _proxy_request(
@@ -151,6 +154,7 @@ async def poll_all_printers(
             path="/poll/printers",
             params={"printer_type": printer_type},
         )
-        return PrintersPublic.model_validate(payload)
-
-    return await poll_all_printers_local(session=session, printer_type=printer_type)
+        result = PrintersPublic.model_validate(payload)
+    else:
+        result = await poll_all_printers_local(session=session, printer_type=printer_type)
+    return list_json_response(_PRINTER_LIST_ADAPTER, result.data, result.count)
@@ -18,7 +18,7 @@ from app.domains.inventory.schemas import (
 )
 from app.services.app_settings import get_general_settings
 from app.services.event_log import write_event_log
-from app.services.internal_services import _proxy_request
+from app.services.internal_services import _parse_proxy_payload, _proxy_request, _proxy_request_bytes
 from app.services.scanner import get_scan_progress, get_scan_results, scan_subnet, smart_probe_network
 from app.services.smart_search import text_matches_query
 
@@ -140,15 +140,15 @@ async def scan_status(current_user: CurrentUser) -> dict:
 
 
 @router.get("/results", response_model=ScanResults)
-async def scan_results(current_user: CurrentUser) -> dict:
+async def scan_results(current_user: CurrentUser) -> ScanResults | dict:
     """Get results of the last scan."""
     if settings.DISCOVERY_SERVICE_ENABLED:
-        payload = await _proxy_request(
+        payload = await _proxy_request_bytes(
             base_url=settings.DISCOVERY_SERVICE_URL,
             method="GET",
             path="/discover/printers/results",
         )
-        return ScanResults.model_validate(payload).model_dump()
+        return _parse_proxy_payload(ScanResults.from_json_bytes, payload)
     progress = await get_scan_progress()
     devices = await get_scan_results()
     return {"progress": progress, "devices": devices}
@@ -5,12 +5,14 @@ import uuid
 from datetime import UTC, datetime
 from time import monotonic
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlmodel import func, select
 
 from app.api.deps import CurrentUser, SessionDep, get_current_active_superuser
 from app.core.config import settings
 from app.core.redis import get_redis
+from app.core.responses import list_json_body, raw_json_response
 from app.domains.inventory.models import NetworkSwitch
 from app.domains.inventory.schemas import (
     AccessPointInfo,
@@ -41,11 +43,11 @@ from app.observability.metrics import (
     switch_port_op_duration_seconds,
     switch_port_ops_total,
 )
-from app.services.cache import get_cached_model, invalidate_entity_cache, set_cached_model
+from app.services.cache import get_cached_json, invalidate_entity_cache, set_cached_json
 from app.services.cisco_ssh import get_access_points, poe_cycle_ap, reboot_ap
 from app.services.discovery import get_discovery_progress, get_discovery_results, run_discovery_scan
 from app.services.event_log import write_event_log
-from app.services.internal_services import _proxy_request
+from app.services.internal_services import _parse_proxy_payload, _proxy_request, _proxy_request_bytes
 from app.services.smart_search import build_ilike_filter, text_matches_query
 from app.services.switches import resolve_switch_provider
 
@@ -150,6 +152,8 @@ async def _run_switch_discovery(subnet: str, ports: str, known_switches: list[di
 
 CACHE_TTL = 30
 
+_SWITCH_LIST_ADAPTER = TypeAdapter(list[NetworkSwitchPublic])
+
 
 async def _invalidate_cache() -> None:
     await invalidate_entity_cache("switches")
@@ -162,10 +166,10 @@ async def read_switches(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, le=200),
     name: str | None = None,
-) -> NetworkSwitchesPublic:
+) -> Response:
     cache_key = f"switches:{name or ''}:{skip}:{limit}"
-    if cached := await get_cached_model(cache_key, NetworkSwitchesPublic):
-        return cached
+    if cached := await get_cached_json(cache_key):
+        return raw_json_response(cached)
 
     statement = select(NetworkSwitch)
     count_stmt = select(func.count()).select_from(NetworkSwitch)
@@ -191,11 +195,10 @@ async def read_switches(
         total=len(switches),
         online=sum(1 for s in switches if s.is_online),
     )
-    result = NetworkSwitchesPublic(data=switches, count=count)
-
-    await set_cached_model(cache_key, result, ttl=CACHE_TTL)
-
-    return result
+    items = _SWITCH_LIST_ADAPTER.validate_python(switches, from_attributes=True)
+    body = list_json_body(_SWITCH_LIST_ADAPTER, items, count)
+    await set_cached_json(cache_key, body, ttl=CACHE_TTL)
+    return raw_json_response(body)
 
 
 @router.post("/", response_model=NetworkSwitchPublic, dependencies=[Depends(get_current_active_superuser)])
@@ -243,15 +246,15 @@ async def discover_switch_status(current_user: CurrentUser) -> dict:
 
 
 @router.get("/discover/results", response_model=DiscoveryResults)
-async def discover_switch_results(current_user: CurrentUser) -> dict:
+async def discover_switch_results(current_user: CurrentUser) -> DiscoveryResults | dict:
     del current_user
     if settings.DISCOVERY_SERVICE_ENABLED:
-        payload = await _proxy_request(
+        payload = await _proxy_request_bytes(
             base_url=settings.DISCOVERY_SERVICE_URL,
             method="GET",
             path="/discover/switch/results",
         )
-        return DiscoveryResults.model_validate(payload).model_dump()
+        return _parse_proxy_payload(DiscoveryResults.from_json_bytes, payload)
     progress = await get_discovery_progress("switch")
     devices = await get_discovery_results("switch")
     return {"progress": progress, "devices": devices}
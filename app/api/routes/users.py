@@ -1,16 +1,20 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlmodel import func, select
 
 from app import crud
 from app.api.deps import CurrentUser, SessionDep, get_current_active_superuser
+from app.core.responses import list_json_response
 from app.domains.identity.models import User
 from app.domains.identity.schemas import UpdatePassword, UserCreate, UserPublic, UsersPublic, UserUpdate, UserUpdateMe
 from app.domains.shared.schemas import Message
 
 router = APIRouter(tags=["users"])
 
+_USER_LIST_ADAPTER = TypeAdapter(list[UserPublic])
+
 
 @router.get(
     "/",
@@ -21,12 +25,13 @@ def read_users(
     session: SessionDep,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, le=100),
-) -> UsersPublic:
+) -> Response:
     count_statement = select(func.count()).select_from(User)
     count = session.exec(count_statement).one()
     statement = select(User).offset(skip).limit(limit).order_by(User.created_at.desc())
     users = session.exec(statement).all()
-    return UsersPublic(data=users, count=count)
+    items = [UserPublic.from_orm_trusted(user) for user in users]
+    return list_json_response(_USER_LIST_ADAPTER, items, count)
 
 
 @router.post(
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core's Rust encoder instead of stdlib `json`."""
+
+    def render(self, content: Any) -> bytes:
+        # stdlib `json` refused NaN/Infinity; emit null rather than literals no JSON parser accepts.
+        return to_json(content, inf_nan_mode="null")
+
+
+def list_json_body(adapter: TypeAdapter[list[Any]], items: Sequence[Any], count: int) -> bytes:
+    """Encode a `{"data": [...], "count": n}` envelope without building the wrapper model."""
+    return b'{"data":' + adapter.dump_json(items) + b',"count":%d}' % count
+
+
+def raw_json_response(body: bytes | str) -> Response:
+    """Send an already-encoded JSON body, bypassing FastAPI's response validation."""
+    return Response(content=body, media_type="application/json")
+
+
+def list_json_response(adapter: TypeAdapter[list[Any]], items: Sequence[Any], count: int) -> Response:
+    """Render a list envelope; `items` must already be instances of the adapter's item model."""
+    return raw_json_response(list_json_body(adapter, items, count))
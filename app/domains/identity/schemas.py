@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
+from pydantic import BaseModel, EmailStr, field_validator
+
+from app.domains.shared.schemas import _DEFERRED_CONFIG, _PUBLIC_CONFIG, _construct_trusted
 
 
 class Token(BaseModel):
@@ -12,6 +15,8 @@ class Token(BaseModel):
 
 
 class TokenPayload(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     sub: str | None = None
     jti: str | None = None
     type: str | None = None
@@ -40,6 +45,8 @@ class UserCreate(BaseModel):
 
 
 class UserUpdate(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     email: EmailStr | None = None
     password: str | None = None
     full_name: str | None = None
@@ -48,11 +55,15 @@ class UserUpdate(BaseModel):
 
 
 class UserUpdateMe(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     full_name: str | None = None
     email: EmailStr | None = None
 
 
 class UpdatePassword(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     current_password: str
     new_password: str
 
@@ -63,16 +74,21 @@ class UpdatePassword(BaseModel):
 
 
 class UserPublic(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _PUBLIC_CONFIG
 
     id: uuid.UUID
-    email: EmailStr
+    email: str
     full_name: str | None = None
     is_active: bool = True
     is_superuser: bool = False
     last_seen_at: datetime | None = None
     created_at: datetime
 
+    @classmethod
+    def from_orm_trusted(cls, row: Any) -> UserPublic:
+        """Build from a database row without re-running field validation."""
+        return _construct_trusted(cls, row)
+
 
 class UsersPublic(BaseModel):
     data: list[UserPublic]
@@ -209,13 +209,13 @@ async def poll_all_printers_local(*, session: Session, printer_type: str = "lase
     )
     if not lock_acquired:
         logger.info("Skipping duplicate poll-all request for printers (%s): lock busy", printer_type)
-        return PrintersPublic(data=all_printers, count=len(all_printers))
+        return PrintersPublic.from_rows(all_printers, len(all_printers))
     if not all_printers:
-        return PrintersPublic(data=[], count=0)
+        return PrintersPublic.from_rows([], 0)
 
     printers = [printer for printer in all_printers if printer.connection_type != "usb" and printer.ip_address]
     if not printers:
-        return PrintersPublic(data=all_printers, count=len(all_printers))
+        return PrintersPublic.from_rows(all_printers, len(all_printers))
 
     poll_targets: list[Printer] = []
     for printer in printers:
@@ -298,7 +298,7 @@ async def poll_all_printers_local(*, session: Session, printer_type: str = "lase
         )
 
         await invalidate_printer_cache()
-        return PrintersPublic(data=result_printers, count=len(result_printers))
+        return PrintersPublic.from_rows(result_printers, len(result_printers))
     finally:
         if lock_acquired:
             try:
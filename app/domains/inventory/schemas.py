@@ -1,97 +1,42 @@
 from __future__ import annotations
 
+import ipaddress
 import re
 import uuid
+from collections.abc import Iterable
 from datetime import datetime
-
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator
-
-from app.domains.shared.schemas import _IP_PATTERN, validate_ip_address
-
-
-def _validate_ip(v: str) -> str:
-    return validate_ip_address(v)
+from typing import Annotated, Any, Literal
+
+from pydantic import AfterValidator, BaseModel, Field, StringConstraints, field_validator, model_validator
+from pydantic.dataclasses import dataclass
+
+from app.domains.shared.schemas import (
+    _DEFERRED_CONFIG,
+    _IP_RE,
+    _PUBLIC_CONFIG,
+    IpAddressStr,
+    NormalizedChoice,
+    NullableLongText,
+    NullableShortText,
+    NullableTonerName,
+    OptionalShortText,
+    ShortText,
+    _construct_trusted,
+)
 
 
 class PrinterCreate(BaseModel):
-    printer_type: str = "laser"
-    connection_type: str = "ip"
-    store_name: str
-    model: str
-    ip_address: str | None = None
-    snmp_community: str = "public"
-    host_pc: str | None = None
-    toner_black_name: str | None = None
-    toner_cyan_name: str | None = None
-    toner_magenta_name: str | None = None
-    toner_yellow_name: str | None = None
-
-    @field_validator("store_name")
-    @classmethod
-    def validate_store_name(cls, v: str) -> str:
-        v = v.strip()
-        if not v or len(v) > 255:
-            raise ValueError("store_name must be 1-255 characters")
-        return v
-
-    @field_validator("model")
-    @classmethod
-    def validate_model(cls, v: str) -> str:
-        v = v.strip()
-        if not v or len(v) > 255:
-            raise ValueError("model must be 1-255 characters")
-        return v
-
-    @field_validator("snmp_community")
-    @classmethod
-    def validate_community(cls, v: str) -> str:
-        if len(v) > 255:
-            raise ValueError("snmp_community must be <= 255 characters")
-        return v
-
-    @field_validator("ip_address")
-    @classmethod
-    def validate_ip(cls, v: str | None) -> str | None:
-        if v is not None:
-            return _validate_ip(v)
-        return v
-
-    @field_validator("printer_type")
-    @classmethod
-    def validate_type(cls, v: str) -> str:
-        if v not in ("laser", "label"):
-            raise ValueError("printer_type must be 'laser' or 'label'")
-        return v
-
-    @field_validator("connection_type")
-    @classmethod
-    def validate_connection_type(cls, v: str) -> str:
-        if v not in ("ip", "usb"):
-            raise ValueError("connection_type must be 'ip' or 'usb'")
-        return v
-
-    @field_validator("host_pc")
-    @classmethod
-    def validate_host_pc(cls, v: str | None) -> str | None:
-        if v is not None:
-            v = v.strip()
-            if len(v) > 255:
-                raise ValueError("host_pc must be <= 255 characters")
-            if not v:
-                return None
-        return v
-
-    @field_validator("toner_black_name", "toner_cyan_name", "toner_magenta_name", "toner_yellow_name")
-    @classmethod
-    def validate_toner_names(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip()
-        if not value:
-            return None
-        if len(value) > 128:
-            raise ValueError("toner name must be <= 128 characters")
-        return value
+    printer_type: Literal["laser", "label"] = "laser"
+    connection_type: Literal["ip", "usb"] = "ip"
+    store_name: ShortText
+    model: ShortText
+    ip_address: IpAddressStr | None = None
+    snmp_community: Annotated[str, StringConstraints(max_length=255)] = "public"
+    host_pc: NullableShortText = None
+    toner_black_name: NullableTonerName = None
+    toner_cyan_name: NullableTonerName = None
+    toner_magenta_name: NullableTonerName = None
+    toner_yellow_name: NullableTonerName = None
 
     @model_validator(mode="after")
     def check_ip_required_for_ip_type(self) -> PrinterCreate:
@@ -101,67 +46,21 @@ class PrinterCreate(BaseModel):
 
 
 class PrinterUpdate(BaseModel):
-    store_name: str | None = None
-    model: str | None = None
-    ip_address: str | None = None
-    snmp_community: str | None = None
-    host_pc: str | None = None
-    toner_black_name: str | None = None
-    toner_cyan_name: str | None = None
-    toner_magenta_name: str | None = None
-    toner_yellow_name: str | None = None
-
-    @field_validator("store_name")
-    @classmethod
-    def validate_store_name(cls, v: str | None) -> str | None:
-        if v is not None:
-            v = v.strip()
-            if not v or len(v) > 255:
-                raise ValueError("store_name must be 1-255 characters")
-        return v
+    model_config = _DEFERRED_CONFIG
 
-    @field_validator("model")
-    @classmethod
-    def validate_model(cls, v: str | None) -> str | None:
-        if v is not None:
-            v = v.strip()
-            if not v or len(v) > 255:
-                raise ValueError("model must be 1-255 characters")
-        return v
-
-    @field_validator("ip_address")
-    @classmethod
-    def validate_ip(cls, v: str | None) -> str | None:
-        if v is not None:
-            return _validate_ip(v)
-        return v
-
-    @field_validator("host_pc")
-    @classmethod
-    def validate_host_pc(cls, v: str | None) -> str | None:
-        if v is not None:
-            v = v.strip()
-            if len(v) > 255:
-                raise ValueError("host_pc must be <= 255 characters")
-            if not v:
-                return None
-        return v
-
-    @field_validator("toner_black_name", "toner_cyan_name", "toner_magenta_name", "toner_yellow_name")
-    @classmethod
-    def validate_toner_names(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip()
-        if not value:
-            return None
-        if len(value) > 128:
-            raise ValueError("toner name must be <= 128 characters")
-        return value
+    store_name: ShortText | None = None
+    model: ShortText | None = None
+    ip_address: IpAddressStr | None = None
+    snmp_community: str | None = None
+    host_pc: NullableShortText = None
+    toner_black_name: NullableTonerName = None
+    toner_cyan_name: NullableTonerName = None
+    toner_magenta_name: NullableTonerName = None
+    toner_yellow_name: NullableTonerName = None
 
 
 class PrinterPublic(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _PUBLIC_CONFIG
 
     id: uuid.UUID
     printer_type: str = "laser"
@@ -185,13 +84,25 @@ class PrinterPublic(BaseModel):
     last_polled_at: datetime | None = None
     created_at: datetime
 
+    @classmethod
+    def from_orm_trusted(cls, row: Any) -> PrinterPublic:
+        """Build from a database row without re-running field validation."""
+        return _construct_trusted(cls, row)
+
 
 class PrintersPublic(BaseModel):
     data: list[PrinterPublic]
     count: int
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any], count: int) -> PrintersPublic:
+        """Build the list response from trusted ORM rows via `model_construct`."""
+        return cls.model_construct(data=[PrinterPublic.from_orm_trusted(row) for row in rows], count=count)
+
 
 class PrinterStatusResponse(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     is_online: bool
     status: str
     toner_black: int | None = None
@@ -203,6 +114,8 @@ class PrinterStatusResponse(BaseModel):
 
 # ── Scanner schemas ──────────────────────────────────────────────
 
+_PORT_RE = re.compile(r"[0-9]+")
+
 
 class ScanRequest(BaseModel):
     subnet: str
@@ -211,8 +124,6 @@ class ScanRequest(BaseModel):
     @field_validator("subnet")
     @classmethod
     def validate_subnet(cls, v: str) -> str:
-        import ipaddress
-
         parts = [p.strip() for p in v.split(",") if p.strip()]
         if not parts:
             raise ValueError("At least one subnet is required")
@@ -221,12 +132,10 @@ class ScanRequest(BaseModel):
         for part in parts:
             try:
                 net = ipaddress.ip_network(part, strict=False)
-                if net.prefixlen < 16:
-                    raise ValueError(f"Subnet {part} too large (min /16)")
-            except ValueError as e:
-                if "too large" in str(e):
-                    raise
-                raise ValueError(f"Invalid subnet: {part} (expected CIDR, e.g. 10.10.98.0/24)")
+            except ValueError:
+                raise ValueError(f"Invalid subnet: {part} (expected CIDR, e.g. 10.10.98.0/24)") from None
+            if net.prefixlen < 16:
+                raise ValueError(f"Subnet {part} too large (min /16)")
         return v
 
     @field_validator("ports")
@@ -238,21 +147,19 @@ class ScanRequest(BaseModel):
         if len(parts) > 20:
             raise ValueError("Maximum 20 ports allowed")
         for part in parts:
-            try:
-                port = int(part)
-                if port < 1 or port > 65535:
-                    raise ValueError(f"Port {port} out of range (1-65535)")
-            except ValueError as e:
-                if "out of range" in str(e):
-                    raise
+            if not _PORT_RE.fullmatch(part):
                 raise ValueError(f"Invalid port: {part} (must be integer)")
+            port = int(part)
+            if port < 1 or port > 65535:
+                raise ValueError(f"Port {port} out of range (1-65535)")
         return v
 
 
-class DiscoveredDevice(BaseModel):
+@dataclass(slots=True)
+class DiscoveredDevice:
     ip: str
     mac: str | None = None
-    open_ports: list[int] = []
+    open_ports: list[int] = Field(default_factory=list)
     hostname: str | None = None
     is_known: bool = False
     known_printer_id: str | None = None
@@ -267,11 +174,19 @@ class ScanProgress(BaseModel):
     found: int = 0
     message: str | None = None
 
+    @classmethod
+    def from_json_bytes(cls, data: bytes | str) -> ScanProgress:
+        return cls.model_validate_json(data)
+
 
 class ScanResults(BaseModel):
     progress: ScanProgress
     devices: list[DiscoveredDevice] = []
 
+    @classmethod
+    def from_json_bytes(cls, data: bytes | str) -> ScanResults:
+        return cls.model_validate_json(data)
+
 
 class SmartNetworkSearchRequest(BaseModel):
     subnet: str | None = None
@@ -329,61 +244,19 @@ class SmartNetworkSearchPublic(BaseModel):
 
 
 class ComputerCreate(BaseModel):
-    hostname: str
-    location: str | None = None
-    comment: str | None = None
-
-    @field_validator("hostname")
-    @classmethod
-    def validate_hostname(cls, v: str) -> str:
-        value = v.strip()
-        if not value or len(value) > 255:
-            raise ValueError("hostname must be 1-255 characters")
-        return value
-
-    @field_validator("location", "comment")
-    @classmethod
-    def normalize_optional_text(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip()
-        if not value:
-            return None
-        if len(value) > 1024:
-            raise ValueError("Field is too long")
-        return value
+    hostname: ShortText
+    location: NullableLongText = None
+    comment: NullableLongText = None
 
 
 class ComputerUpdate(BaseModel):
-    hostname: str | None = None
-    location: str | None = None
-    comment: str | None = None
-
-    @field_validator("hostname")
-    @classmethod
-    def validate_hostname(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip()
-        if not value or len(value) > 255:
-            raise ValueError("hostname must be 1-255 characters")
-        return value
-
-    @field_validator("location", "comment")
-    @classmethod
-    def normalize_optional_text(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip()
-        if not value:
-            return None
-        if len(value) > 1024:
-            raise ValueError("Field is too long")
-        return value
+    hostname: ShortText | None = None
+    location: NullableLongText = None
+    comment: NullableLongText = None
 
 
 class ComputerPublic(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _PUBLIC_CONFIG
 
     id: uuid.UUID
     hostname: str
@@ -403,10 +276,11 @@ class ComputersPublic(BaseModel):
 # ── Generic network discovery schemas ────────────────────────────
 
 
-class DiscoveredNetworkDevice(BaseModel):
+@dataclass(slots=True)
+class DiscoveredNetworkDevice:
     ip: str
     mac: str | None = None
-    open_ports: list[int] = []
+    open_ports: list[int] = Field(default_factory=list)
     hostname: str | None = None
     model_info: str | None = None
     vendor: str | None = None
@@ -421,36 +295,31 @@ class DiscoveryResults(BaseModel):
     progress: ScanProgress
     devices: list[DiscoveredNetworkDevice] = []
 
+    @classmethod
+    def from_json_bytes(cls, data: bytes | str) -> DiscoveryResults:
+        return cls.model_validate_json(data)
+
 
 # ── NetworkSwitch schemas ───────────────────────────────────────
 
+SwitchVendor = Annotated[Literal["cisco", "dlink", "generic"], NormalizedChoice]
+ManagementProtocol = Annotated[Literal["snmp", "ssh", "snmp+ssh"], NormalizedChoice]
+SnmpVersion = Annotated[Literal["2c"], NormalizedChoice]
+
 
 class NetworkSwitchCreate(BaseModel):
-    name: str
-    ip_address: str
+    name: ShortText
+    ip_address: IpAddressStr
     ssh_username: str = "admin"
     ssh_password: str = ""
     enable_password: str = ""
     ssh_port: int = 22
     ap_vlan: int = 20
-    vendor: str = "cisco"
-    management_protocol: str = "snmp+ssh"
-    snmp_version: str = "2c"
-    snmp_community_ro: str = "public"
-    snmp_community_rw: str | None = None
-
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        v = v.strip()
-        if not v or len(v) > 255:
-            raise ValueError("name must be 1-255 characters")
-        return v
-
-    @field_validator("ip_address")
-    @classmethod
-    def validate_ip(cls, v: str) -> str:
-        return _validate_ip(v)
+    vendor: SwitchVendor = "cisco"
+    management_protocol: ManagementProtocol = "snmp+ssh"
+    snmp_version: SnmpVersion = "2c"
+    snmp_community_ro: ShortText = "public"
+    snmp_community_rw: NullableShortText = None
 
     @field_validator("ssh_port")
     @classmethod
@@ -466,126 +335,24 @@ class NetworkSwitchCreate(BaseModel):
             raise ValueError("ap_vlan must be 1-4094")
         return v
 
-    @field_validator("vendor")
-    @classmethod
-    def validate_vendor(cls, v: str) -> str:
-        normalized = v.strip().lower()
-        allowed = {"cisco", "dlink", "generic"}
-        if normalized not in allowed:
-            raise ValueError("vendor must be one of: cisco, dlink, generic")
-        return normalized
-
-    @field_validator("management_protocol")
-    @classmethod
-    def validate_protocol(cls, v: str) -> str:
-        normalized = v.strip().lower()
-        allowed = {"snmp", "ssh", "snmp+ssh"}
-        if normalized not in allowed:
-            raise ValueError("management_protocol must be one of: snmp, ssh, snmp+ssh")
-        return normalized
-
-    @field_validator("snmp_version")
-    @classmethod
-    def validate_snmp_version(cls, v: str) -> str:
-        normalized = v.strip().lower()
-        if normalized not in {"2c"}:
-            raise ValueError("snmp_version currently supports only '2c'")
-        return normalized
-
-    @field_validator("snmp_community_ro")
-    @classmethod
-    def validate_snmp_ro(cls, v: str) -> str:
-        value = v.strip()
-        if not value or len(value) > 255:
-            raise ValueError("snmp_community_ro must be 1-255 characters")
-        return value
-
-    @field_validator("snmp_community_rw")
-    @classmethod
-    def validate_snmp_rw(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip()
-        if len(value) > 255:
-            raise ValueError("snmp_community_rw must be <= 255 characters")
-        return value or None
-
 
 class NetworkSwitchUpdate(BaseModel):
-    name: str | None = None
-    ip_address: str | None = None
+    name: ShortText | None = None
+    ip_address: IpAddressStr | None = None
     ssh_username: str | None = None
     ssh_password: str | None = None
     enable_password: str | None = None
     ssh_port: int | None = None
     ap_vlan: int | None = None
-    vendor: str | None = None
-    management_protocol: str | None = None
-    snmp_version: str | None = None
-    snmp_community_ro: str | None = None
-    snmp_community_rw: str | None = None
-
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str | None) -> str | None:
-        if v is not None:
-            v = v.strip()
-            if not v or len(v) > 255:
-                raise ValueError("name must be 1-255 characters")
-        return v
-
-    @field_validator("ip_address")
-    @classmethod
-    def validate_ip(cls, v: str | None) -> str | None:
-        if v is not None:
-            return _validate_ip(v)
-        return v
-
-    @field_validator("vendor")
-    @classmethod
-    def validate_vendor(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        normalized = v.strip().lower()
-        allowed = {"cisco", "dlink", "generic"}
-        if normalized not in allowed:
-            raise ValueError("vendor must be one of: cisco, dlink, generic")
-        return normalized
-
-    @field_validator("management_protocol")
-    @classmethod
-    def validate_protocol(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        normalized = v.strip().lower()
-        allowed = {"snmp", "ssh", "snmp+ssh"}
-        if normalized not in allowed:
-            raise ValueError("management_protocol must be one of: snmp, ssh, snmp+ssh")
-        return normalized
-
-    @field_validator("snmp_version")
-    @classmethod
-    def validate_snmp_version(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        normalized = v.strip().lower()
-        if normalized not in {"2c"}:
-            raise ValueError("snmp_version currently supports only '2c'")
-        return normalized
-
-    @field_validator("snmp_community_ro", "snmp_community_rw")
-    @classmethod
-    def validate_communities(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip()
-        if len(value) > 255:
-            raise ValueError("SNMP community must be <= 255 characters")
-        return value or None
+    vendor: SwitchVendor | None = None
+    management_protocol: ManagementProtocol | None = None
+    snmp_version: SnmpVersion | None = None
+    snmp_community_ro: NullableShortText = None
+    snmp_community_rw: NullableShortText = None
 
 
 class NetworkSwitchPublic(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _PUBLIC_CONFIG
 
     id: uuid.UUID
     name: str
@@ -610,7 +377,8 @@ class NetworkSwitchesPublic(BaseModel):
     count: int
 
 
-class AccessPointInfo(BaseModel):
+@dataclass(slots=True)
+class AccessPointInfo:
     mac_address: str
     port: str
     vlan: int
@@ -621,7 +389,8 @@ class AccessPointInfo(BaseModel):
     poe_status: str | None = None
 
 
-class SwitchPortInfo(BaseModel):
+@dataclass(slots=True)
+class SwitchPortInfo:
     port: str
     if_index: int
     description: str | None = None
@@ -650,15 +419,7 @@ class SwitchPortsPublic(BaseModel):
 
 
 class SwitchPortAdminStateUpdate(BaseModel):
-    admin_state: str
-
-    @field_validator("admin_state")
-    @classmethod
-    def validate_admin_state(cls, v: str) -> str:
-        normalized = v.strip().lower()
-        if normalized not in {"up", "down"}:
-            raise ValueError("admin_state must be 'up' or 'down'")
-        return normalized
+    admin_state: Annotated[Literal["up", "down"], NormalizedChoice]
 
 
 class SwitchPortDescriptionUpdate(BaseModel):
@@ -685,31 +446,18 @@ class SwitchPortVlanUpdate(BaseModel):
 
 
 class SwitchPortPoeUpdate(BaseModel):
-    action: str
+    action: Annotated[Literal["on", "off", "cycle"], NormalizedChoice]
 
-    @field_validator("action")
-    @classmethod
-    def validate_action(cls, v: str) -> str:
-        normalized = v.strip().lower()
-        if normalized not in {"on", "off", "cycle"}:
-            raise ValueError("action must be one of: on, off, cycle")
-        return normalized
+
+_ALLOWED_VLANS_RE = re.compile(r"^[0-9,\-\s]+$")
 
 
 class SwitchPortModeUpdate(BaseModel):
-    mode: str
+    mode: Annotated[Literal["access", "trunk"], NormalizedChoice]
     access_vlan: int | None = None
     native_vlan: int | None = None
     allowed_vlans: str | None = None
 
-    @field_validator("mode")
-    @classmethod
-    def validate_mode(cls, v: str) -> str:
-        normalized = v.strip().lower()
-        if normalized not in {"access", "trunk"}:
-            raise ValueError("mode must be one of: access, trunk")
-        return normalized
-
     @field_validator("access_vlan", "native_vlan")
     @classmethod
     def validate_vlan_fields(cls, v: int | None) -> int | None:
@@ -729,7 +477,7 @@ class SwitchPortModeUpdate(BaseModel):
             return None
         if len(value) > 255:
             raise ValueError("allowed_vlans must be <= 255 characters")
-        if not re.match(r"^[0-9,\-\s]+$", value):
+        if not _ALLOWED_VLANS_RE.match(value):
             raise ValueError("allowed_vlans supports digits, commas, spaces and hyphens only")
         return value
 
@@ -737,130 +485,64 @@ class SwitchPortModeUpdate(BaseModel):
 # ── MediaPlayer schemas ─────────────────────────────────────────
 
 
-_HOSTNAME_PATTERN = r"^[a-zA-Z0-9]([a-zA-Z0-9\-\.]{0,253}[a-zA-Z0-9])?$"
+# Length (<= 255) is enforced before matching, so the pattern needs no bounded quantifier.
+_HOSTNAME_RE = re.compile(r"[a-zA-Z0-9](?:[a-zA-Z0-9.-]*[a-zA-Z0-9])?")
 
 
 def _validate_ip_or_hostname(v: str) -> str:
     v = v.strip()
     if not v or len(v) > 255:
         raise ValueError("Address must be 1-255 characters")
-    if re.match(_IP_PATTERN, v):
-        parts = v.split(".")
-        if any(int(p) > 255 for p in parts):
-            raise ValueError("IP address octets must be 0-255")
+    try:
+        ipaddress.IPv4Address(v)
         return v
-    if re.match(_HOSTNAME_PATTERN, v):
+    except ValueError:
+        if _IP_RE.match(v):
+            raise ValueError("IP address octets must be 0-255") from None
+    if _HOSTNAME_RE.fullmatch(v):
         return v
     raise ValueError("Must be a valid IP address or hostname")
 
 
-class MediaPlayerCreate(BaseModel):
-    device_type: str
-    name: str
-    model: str = ""
-    ip_address: str
-    hostname: str | None = None
-    mac_address: str | None = None
+def _validate_optional_hostname(v: str | None) -> str | None:
+    if not v:
+        return None
+    if not _HOSTNAME_RE.fullmatch(v):
+        raise ValueError("hostname format is invalid")
+    return v
 
-    @field_validator("device_type")
-    @classmethod
-    def validate_device_type(cls, v: str) -> str:
-        if v not in ("nettop", "iconbit", "twix"):
-            raise ValueError("device_type must be 'nettop', 'iconbit', or 'twix'")
-        return v
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        v = v.strip()
-        if not v or len(v) > 255:
-            raise ValueError("name must be 1-255 characters")
-        return v
+IpOrHostname = Annotated[str, AfterValidator(_validate_ip_or_hostname)]
+MediaHostname = Annotated[OptionalShortText | None, AfterValidator(_validate_optional_hostname)]
 
-    @field_validator("model")
-    @classmethod
-    def validate_model(cls, v: str) -> str:
-        v = v.strip()
-        if len(v) > 255:
-            raise ValueError("model must be <= 255 characters")
-        return v
+_MEDIA_DEFAULT_MODELS: dict[str, str] = {"nettop": "Неттоп", "iconbit": "Iconbit", "twix": "Twix"}
 
-    @field_validator("ip_address")
-    @classmethod
-    def validate_ip(cls, v: str) -> str:
-        return _validate_ip_or_hostname(v)
 
-    @field_validator("hostname")
-    @classmethod
-    def validate_hostname(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip()
-        if not value:
-            return None
-        if len(value) > 255:
-            raise ValueError("hostname must be <= 255 characters")
-        if not re.match(_HOSTNAME_PATTERN, value):
-            raise ValueError("hostname format is invalid")
-        return value
+class MediaPlayerCreate(BaseModel):
+    device_type: Literal["nettop", "iconbit", "twix"]
+    name: ShortText
+    model: OptionalShortText = ""
+    ip_address: IpOrHostname
+    hostname: MediaHostname = None
+    mac_address: str | None = None
 
     @model_validator(mode="after")
     def set_default_model(self) -> MediaPlayerCreate:
         if not self.model:
-            defaults = {"nettop": "Неттоп", "iconbit": "Iconbit", "twix": "Twix"}
-            self.model = defaults.get(self.device_type, self.device_type)
+            self.model = _MEDIA_DEFAULT_MODELS.get(self.device_type, self.device_type)
         return self
 
 
 class MediaPlayerUpdate(BaseModel):
-    name: str | None = None
-    model: str | None = None
-    ip_address: str | None = None
-    hostname: str | None = None
+    name: ShortText | None = None
+    model: OptionalShortText | None = None
+    ip_address: IpOrHostname | None = None
+    hostname: MediaHostname = None
     mac_address: str | None = None
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str | None) -> str | None:
-        if v is not None:
-            v = v.strip()
-            if not v or len(v) > 255:
-                raise ValueError("name must be 1-255 characters")
-        return v
-
-    @field_validator("model")
-    @classmethod
-    def validate_model(cls, v: str | None) -> str | None:
-        if v is not None:
-            v = v.strip()
-            if len(v) > 255:
-                raise ValueError("model must be <= 255 characters")
-        return v
-
-    @field_validator("ip_address")
-    @classmethod
-    def validate_ip(cls, v: str | None) -> str | None:
-        if v is not None:
-            return _validate_ip_or_hostname(v)
-        return v
-
-    @field_validator("hostname")
-    @classmethod
-    def validate_hostname(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip()
-        if not value:
-            return None
-        if len(value) > 255:
-            raise ValueError("hostname must be <= 255 characters")
-        if not re.match(_HOSTNAME_PATTERN, value):
-            raise ValueError("hostname format is invalid")
-        return value
-
 
 class MediaPlayerPublic(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _PUBLIC_CONFIG
 
     id: uuid.UUID
     device_type: str
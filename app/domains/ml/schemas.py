@@ -3,11 +3,13 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
+
+from app.domains.shared.schemas import _PUBLIC_CONFIG
 
 
 class MLTonerPredictionPublic(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _PUBLIC_CONFIG
 
     id: uuid.UUID
     printer_id: uuid.UUID | None = None
@@ -28,7 +30,7 @@ class MLTonerPredictionsPublic(BaseModel):
 
 
 class MLOfflineRiskPredictionPublic(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _PUBLIC_CONFIG
 
     id: uuid.UUID
     device_kind: str
@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, field_validator
+
+from app.domains.shared.schemas import _PUBLIC_CONFIG, NormalizedChoice, NullableLongText, ShortText
+
+KkmType = Annotated[Literal["retail", "shtrih"], NormalizedChoice]
 
 
 class EventLogPublic(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _PUBLIC_CONFIG
 
     id: uuid.UUID
     severity: str
@@ -26,117 +31,37 @@ class EventLogsPublic(BaseModel):
 
 
 class CashRegisterCreate(BaseModel):
-    kkm_number: str
-    store_number: str | None = None
-    store_code: str | None = None
-    serial_number: str | None = None
-    inventory_number: str | None = None
-    terminal_id_rs: str | None = None
-    terminal_id_sber: str | None = None
-    windows_version: str | None = None
-    kkm_type: str = "retail"
-    cash_number: str | None = None
-    hostname: str
-    comment: str | None = None
-
-    @field_validator("kkm_number", "hostname")
-    @classmethod
-    def validate_required_short_text(cls, v: str) -> str:
-        value = v.strip()
-        if not value or len(value) > 255:
-            raise ValueError("Field must be 1-255 characters")
-        return value
-
-    @field_validator("kkm_type")
-    @classmethod
-    def validate_kkm_type(cls, v: str) -> str:
-        value = v.strip().lower()
-        if value not in {"retail", "shtrih"}:
-            raise ValueError("kkm_type must be 'retail' or 'shtrih'")
-        return value
-
-    @field_validator(
-        "store_number",
-        "store_code",
-        "serial_number",
-        "inventory_number",
-        "terminal_id_rs",
-        "terminal_id_sber",
-        "windows_version",
-        "cash_number",
-        "comment",
-    )
-    @classmethod
-    def normalize_optional_text(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip()
-        if not value:
-            return None
-        if len(value) > 1024:
-            raise ValueError("Field is too long")
-        return value
+    kkm_number: ShortText
+    store_number: NullableLongText = None
+    store_code: NullableLongText = None
+    serial_number: NullableLongText = None
+    inventory_number: NullableLongText = None
+    terminal_id_rs: NullableLongText = None
+    terminal_id_sber: NullableLongText = None
+    windows_version: NullableLongText = None
+    kkm_type: KkmType = "retail"
+    cash_number: NullableLongText = None
+    hostname: ShortText
+    comment: NullableLongText = None
 
 
 class CashRegisterUpdate(BaseModel):
-    kkm_number: str | None = None
-    store_number: str | None = None
-    store_code: str | None = None
-    serial_number: str | None = None
-    inventory_number: str | None = None
-    terminal_id_rs: str | None = None
-    terminal_id_sber: str | None = None
-    windows_version: str | None = None
-    kkm_type: str | None = None
-    cash_number: str | None = None
-    hostname: str | None = None
-    comment: str | None = None
-
-    @field_validator("kkm_number", "hostname")
-    @classmethod
-    def validate_required_short_text(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip()
-        if not value or len(value) > 255:
-            raise ValueError("Field must be 1-255 characters")
-        return value
-
-    @field_validator("kkm_type")
-    @classmethod
-    def validate_kkm_type(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip().lower()
-        if value not in {"retail", "shtrih"}:
-            raise ValueError("kkm_type must be 'retail' or 'shtrih'")
-        return value
-
-    @field_validator(
-        "store_number",
-        "store_code",
-        "serial_number",
-        "inventory_number",
-        "terminal_id_rs",
-        "terminal_id_sber",
-        "windows_version",
-        "cash_number",
-        "comment",
-    )
-    @classmethod
-    def normalize_optional_text(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        value = v.strip()
-        if not value:
-            return None
-        if len(value) > 1024:
-            raise ValueError("Field is too long")
-        return value
+    kkm_number: ShortText | None = None
+    store_number: NullableLongText = None
+    store_code: NullableLongText = None
+    serial_number: NullableLongText = None
+    inventory_number: NullableLongText = None
+    terminal_id_rs: NullableLongText = None
+    terminal_id_sber: NullableLongText = None
+    windows_version: NullableLongText = None
+    kkm_type: KkmType | None = None
+    cash_number: NullableLongText = None
+    hostname: ShortText | None = None
+    comment: NullableLongText = None
 
 
 class CashRegisterPublic(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _PUBLIC_CONFIG
 
     id: uuid.UUID
     kkm_number: str
@@ -1,20 +1,62 @@
 from __future__ import annotations
 
+import ipaddress
 import re
+from typing import Annotated, Any
 
-from pydantic import BaseModel
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, StringConstraints
 
-_IP_PATTERN = r"^(\d{1,3}\.){3}\d{1,3}$"
+_IP_RE = re.compile(r"^(\d{1,3}\.){3}\d{1,3}$")
+
+# Shared by every ORM-backed *Public response model.
+_PUBLIC_CONFIG = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+# Rarely used schemas build their validator on first use; workers that import the schema
+# modules without mounting the API routes never pay for them.
+_DEFERRED_CONFIG = ConfigDict(defer_build=True)
+
+
+def _construct_trusted[ModelT: BaseModel](model: type[ModelT], row: Any) -> ModelT:
+    """Copy ORM attributes into `model` via `model_construct`; only for rows already validated on write."""
+    return model.model_construct(**{name: getattr(row, name) for name in model.model_fields})
+
+
+# Strip/length rules enforced by pydantic-core rather than per-field Python validators.
+ShortText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=255)]
+OptionalShortText = Annotated[str, StringConstraints(strip_whitespace=True, max_length=255)]
+LongText = Annotated[str, StringConstraints(strip_whitespace=True, max_length=1024)]
+TonerName = Annotated[str, StringConstraints(strip_whitespace=True, max_length=128)]
+
+
+def _blank_to_none(value: str | None) -> str | None:
+    return value or None
+
+
+# Optional text fields shared by create/update payloads: stripped, length-checked, "" stored as None.
+NullableShortText = Annotated[OptionalShortText | None, AfterValidator(_blank_to_none)]
+NullableLongText = Annotated[LongText | None, AfterValidator(_blank_to_none)]
+NullableTonerName = Annotated[TonerName | None, AfterValidator(_blank_to_none)]
+
+
+def _normalize_choice(value: object) -> object:
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+# Prefix for case-insensitive `Literal` choices: normalize, then let pydantic-core check membership.
+NormalizedChoice = BeforeValidator(_normalize_choice)
 
 
 def validate_ip_address(value: str) -> str:
-    if not re.match(_IP_PATTERN, value):
-        raise ValueError("Invalid IP address format")
-    parts = value.split(".")
-    if any(int(part) > 255 for part in parts):
-        raise ValueError("IP address octets must be 0-255")
+    try:
+        ipaddress.IPv4Address(value)
+    except ValueError:
+        raise ValueError("Invalid IP address format") from None
     return value
 
 
+# One validator node reused by every schema that accepts a dotted-quad IPv4 address.
+IpAddressStr = Annotated[str, AfterValidator(validate_ip_address)]
+
+
 class Message(BaseModel):
     message: str
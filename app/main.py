@@ -16,6 +16,7 @@ from app.core.db import engine, init_db
 from app.core.limiter import limiter
 from app.core.readiness import build_readiness_response, check_database, check_redis
 from app.core.redis import close_redis, get_redis
+from app.core.responses import FastJSONResponse
 from app.observability.tracing import setup_tracing
 from app.services.event_log import write_event_log
 
@@ -41,6 +42,7 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 setup_tracing(app, service_name="backend")
 
@@ -3,16 +3,18 @@ from __future__ import annotations
 import uuid
 from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Response
 from prometheus_fastapi_instrumentator import Instrumentator
+from pydantic import TypeAdapter
 from sqlmodel import Session, select
 
 from app.core.config import settings
 from app.core.db import engine
 from app.core.readiness import build_readiness_response, check_database, check_redis
 from app.core.redis import close_redis, get_redis
+from app.core.responses import list_json_response
 from app.domains.inventory.models import MediaPlayer, NetworkSwitch, Printer
-from app.domains.inventory.schemas import MediaPlayersPublic, NetworkSwitchPublic, PrintersPublic
+from app.domains.inventory.schemas import MediaPlayersPublic, NetworkSwitchPublic, PrinterPublic, PrintersPublic
 from app.domains.operations.models import CashRegister
 from app.domains.operations.schemas import CashRegisterPublic, CashRegistersPublic
 from app.domains.shared.schemas import Message
@@ -26,6 +28,8 @@ from app.services.polling_orchestrator import (
     poll_switch_local,
 )
 
+_PRINTER_LIST_ADAPTER = TypeAdapter(list[PrinterPublic])
+
 
 def _verify_internal_token(x_internal_token: str | None = Header(default=None)) -> None:
     if not settings.INTERNAL_SERVICE_TOKEN:
@@ -62,9 +66,10 @@ async def ready() -> dict | object:
 
 
 @app.post("/poll/printers", response_model=PrintersPublic, dependencies=[Depends(_verify_internal_token)])
-async def poll_printers(printer_type: str = "laser") -> PrintersPublic:
+async def poll_printers(printer_type: str = "laser") -> Response:
     with Session(engine) as session:
-        return await poll_all_printers_local(session=session, printer_type=printer_type)
+        result = await poll_all_printers_local(session=session, printer_type=printer_type)
+    return list_json_response(_PRINTER_LIST_ADAPTER, result.data, result.count)
 
 
 @app.post("/poll/media-players", response_model=MediaPlayersPublic, dependencies=[Depends(_verify_internal_token)])
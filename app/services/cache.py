@@ -2,28 +2,24 @@ from __future__ import annotations
 
 import logging
 
-from pydantic import BaseModel
-
 from app.core.redis import get_redis
 
 logger = logging.getLogger(__name__)
 
 
-async def get_cached_model[TModel: BaseModel](cache_key: str, model_type: type[TModel]) -> TModel | None:
+async def get_cached_json(cache_key: str) -> str | None:
     try:
         redis = await get_redis()
-        cached = await redis.get(cache_key)
-        if cached:
-            return model_type.model_validate_json(cached)
+        return await redis.get(cache_key)
     except Exception as exc:
         logger.debug("Cache read failed for %s: %s", cache_key, exc)
     return None
 
 
-async def set_cached_model(cache_key: str, value: BaseModel, *, ttl: int) -> None:
+async def set_cached_json(cache_key: str, body: bytes | str, *, ttl: int) -> None:
     try:
         redis = await get_redis()
-        await redis.setex(cache_key, ttl, value.model_dump_json())
+        await redis.setex(cache_key, ttl, body)
     except Exception as exc:
         logger.debug("Cache write failed for %s: %s", cache_key, exc)
 
@@ -8,13 +8,18 @@ Supports:
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
+import select
 import socket
+import threading
 import time
-from collections.abc import Callable
-from contextlib import suppress
-from dataclasses import dataclass
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, replace
+from functools import lru_cache
 
 import paramiko
 
@@ -25,10 +30,30 @@ logger = logging.getLogger(__name__)
 SSH_TIMEOUT = 15
 CMD_TIMEOUT = 30
 RECV_CHUNK = 65535
-RECV_WAIT = 0.5
+SESSION_IDLE_TTL = 60.0
+SWITCH_INFO_CACHE_TTL = 15.0
+ACCESS_POINT_CACHE_TTL = 30.0
+# How long a switch that refused an exec channel is sent straight to the interactive shell.
+EXEC_CHANNEL_RETRY_AFTER = 3600.0
+# Exec channels opened at once next to the shell; IOS caps channels per connection, and any it
+# refuses beyond this are re-run on the shell.
+EXEC_CHANNEL_CONCURRENCY = 2
 
+_PROMPT_RE = re.compile(rb"[#>]\s*$")
+# A prompt at the start of a line, e.g. "sw1#" or "sw1(config-if)#" followed by the echoed command.
+_PROMPT_LINE_RE = re.compile(rb"^\r*[^\s#>]+[#>]", re.MULTILINE)
 
-@dataclass
+# AutoAddPolicy is stateless, so every client shares one instance.
+_AUTO_ADD_POLICY = paramiko.AutoAddPolicy()
+
+
+def _new_client() -> paramiko.SSHClient:
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(_AUTO_ADD_POLICY)
+    return client
+
+
+@dataclass(slots=True)
 class SwitchInfo:
     hostname: str | None = None
     model_info: str | None = None
@@ -37,7 +62,7 @@ class SwitchInfo:
     is_online: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class APInfo:
     mac_address: str
     port: str
@@ -59,7 +84,10 @@ class CiscoSSH:
         self.enable_password = enable_password or password
         self.port = port
         self.client: paramiko.SSHClient | None = None
+        self.transport: paramiko.Transport | None = None
         self.shell: paramiko.Channel | None = None
+        # Whether the last read ended at an exec-mode prompt (not config mode, not cut off by a timeout).
+        self.at_exec_prompt = False
 
     def connect(self) -> bool:
         allowed = self._query_auth_methods()
@@ -106,8 +134,7 @@ class CiscoSSH:
 
     def _connect_password(self) -> bool:
         try:
-            self.client = paramiko.SSHClient()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            self.client = _new_client()
             self.client.connect(
                 self.ip,
                 port=self.port,
@@ -120,7 +147,12 @@ class CiscoSSH:
                 allow_agent=False,
                 disabled_algorithms={"pubkeys": ["rsa-sha2-512", "rsa-sha2-256"]},
             )
-            return self._post_connect()
+            transport = self.client.get_transport()
+            if transport is None:
+                return False
+            transport.set_keepalive(30)
+            self._open_shell(transport)
+            return True
         except Exception as e:
             logger.debug("SSH password connect to %s: %s", self.ip, e)
             self.close()
@@ -140,27 +172,14 @@ class CiscoSSH:
                 return [password] * len(prompt_list)
 
             transport.auth_interactive(self.username, _ki_handler)
-
-            self.client = paramiko.SSHClient()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            self.client._transport = transport
-            self.shell = transport.open_session()
-            self.shell.get_pty()
-            self.shell.invoke_shell()
-            self.shell.settimeout(CMD_TIMEOUT)
-            self._recv_until_prompt()
-
-            self._enter_enable()
-            self._send("terminal length 0")
-            self._recv_until_prompt()
+            self._open_shell(transport)
             return True
         except Exception as e:
             logger.debug("SSH keyboard-interactive to %s: %s", self.ip, e)
             self.close()
-            return False
-        finally:
-            if transport is not None and self.client is None:
+            if transport is not None:
                 transport.close()
+            return False
 
     def _open_transport(self) -> paramiko.Transport:
         """Open SSH transport with explicit socket timeout safeguards."""
@@ -170,15 +189,17 @@ class CiscoSSH:
         transport.start_client(timeout=SSH_TIMEOUT)
         return transport
 
-    def _post_connect(self) -> bool:
-        """Open shell and enter privileged mode after successful transport auth."""
-        self.shell = self.client.invoke_shell()  # type: ignore[union-attr]
+    def _open_shell(self, transport: paramiko.Transport) -> None:
+        """Open the interactive shell on an authenticated transport and enter privileged mode."""
+        self.transport = transport
+        self.shell = transport.open_session(timeout=SSH_TIMEOUT)
+        self.shell.get_pty()
+        self.shell.invoke_shell()
         self.shell.settimeout(CMD_TIMEOUT)
         self._recv_until_prompt()
         self._enter_enable()
         self._send("terminal length 0")
         self._recv_until_prompt()
-        return True
 
     def _enter_enable(self) -> None:
         self._send("enable")
@@ -187,6 +208,19 @@ class CiscoSSH:
             self._send(self.enable_password)
             self._recv_until_prompt()
 
+    def is_alive(self) -> bool:
+        """Whether the interactive shell and its transport can still be used."""
+        if self.shell is None or self.transport is None or self.shell.closed:
+            return False
+        return self.transport.is_active()
+
+    def is_reusable(self) -> bool:
+        """Whether a pooled session can be leased again: alive, at an exec prompt, nothing left unread."""
+        if not self.at_exec_prompt or not self.is_alive():
+            return False
+        # Output arriving after the prompt means a command outran its read; the shell state is unknown.
+        return self.shell is not None and not self.shell.recv_ready()
+
     def close(self) -> None:
         try:
             if self.shell:
@@ -195,6 +229,9 @@ class CiscoSSH:
                     self.shell.send("exit\n")
                 with suppress(Exception):
                     self.shell.close()
+            if self.transport:
+                with suppress(Exception):
+                    self.transport.close()
             if self.client:
                 with suppress(Exception):
                     transport = self.client.get_transport()
@@ -205,32 +242,83 @@ class CiscoSSH:
         except Exception:
             pass
         self.shell = None
+        self.transport = None
         self.client = None
 
     def _send(self, cmd: str) -> None:
         if self.shell:
             self.shell.send(cmd + "\n")
 
-    def _recv_until_prompt(self, timeout: float = CMD_TIMEOUT) -> str:
+    def _recv_until_prompt(self, timeout: float = CMD_TIMEOUT, prompts: int = 1) -> str:
+        """Read until the output ends in a prompt and at least `prompts` prompt lines were seen."""
+        return self._read_until_prompt(timeout, prompts)[0]
+
+    def _read_until_prompt(self, timeout: float, prompts: int) -> tuple[str, bool]:
+        """Output read so far, and whether it reached the prompt before `timeout` or the channel closing."""
+        self.at_exec_prompt = False
         if not self.shell:
-            return ""
-        output = ""
+            return "", False
+        shell = self.shell
+        output = bytearray()
         end_time = time.monotonic() + timeout
-        while time.monotonic() < end_time:
-            time.sleep(RECV_WAIT)
-            if self.shell.recv_ready():
-                chunk = self.shell.recv(RECV_CHUNK).decode("utf-8", errors="replace")
-                output += chunk
-                if re.search(r"[#>]\s*$", output):
+        while (remaining := end_time - time.monotonic()) > 0:
+            readable, _, _ = select.select([shell], [], [], min(remaining, 1.0))
+            if not readable or not shell.recv_ready():
+                if shell.closed or shell.eof_received:
                     break
-            elif output and re.search(r"[#>]\s*$", output):
+                continue
+            start = len(output)
+            data = shell.recv(RECV_CHUNK)
+            if not data:
                 break
-        return output
+            output += data
+            # Drain whatever else is already buffered so the prompt check runs once per wakeup.
+            while shell.recv_ready() and (data := shell.recv(RECV_CHUNK)):
+                output += data
+            # A prompt completed by this read ends inside it; earlier bytes were already checked.
+            if _PROMPT_RE.search(output, start) and (prompts == 1 or len(_PROMPT_LINE_RE.findall(output)) >= prompts):
+                self.at_exec_prompt = b"(config" not in output[output.rfind(b"\n") + 1 :]
+                return output.decode("utf-8", errors="replace"), True
+        return output.decode("utf-8", errors="replace"), False
 
     def execute(self, cmd: str) -> str:
         self._send(cmd)
         return self._recv_until_prompt()
 
+    def execute_batch(self, cmds: list[str], timeout: float = CMD_TIMEOUT) -> str:
+        """Send several commands in one write and read until every one of them has returned a prompt.
+
+        IOS buffers type-ahead, so a config block costs one round trip instead of one per line.
+        """
+        if not self.shell:
+            return ""
+        self.shell.send("".join(f"{cmd}\n" for cmd in cmds))
+        output, reached = self._read_until_prompt(timeout, prompts=len(cmds))
+        if not reached:
+            # The switch may still be applying the block; the caller must not reuse this session.
+            raise TimeoutError(f"{self.ip} did not return a prompt after {cmds[-1]!r}")
+        return output
+
+    def execute_exec(self, cmd: str, timeout: float = CMD_TIMEOUT) -> str:
+        """Run a read-only command on its own exec channel, independent of the interactive shell."""
+        transport = self.transport
+        if transport is None or not transport.is_active():
+            raise paramiko.SSHException("SSH transport is not connected")
+        channel = transport.open_session(timeout=SSH_TIMEOUT)
+        try:
+            channel.settimeout(timeout)
+            channel.exec_command(cmd)
+            chunks: list[bytes] = []
+            while data := channel.recv(RECV_CHUNK):
+                chunks.append(data)
+        finally:
+            channel.close()
+        output = b"".join(chunks).decode("utf-8", errors="replace")
+        # Exec channels skip `enable`, and IOS reports a refused command as "% ..." text rather than an error.
+        if output.lstrip().startswith("% "):
+            raise paramiko.SSHException(f"{cmd!r} rejected on exec channel: {output.strip().splitlines()[0]}")
+        return output
+
     def __enter__(self):
         self.connect()
         return self
@@ -239,43 +327,200 @@ class CiscoSSH:
         self.close()
 
 
+_SessionKey = tuple[str, int, str, str, str]
+
+
+class _SessionPool:
+    """Keeps one idle authenticated session per switch so back-to-back operations skip SSH setup.
+
+    A leased session is exclusive to its caller. It goes back to the pool only when the block
+    exits normally and the shell is back at an exec prompt with nothing unread; any exception
+    closes it, because the shell may be left in config mode or mid-output.
+    """
+
+    def __init__(self, idle_ttl: float = SESSION_IDLE_TTL):
+        self.idle_ttl = idle_ttl
+        self._idle: dict[_SessionKey, tuple[CiscoSSH, float]] = {}
+        self._lock = threading.Lock()
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, (_, last_used) in self._idle.items() if now - last_used > self.idle_ttl]
+            stale = [self._idle.pop(k)[0] for k in expired]
+        for ssh in stale:
+            ssh.close()
+
+    def _take(self, key: _SessionKey) -> CiscoSSH | None:
+        self._evict_expired()
+        with self._lock:
+            entry = self._idle.pop(key, None)
+        if entry is None:
+            return None
+        ssh = entry[0]
+        if ssh.is_reusable():
+            return ssh
+        ssh.close()
+        return None
+
+    def _release(self, key: _SessionKey, ssh: CiscoSSH) -> None:
+        pooled = False
+        if ssh.is_reusable():
+            with self._lock:
+                if key not in self._idle:
+                    self._idle[key] = (ssh, time.monotonic())
+                    pooled = True
+        if not pooled:
+            ssh.close()
+            return
+        # Close the session once it has sat idle for the TTL, even if no further lease comes.
+        reaper = threading.Timer(self.idle_ttl + 1.0, self._evict_expired)
+        reaper.daemon = True
+        reaper.start()
+
+    @contextmanager
+    def lease(
+        self, ip: str, username: str, password: str, enable_password: str = "", port: int = 22
+    ) -> Iterator[CiscoSSH | None]:
+        """Yield a connected session, or None when the switch cannot be reached/authenticated."""
+        key = (ip, port, username, password, enable_password)
+        ssh = self._take(key)
+        if ssh is None:
+            ssh = CiscoSSH(ip, username, password, enable_password, port)
+            if not ssh.connect():
+                yield None
+                return
+        try:
+            yield ssh
+        except BaseException:
+            ssh.close()
+            raise
+        self._release(key, ssh)
+
+
+_SESSION_POOL = _SessionPool()
+
+
+class _TTLCache:
+    """Per-switch result cache; concurrent misses for one key wait for a single fetch.
+
+    Only successful fetches are stored: `fetch` returns None on failure, so the next call retries.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._store: dict[Hashable, tuple[float, object]] = {}
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        # Callers holding or waiting for each key lock; a lock is only dropped once nobody uses it.
+        self._key_users: dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def get_or_set[T](self, key: Hashable, fetch: Callable[[], T | None]) -> T | None:
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+            self._key_users[key] = self._key_users.get(key, 0) + 1
+        try:
+            with key_lock:
+                hit = self._store.get(key)
+                if hit is not None and time.monotonic() - hit[0] < self.ttl:
+                    return hit[1]  # type: ignore[return-value]
+                value = fetch()
+                if value is not None:
+                    with self._lock:
+                        self._store[key] = (time.monotonic(), value)
+        finally:
+            with self._lock:
+                if users := self._key_users[key] - 1:
+                    self._key_users[key] = users
+                else:
+                    del self._key_users[key]
+        self._prune()
+        return value
+
+    def _prune(self) -> None:
+        """Drop expired entries, and the locks of keys with no entry and no caller using them."""
+        now = time.monotonic()
+        with self._lock:
+            for key in [k for k, (stored_at, _) in self._store.items() if now - stored_at >= self.ttl]:
+                del self._store[key]
+            for key in [k for k in self._key_locks if k not in self._store and k not in self._key_users]:
+                del self._key_locks[key]
+
+    def evict_ip(self, ip: str) -> None:
+        """Drop every entry for a switch; keys start with the switch IP."""
+        with self._lock:
+            for key in [k for k in self._store if isinstance(k, tuple) and k[0] == ip]:
+                del self._store[key]
+
+
+def _cache_key(ip: str, port: int, username: str, password: str, enable_password: str) -> tuple[str, int, str, str]:
+    """Cache key for one switch login; the passwords only enter it as a digest."""
+    secret = hashlib.sha256(f"{password}\0{enable_password}".encode()).hexdigest()
+    return ip, port, username, secret
+
+
+_SWITCH_INFO_CACHE = _TTLCache(SWITCH_INFO_CACHE_TTL)
+_ACCESS_POINT_CACHE = _TTLCache(ACCESS_POINT_CACHE_TTL)
+
+
+_VERSION_HOSTNAME_RE = re.compile(r"^(\S+)\s+uptime", re.MULTILINE)
+_VERSION_UPTIME_RE = re.compile(r"uptime is (.+)")
+# Fallbacks are tried in order: an alternation would prefer whichever match starts first in
+# the output rather than the most specific pattern.
+_VERSION_IOS_RES = (
+    re.compile(r"Cisco IOS Software.*?Version\s+(\S+)", re.IGNORECASE),
+    re.compile(r"Version\s+(\S+)"),
+)
+_VERSION_MODEL_RES = (
+    re.compile(r"[Mm]odel\s+[Nn]umber\s*:\s*(\S+)"),
+    re.compile(r"cisco\s+(WS-\S+|C\d+\S*)", re.IGNORECASE),
+    re.compile(r"^[Cc]isco\s+(\S+)\s+\(", re.MULTILINE),
+)
+
+
+def _search_first(patterns: tuple[re.Pattern[str], ...], text: str) -> re.Match[str] | None:
+    for pattern in patterns:
+        if m := pattern.search(text):
+            return m
+    return None
+
+
+def _parse_show_version(info: SwitchInfo, output: str) -> None:
+    """Fill hostname, uptime, IOS version and model from `show version` output."""
+    if m := _VERSION_HOSTNAME_RE.search(output):
+        info.hostname = m.group(1)
+    if m := _VERSION_UPTIME_RE.search(output):
+        info.uptime = m.group(1).strip()
+    if m := _search_first(_VERSION_IOS_RES, output):
+        info.ios_version = m.group(1).rstrip(",")
+    if m := _search_first(_VERSION_MODEL_RES, output):
+        info.model_info = m.group(1)
+
+
 def get_switch_info(ip: str, username: str, password: str, enable_password: str = "", port: int = 22) -> SwitchInfo:
-    info = SwitchInfo()
-    ssh = CiscoSSH(ip, username, password, enable_password, port)
-    if not ssh.connect():
-        switch_ops_total.labels(operation="poll_info", result="error").inc()
-        return info
+    """Return `show version` details, reusing a successful result fetched within SWITCH_INFO_CACHE_TTL."""
+    info = _SWITCH_INFO_CACHE.get_or_set(
+        _cache_key(ip, port, username, password, enable_password),
+        lambda: _fetch_switch_info(ip, username, password, enable_password, port),
+    )
+    return replace(info) if info is not None else SwitchInfo()
+
 
+def _fetch_switch_info(ip: str, username: str, password: str, enable_password: str, port: int) -> SwitchInfo | None:
+    info = SwitchInfo()
     try:
+        with _SESSION_POOL.lease(ip, username, password, enable_password, port) as ssh:
+            if ssh is None:
+                switch_ops_total.labels(operation="poll_info", result="error").inc()
+                return None
+            output = _execute_show(ssh, "show version")
+
         info.is_online = True
-        output = ssh.execute("show version")
-
-        m = re.search(r"^(\S+)\s+uptime", output, re.MULTILINE)
-        if m:
-            info.hostname = m.group(1)
-
-        m = re.search(r"uptime is (.+)", output)
-        if m:
-            info.uptime = m.group(1).strip()
-
-        m = re.search(r"Cisco IOS Software.*?Version\s+(\S+)", output, re.IGNORECASE)
-        if not m:
-            m = re.search(r"Version\s+(\S+)", output)
-        if m:
-            info.ios_version = m.group(1).rstrip(",")
-
-        m = re.search(r"[Mm]odel\s+[Nn]umber\s*:\s*(\S+)", output)
-        if not m:
-            m = re.search(r"cisco\s+(WS-\S+|C\d+\S*)", output, re.IGNORECASE)
-        if not m:
-            m = re.search(r"^[Cc]isco\s+(\S+)\s+\(", output, re.MULTILINE)
-        if m:
-            info.model_info = m.group(1)
+        _parse_show_version(info, output)
     except Exception as e:
         logger.warning("Failed to get switch info from %s: %s", ip, e)
         switch_ops_total.labels(operation="poll_info", result="error").inc()
-    finally:
-        ssh.close()
+        return None
 
     switch_ops_total.labels(operation="poll_info", result="success").inc()
     return info
@@ -284,54 +529,112 @@ def get_switch_info(ip: str, username: str, password: str, enable_password: str
 def get_access_points(
     ip: str, username: str, password: str, enable_password: str = "", port: int = 22, vlan: int = 20
 ) -> list[APInfo]:
-    """Discover access points on the given VLAN using CDP as primary source."""
-    ssh = CiscoSSH(ip, username, password, enable_password, port)
-    if not ssh.connect():
-        switch_ops_total.labels(operation="access_points", result="error").inc()
-        return []
-
+    """Discover access points on the given VLAN, reusing a successful result fetched within ACCESS_POINT_CACHE_TTL."""
+    aps = _ACCESS_POINT_CACHE.get_or_set(
+        (*_cache_key(ip, port, username, password, enable_password), vlan),
+        lambda: _fetch_access_points(ip, username, password, enable_password, port, vlan),
+    )
+    return [replace(ap) for ap in aps] if aps is not None else []
+
+
+def _fetch_access_points(
+    ip: str, username: str, password: str, enable_password: str, port: int, vlan: int
+) -> list[APInfo] | None:
+    """Discover access points on the given VLAN using CDP as primary source; None if the switch failed."""
     try:
-        cdp_output = ssh.execute("show cdp neighbors detail")
-        aps = _parse_cdp_access_points(cdp_output, vlan)
-        logger.info("CDP found %d access points on %s vlan %d", len(aps), ip, vlan)
-
-        if not aps:
-            switch_ops_total.labels(operation="access_points", result="success").inc()
-            return []
+        with _SESSION_POOL.lease(ip, username, password, enable_password, port) as ssh:
+            if ssh is None:
+                switch_ops_total.labels(operation="access_points", result="error").inc()
+                return None
 
-        mac_output = ssh.execute(f"show mac address-table vlan {vlan}")
-        _enrich_mac_from_table(aps, mac_output)
+            cdp_output = _execute_show(ssh, "show cdp neighbors detail")
+            aps = _parse_cdp_access_points(cdp_output, vlan)
+            logger.info("CDP found %d access points on %s vlan %d", len(aps), ip, vlan)
 
-        poe_output = ssh.execute("show power inline")
-        _enrich_poe(aps, poe_output)
+            if not aps:
+                switch_ops_total.labels(operation="access_points", result="success").inc()
+                return []
 
-        arp_output = ssh.execute(f"show ip arp vlan {vlan}")
-        _enrich_arp(aps, arp_output)
+            mac_output, poe_output, arp_output = _execute_concurrently(
+                ssh, [f"show mac address-table vlan {vlan}", "show power inline", f"show ip arp vlan {vlan}"]
+            )
+            port_keys = _ap_port_keys(aps)
+            _enrich_mac_from_table(aps, mac_output, port_keys)
+            _enrich_poe(aps, poe_output, port_keys)
+            _enrich_arp(aps, arp_output)
 
         switch_ops_total.labels(operation="access_points", result="success").inc()
         return aps
     except Exception as e:
         logger.warning("Failed to get APs from %s: %s", ip, e)
         switch_ops_total.labels(operation="access_points", result="error").inc()
-        return []
-    finally:
-        ssh.close()
+        return None
+
+
+# Switch IP -> when it last refused an exec channel next to the pooled shell.
+_EXEC_CHANNEL_REFUSED: dict[str, float] = {}
+
+
+def _exec_channels_supported(ssh: CiscoSSH) -> bool:
+    refused_at = _EXEC_CHANNEL_REFUSED.get(ssh.ip)
+    return refused_at is None or time.monotonic() - refused_at >= EXEC_CHANNEL_RETRY_AFTER
+
+
+def _exec_channel_failed(ssh: CiscoSSH, error: Exception) -> None:
+    """Decide whether a failed exec channel may fall back to the shell; re-raise if the session died."""
+    if not ssh.is_alive():
+        raise error
+    if not isinstance(error, paramiko.ChannelException):
+        # A timeout or I/O error on a slow link says nothing about the switch; only this command falls back.
+        logger.debug("Exec channel command failed on %s, using interactive shell: %s", ssh.ip, error)
+        return
+    # Many IOS images allow only the shell channel; remember it instead of timing out on every show.
+    logger.debug("Exec channel refused by %s, using interactive shell: %s", ssh.ip, error)
+    _EXEC_CHANNEL_REFUSED[ssh.ip] = time.monotonic()
+
+
+def _execute_show(ssh: CiscoSSH, cmd: str) -> str:
+    """Run a read-only command on an exec channel, which ends at EOF instead of a prompt match."""
+    if _exec_channels_supported(ssh):
+        try:
+            return ssh.execute_exec(cmd)
+        except (paramiko.SSHException, OSError) as e:
+            _exec_channel_failed(ssh, e)
+    return ssh.execute(cmd)
+
+
+def _try_exec(ssh: CiscoSSH, cmd: str) -> str | Exception:
+    try:
+        return ssh.execute_exec(cmd)
+    except (paramiko.SSHException, OSError) as e:
+        return e
+
+
+def _execute_concurrently(ssh: CiscoSSH, commands: list[str]) -> list[str]:
+    """Run independent show commands on parallel exec channels; only the ones that fail use the shell."""
+    if not _exec_channels_supported(ssh):
+        return [ssh.execute(cmd) for cmd in commands]
+    with ThreadPoolExecutor(max_workers=min(len(commands), EXEC_CHANNEL_CONCURRENCY)) as pool:
+        results = list(pool.map(lambda cmd: _try_exec(ssh, cmd), commands))
+    failures = [result for result in results if isinstance(result, Exception)]
+    if len(failures) == len(results):
+        _exec_channel_failed(ssh, failures[0])
+    elif failures and not ssh.is_alive():
+        raise failures[0]
+    return [ssh.execute(cmd) if isinstance(result, Exception) else result for cmd, result in zip(commands, results)]
 
 
 def reboot_ap(ip: str, username: str, password: str, enable_password: str, port: int, interface: str) -> bool:
     """Reboot an AP by PoE cycling the switch port."""
-    ssh = CiscoSSH(ip, username, password, enable_password, port)
-    if not ssh.connect():
-        switch_ops_total.labels(operation="reboot_ap_shutdown", result="error").inc()
-        return False
-
     try:
-        ssh.execute("configure terminal")
-        ssh.execute(f"interface {interface}")
-        ssh.execute("shutdown")
-        time.sleep(3)
-        ssh.execute("no shutdown")
-        ssh.execute("end")
+        with _SESSION_POOL.lease(ip, username, password, enable_password, port) as ssh:
+            if ssh is None:
+                switch_ops_total.labels(operation="reboot_ap_shutdown", result="error").inc()
+                return False
+
+            ssh.execute_batch(["configure terminal", f"interface {interface}", "shutdown"])
+            time.sleep(3)
+            ssh.execute_batch(["no shutdown", "end"])
         logger.info("PoE cycle completed on %s port %s", ip, interface)
         switch_ops_total.labels(operation="reboot_ap_shutdown", result="success").inc()
         return True
@@ -340,26 +643,21 @@ def reboot_ap(ip: str, username: str, password: str, enable_password: str, port:
         switch_ops_total.labels(operation="reboot_ap_shutdown", result="error").inc()
         return False
     finally:
-        ssh.close()
+        # PoE and link state for the port changed; the next AP listing must hit the switch.
+        _ACCESS_POINT_CACHE.evict_ip(ip)
 
 
 def poe_cycle_ap(ip: str, username: str, password: str, enable_password: str, port: int, interface: str) -> bool:
     """Reboot AP via PoE power cycle (cleaner than shutdown)."""
-    ssh = CiscoSSH(ip, username, password, enable_password, port)
-    if not ssh.connect():
-        switch_ops_total.labels(operation="reboot_ap_poe", result="error").inc()
-        return False
-
     try:
-        ssh.execute("configure terminal")
-        ssh.execute(f"interface {interface}")
-        ssh.execute("power inline never")
-        ssh.execute("end")
-        time.sleep(5)
-        ssh.execute("configure terminal")
-        ssh.execute(f"interface {interface}")
-        ssh.execute("power inline auto")
-        ssh.execute("end")
+        with _SESSION_POOL.lease(ip, username, password, enable_password, port) as ssh:
+            if ssh is None:
+                switch_ops_total.labels(operation="reboot_ap_poe", result="error").inc()
+                return False
+
+            ssh.execute_batch(["configure terminal", f"interface {interface}", "power inline never", "end"])
+            time.sleep(5)
+            ssh.execute_batch(["configure terminal", f"interface {interface}", "power inline auto", "end"])
         logger.info("PoE power cycle completed on %s port %s", ip, interface)
         switch_ops_total.labels(operation="reboot_ap_poe", result="success").inc()
         return True
@@ -368,41 +666,77 @@ def poe_cycle_ap(ip: str, username: str, password: str, enable_password: str, po
         switch_ops_total.labels(operation="reboot_ap_poe", result="error").inc()
         return False
     finally:
-        ssh.close()
+        # PoE and link state for the port changed; the next AP listing must hit the switch.
+        _ACCESS_POINT_CACHE.evict_ip(ip)
+
+
+_AP_PLATFORM_TOKENS = (
+    "aironet",
+    "c9120",
+    "c9130",
+    "c9115",
+    "c9105",
+    "c1560",
+    "cisco ap",
+    "wireless",
+    "trans-bridge",
+)
+_CDP_ENTRY_SPLIT_RE = re.compile(r"-{5,}")
+_CDP_PLATFORM_RE = re.compile(r"Platform:\s*(.+?)(?:,|$)", re.MULTILINE)
+_CDP_CAPABILITIES_RE = re.compile(r"Capabilities:\s*(.+)", re.MULTILINE)
+_CDP_LOCAL_PORT_RE = re.compile(r"Interface:\s*(\S+),")
+_CDP_DEVICE_ID_RE = re.compile(r"Device ID:\s*(.+)")
+_CDP_IP_RE = re.compile(r"IP address:\s*(\d+\.\d+\.\d+\.\d+)")
+# Table rows are scanned with finditer over the whole output; `[^\S\n]` keeps every match on one line.
+_MAC_TABLE_RE = re.compile(
+    r"^[^\S\n]*\d+[^\S\n]+"
+    r"([0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4})[^\S\n]+"
+    r"\S+[^\S\n]+"
+    r"(\S+)",
+    re.MULTILINE,
+)
+_POE_RE = re.compile(r"^[^\S\n]*(\S+)[^\S\n]+\S+[^\S\n]+(\S+)[^\S\n]+([\d.]+)\s", re.MULTILINE)
+_ARP_RE = re.compile(
+    r"(\d+\.\d+\.\d+\.\d+)[^\S\n]+\S+[^\S\n]+"
+    r"([0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4})"
+)
+_PORT_PREFIXES = (
+    ("TenGigabitEthernet", "Te"),
+    ("GigabitEthernet", "Gi"),
+    ("TwentyFiveGigE", "Twe"),
+    ("FastEthernet", "Fa"),
+)
 
 
-_AP_PLATFORM_PATTERNS = re.compile(
-    r"AIR-|[Aa]ironet|[Cc]9120|[Cc]9130|[Cc]9115|[Cc]9105|[Cc]1560"
-    r"|[Cc]isco\s+AP|[Ww]ireless|Trans-Bridge",
-)
+def _is_ap_platform(platform: str) -> bool:
+    # The "AIR-" model prefix stays case-sensitive; whitespace is collapsed so "cisco\tAP" matches "cisco ap".
+    if "AIR-" in platform:
+        return True
+    platform = " ".join(platform.lower().split())
+    return any(token in platform for token in _AP_PLATFORM_TOKENS)
 
 
 def _parse_cdp_access_points(cdp_output: str, vlan: int) -> list[APInfo]:
     """Extract only access points from CDP neighbors detail output."""
     aps: list[APInfo] = []
-    entries = re.split(r"-{5,}", cdp_output)
-
-    for entry in entries:
-        platform_m = re.search(r"Platform:\s*(.+?)(?:,|$)", entry, re.MULTILINE)
-        cap_m = re.search(r"Capabilities:\s*(.+)", entry, re.MULTILINE)
-
-        is_ap = False
-        platform = ""
-        if platform_m:
-            platform = platform_m.group(1).strip()
-            if _AP_PLATFORM_PATTERNS.search(platform):
-                is_ap = True
-        if cap_m:
-            caps = cap_m.group(1).strip()
-            if "Trans-Bridge" in caps:
-                is_ap = True
-
-        if not is_ap:
-            continue
-
-        local_port_m = re.search(r"Interface:\s*(\S+),", entry)
-        name_m = re.search(r"Device ID:\s*(.+)", entry)
-        ip_m = re.search(r"IP address:\s*(\d+\.\d+\.\d+\.\d+)", entry)
+    platform_search = _CDP_PLATFORM_RE.search
+    capabilities_search = _CDP_CAPABILITIES_RE.search
+    local_port_search = _CDP_LOCAL_PORT_RE.search
+    device_id_search = _CDP_DEVICE_ID_RE.search
+    ip_search = _CDP_IP_RE.search
+
+    for entry in _CDP_ENTRY_SPLIT_RE.split(cdp_output):
+        platform_m = platform_search(entry)
+        platform = platform_m.group(1).strip() if platform_m else ""
+        # The capabilities line is only consulted when the platform alone is inconclusive.
+        if not _is_ap_platform(platform):
+            cap_m = capabilities_search(entry)
+            if not cap_m or "Trans-Bridge" not in cap_m.group(1):
+                continue
+
+        local_port_m = local_port_search(entry)
+        name_m = device_id_search(entry)
+        ip_m = ip_search(entry)
 
         local_port = local_port_m.group(1).strip() if local_port_m else ""
         cdp_name = name_m.group(1).strip() if name_m else None
@@ -422,82 +756,59 @@ def _parse_cdp_access_points(cdp_output: str, vlan: int) -> list[APInfo]:
     return aps
 
 
-def _enrich_mac_from_table(aps: list[APInfo], mac_output: str) -> None:
-    """Fill in MAC addresses for APs from the MAC address table."""
-    port_to_mac: dict[str, str] = {}
-    for line in mac_output.split("\n"):
-        m = re.match(
-            r"\s*\d+\s+"
-            r"([0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4})\s+"
-            r"\S+\s+"
-            r"(\S+)",
-            line,
-        )
-        if m:
-            mac = _format_mac(m.group(1).lower())
-            port_key = _normalize_port(m.group(2))
-            port_to_mac[port_key] = mac
+def _ap_port_keys(aps: list[APInfo]) -> list[str]:
+    return [_normalize_port(ap.port) for ap in aps]
 
-    for ap in aps:
-        port_key = _normalize_port(ap.port)
-        if port_key in port_to_mac:
-            ap.mac_address = port_to_mac[port_key]
+
+def _enrich_mac_from_table(aps: list[APInfo], mac_output: str, port_keys: list[str] | None = None) -> None:
+    """Fill in MAC addresses for APs from the MAC address table.
+
+    `port_keys` are the APs' normalized ports, in order; pass them when enriching from several tables.
+    """
+    port_to_mac = {_normalize_port(m.group(2)): _format_mac(m.group(1)) for m in _MAC_TABLE_RE.finditer(mac_output)}
+
+    for ap, port_key in zip(aps, port_keys or _ap_port_keys(aps), strict=True):
+        mac = port_to_mac.get(port_key)
+        if mac is not None:
+            ap.mac_address = mac
 
 
 def _format_mac(cisco_mac: str) -> str:
     """Convert Cisco MAC format (0011.2233.4455) to standard (00:11:22:33:44:55)."""
-    raw = cisco_mac.replace(".", "").lower()
-    if len(raw) == 12:
-        return ":".join(raw[i : i + 2] for i in range(0, 12, 2))
-    return cisco_mac
+    try:
+        raw = bytes.fromhex(cisco_mac.replace(".", ""))
+    except ValueError:
+        return cisco_mac
+    if len(raw) != 6:
+        return cisco_mac
+    return raw.hex(":")
 
 
-def _enrich_poe(aps: list[APInfo], poe_output: str) -> None:
+def _enrich_poe(aps: list[APInfo], poe_output: str, port_keys: list[str] | None = None) -> None:
     """Enrich AP list with PoE info."""
-    poe_by_port: dict[str, dict] = {}
-    for line in poe_output.split("\n"):
-        m = re.match(r"\s*(\S+)\s+\S+\s+(\S+)\s+([\d.]+)\s+", line)
-        if m:
-            port_key = _normalize_port(m.group(1))
-            poe_by_port[port_key] = {
-                "status": m.group(2),
-                "power": m.group(3) + "W",
-            }
+    poe_by_port = {_normalize_port(m.group(1)): (m.group(2), m.group(3) + "W") for m in _POE_RE.finditer(poe_output)}
 
-    for ap in aps:
-        port_key = _normalize_port(ap.port)
-        if port_key in poe_by_port:
-            ap.poe_status = poe_by_port[port_key].get("status")
-            ap.poe_power = poe_by_port[port_key].get("power")
+    for ap, port_key in zip(aps, port_keys or _ap_port_keys(aps), strict=True):
+        poe = poe_by_port.get(port_key)
+        if poe is not None:
+            ap.poe_status, ap.poe_power = poe
 
 
 def _enrich_arp(aps: list[APInfo], arp_output: str) -> None:
     """Enrich AP list with IP from ARP table."""
-    mac_to_ip: dict[str, str] = {}
-    for line in arp_output.split("\n"):
-        m = re.search(
-            r"(\d+\.\d+\.\d+\.\d+)\s+\S+\s+"
-            r"([0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4})",
-            line,
-        )
-        if m:
-            formatted = _format_mac(m.group(2).lower())
-            mac_to_ip[formatted] = m.group(1)
+    mac_to_ip = {_format_mac(m.group(2)): m.group(1) for m in _ARP_RE.finditer(arp_output)}
 
     for ap in aps:
-        if ap.mac_address in mac_to_ip:
-            ap.ip_address = mac_to_ip[ap.mac_address]
+        ip = mac_to_ip.get(ap.mac_address)
+        if ip is not None:
+            ap.ip_address = ip
 
 
+@lru_cache(maxsize=1024)
 def _normalize_port(port: str) -> str:
     """Normalize port names for comparison (Gi0/1 == GigabitEthernet0/1)."""
     port = port.strip()
-    replacements = [
-        (r"^GigabitEthernet", "Gi"),
-        (r"^FastEthernet", "Fa"),
-        (r"^TenGigabitEthernet", "Te"),
-        (r"^TwentyFiveGigE", "Twe"),
-    ]
-    for pattern, repl in replacements:
-        port = re.sub(pattern, repl, port)
+    for prefix, short in _PORT_PREFIXES:
+        if port.startswith(prefix):
+            return short + port[len(prefix) :]
     return port
@@ -8,61 +8,76 @@ Supports NetBIOS name resolution for Windows hosts.
 from __future__ import annotations
 
 import asyncio
+import atexit
+import concurrent.futures
 import ipaddress
 import logging
 import os
-import platform
-import re as _re
 import socket
 import struct
 import time
 import warnings
+from collections.abc import Coroutine, Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
+from app.observability.metrics import media_player_ops_total
+from app.services.ping import async_check_port
+
+# pysnmp pulls in its MIB loaders and ASN.1 codecs at import time, so it is imported where the
+# SNMP requests are built rather than when this module loads.
 warnings.filterwarnings("ignore", message=".*pysnmp-lextudio.*")
 
-from pysnmp.hlapi.asyncio import (  # noqa: E402
-    CommunityData,
-    ContextData,
-    ObjectIdentity,
-    ObjectType,
-    SnmpEngine,
-    UdpTransportTarget,
-)
-from pysnmp.hlapi.asyncio.cmdgen import getCmd, walkCmd  # noqa: E402
+if TYPE_CHECKING:
+    from pysnmp.hlapi.asyncio import CommunityData, SnmpEngine
 
-from app.observability.metrics import media_player_ops_total  # noqa: E402
+try:  # installed with uvicorn[standard] everywhere except Windows
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
 
 logger = logging.getLogger(__name__)
 _RESOLVE_WARN_COOLDOWN_SECONDS = 300.0
 _RESOLVE_WARN_LAST_SEEN: dict[str, float] = {}
 _RESOLVE_CACHE_SECONDS = 300.0
+# Failures expire sooner so a host that just joined DNS/NetBIOS is picked up quickly.
+_RESOLVE_NEGATIVE_CACHE_SECONDS = 30.0
 _RESOLVE_CACHE: dict[str, tuple[float, str | None]] = {}
+# NetBIOS answers are cached apart from DNS: a miss costs a 3 s wait, so it is remembered longer.
+_NETBIOS_CACHE_SECONDS = 600.0
+_NETBIOS_NEGATIVE_CACHE_SECONDS = 60.0
+_NETBIOS_CACHE: dict[tuple[str, tuple[str, ...]], tuple[float, str | None]] = {}
 
 SNMP_TIMEOUT = 3
 SNMP_RETRIES = 1
+# Polls are latency-bound: an offline host makes every probe wait out its timeout. When the port
+# scan finds nothing, SNMP gets until this long after its first request timed out before the host
+# counts as down, so one lost datagram is retried even if the host refused every port at once.
+SNMP_OFFLINE_GRACE = 1.0
 
 OID_SYS_DESCR = "1.3.6.1.2.1.1.1.0"
 OID_SYS_NAME = "1.3.6.1.2.1.1.5.0"
 OID_SYS_UPTIME = "1.3.6.1.2.1.1.3.0"
 OID_IF_PHYS_ADDR = "1.3.6.1.2.1.2.2.1.6"
+# ifPhysAddr rows fetched alongside the system scalars; most devices expose a real MAC in the first few.
+SNMP_BULK_REPETITIONS = 10
+ARP_PROBE_POLLS = 5
+ARP_PROBE_INTERVAL = 0.1
+# How long a sweep batch waits for neighbor resolution; matches the one-second ping timeout it replaced.
+ARP_SWEEP_SETTLE = 1.0
+# Concurrent polls and MAC checks share one parse of /proc/net/arp; the kernel keeps entries far longer.
+ARP_TABLE_TTL = 1.0
 
 SCAN_PORTS = [22, 80, 135, 139, 443, 445, 554, 3389, 5405, 8080, 8081, 9090]
 TCP_TIMEOUT = 2.0
 _PORT_SCAN_SEMAPHORE = asyncio.Semaphore(64)
 _MAX_NETBIOS_TARGETS = 2048
+_MAX_CACHED_SUBNET_HOSTS = 4096
 _PING_SWEEP_CONCURRENCY = 128
 
 
-def _ping_command(ip: str) -> list[str]:
-    system = platform.system()
-    if system == "Windows":
-        return ["ping", "-n", "1", "-w", "1000", ip]
-    if system == "Darwin":
-        return ["ping", "-c", "1", "-W", "1000", ip]
-    return ["ping", "-c", "1", "-W", "1", ip]
-
-
 @dataclass
 class DeviceStatus:
     is_online: bool = False
@@ -88,17 +103,8 @@ def _format_uptime(ticks: int) -> str:
 
 
 async def _check_port(ip: str, port: int) -> int | None:
-    try:
-        async with _PORT_SCAN_SEMAPHORE:
-            _, writer = await asyncio.wait_for(
-                asyncio.open_connection(ip, port),
-                timeout=TCP_TIMEOUT,
-            )
-            writer.close()
-            await writer.wait_closed()
-            return port
-    except (TimeoutError, OSError):
-        return None
+    async with _PORT_SCAN_SEMAPHORE:
+        return port if await async_check_port(ip, port, TCP_TIMEOUT) else None
 
 
 async def _scan_ports(ip: str) -> list[int]:
@@ -107,15 +113,59 @@ async def _scan_ports(ip: str) -> list[int]:
     return sorted(p for p in results if p is not None)
 
 
-async def _get_snmp_info(ip: str, community: str = "public") -> dict:
+# Result keys in the order the system scalars are requested.
+_SYSTEM_FIELDS = ("os_info", "hostname", "uptime")
+_SYSTEM_FIELD_BY_OID = dict(zip((OID_SYS_DESCR, OID_SYS_NAME, OID_SYS_UPTIME), _SYSTEM_FIELDS, strict=True))
+
+
+def _apply_system_value(result: dict, field: str, val) -> None:
+    if field == "uptime":
+        # TimeTicks convert straight to int; only fall back to the printed value when that fails.
+        try:
+            result["uptime"] = _format_uptime(int(val))
+            return
+        except (ValueError, TypeError):
+            pass
+    val_str = str(val).strip()
+    if val_str:
+        result[field] = val_str if field == "uptime" else val_str[:255]
+
+
+def _apply_system_var_bind(result: dict, oid_str: str, val) -> None:
+    if field := _SYSTEM_FIELD_BY_OID.get(oid_str):
+        _apply_system_value(result, field, val)
+
+
+_ZERO_MAC = b"\x00" * 6
+
+
+def _mac_from_octets(val) -> str | None:
+    if hasattr(val, "asOctets"):
+        octets = val.asOctets()
+        if len(octets) == 6 and octets != _ZERO_MAC:
+            return octets.hex(":")
+    return None
+
+
+@lru_cache(maxsize=64)
+def _community_data(community: str) -> CommunityData:
+    from pysnmp.hlapi.asyncio import CommunityData
+
+    return CommunityData(community)
+
+
+async def _get_snmp_info(ip: str, community: str = "public", engine: SnmpEngine | None = None) -> dict:
     """Retrieve sysDescr, sysName, sysUpTime via SNMP GET."""
-    engine = SnmpEngine()
+    from pysnmp.hlapi.asyncio import ContextData, ObjectIdentity, ObjectType, SnmpEngine, UdpTransportTarget
+    from pysnmp.hlapi.asyncio.cmdgen import getCmd
+
+    engine = engine or SnmpEngine()
     try:
         target = UdpTransportTarget((ip, 161), timeout=SNMP_TIMEOUT, retries=SNMP_RETRIES)
     except Exception:
         return {}
 
-    comm = CommunityData(community)
+    comm = _community_data(community)
     result = {}
 
     try:
@@ -131,107 +181,227 @@ async def _get_snmp_info(ip: str, community: str = "public") -> dict:
         if err_indication or err_status:
             return {}
 
-        for oid, val in var_binds:
-            oid_str = str(oid)
-            val_str = str(val).strip()
-            if not val_str:
-                continue
-            if OID_SYS_DESCR in oid_str:
-                result["os_info"] = val_str[:255]
-            elif OID_SYS_NAME in oid_str:
-                result["hostname"] = val_str[:255]
-            elif OID_SYS_UPTIME in oid_str:
-                try:
-                    ticks = int(val)
-                    result["uptime"] = _format_uptime(ticks)
-                except (ValueError, TypeError):
-                    result["uptime"] = val_str
+        # A GET answers in request order, so the binds map to fields by position.
+        for field, (_, val) in zip(_SYSTEM_FIELDS, var_binds, strict=False):
+            _apply_system_value(result, field, val)
     except Exception as e:
         logger.debug("SNMP GET failed for %s: %s", ip, e)
 
     return result
 
 
-async def _get_snmp_mac(ip: str, community: str = "public") -> str | None:
-    engine = SnmpEngine()
+async def _get_snmp_mac(
+    ip: str, community: str = "public", engine: SnmpEngine | None = None, *, bulk: bool = True
+) -> str | None:
+    """Walk ifPhysAddr for the first non-zero MAC.
+
+    Uses GETBULK pages of SNMP_BULK_REPETITIONS rows; `bulk=False` falls back to one GETNEXT per
+    interface for agents that rejected a bulk request.
+    """
+    from pysnmp.hlapi.asyncio import ContextData, ObjectIdentity, ObjectType, SnmpEngine, UdpTransportTarget
+    from pysnmp.hlapi.asyncio.cmdgen import bulkWalkCmd, walkCmd
+
+    engine = engine or SnmpEngine()
     try:
         target = UdpTransportTarget((ip, 161), timeout=SNMP_TIMEOUT, retries=SNMP_RETRIES)
     except Exception:
         return None
 
-    comm = CommunityData(community)
+    comm = _community_data(community)
+    column = ObjectType(ObjectIdentity(OID_IF_PHYS_ADDR))
+    if bulk:
+        rows = bulkWalkCmd(
+            engine, comm, target, ContextData(), 0, SNMP_BULK_REPETITIONS, column, lexicographicMode=False
+        )
+    else:
+        rows = walkCmd(engine, comm, target, ContextData(), column, lexicographicMode=False)
     try:
-        async for err, _, _, vb in walkCmd(
-            engine,
-            comm,
-            target,
-            ContextData(),
-            ObjectType(ObjectIdentity(OID_IF_PHYS_ADDR)),
-            lexicographicMode=False,
-        ):
+        async for err, _, _, vb in rows:
             if err:
                 break
             for _, val in vb:
-                if hasattr(val, "asOctets"):
-                    octets = val.asOctets()
-                    if len(octets) == 6 and any(b != 0 for b in octets):
-                        return ":".join(f"{b:02x}" for b in octets)
+                if mac := _mac_from_octets(val):
+                    return mac
     except Exception:
         pass
     return None
 
 
-def _get_mac_from_arp(ip: str) -> str | None:
-    import subprocess
+async def _get_snmp_info_and_mac(ip: str, community: str, engine: SnmpEngine) -> tuple[dict, str | None]:
+    """Fetch the system scalars and the first ifPhysAddr rows in a single GETBULK round trip.
+
+    The scalars are non-repeaters, so they are requested by their parent OID (GETNEXT semantics).
+    Falls back to the separate GET and WALK if the agent rejects the bulk request, and keeps
+    walking ifPhysAddr if none of the bulk rows carried a usable MAC.
+    """
+    from pysnmp.hlapi.asyncio import ContextData, ObjectIdentity, ObjectType, UdpTransportTarget
+    from pysnmp.hlapi.asyncio.cmdgen import bulkCmd
 
     try:
-        subprocess.run(
-            _ping_command(ip),
-            capture_output=True,
-            timeout=3,
+        target = UdpTransportTarget((ip, 161), timeout=SNMP_TIMEOUT, retries=SNMP_RETRIES)
+    except Exception:
+        return {}, None
+
+    try:
+        err_indication, err_status, _, var_bind_table = await bulkCmd(
+            engine,
+            _community_data(community),
+            target,
+            ContextData(),
+            3,
+            SNMP_BULK_REPETITIONS,
+            ObjectType(ObjectIdentity(OID_SYS_DESCR.removesuffix(".0"))),
+            ObjectType(ObjectIdentity(OID_SYS_NAME.removesuffix(".0"))),
+            ObjectType(ObjectIdentity(OID_SYS_UPTIME.removesuffix(".0"))),
+            ObjectType(ObjectIdentity(OID_IF_PHYS_ADDR)),
         )
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
+    except Exception as e:
+        logger.debug("SNMP GETBULK failed for %s: %s", ip, e)
+        return {}, None
+    if err_indication:
+        return {}, None
+    if err_status:
+        info, mac = await asyncio.gather(
+            _get_snmp_info(ip, community, engine), _get_snmp_mac(ip, community, engine, bulk=False)
+        )
+        return info, mac
+
+    result: dict = {}
+    mac = None
+    in_if_column = False
+    mac_prefix = OID_IF_PHYS_ADDR + "."
+    for row in var_bind_table:
+        for oid, val in row:
+            oid_str = str(oid)
+            in_if_column = oid_str.startswith(mac_prefix)
+            if in_if_column:
+                mac = mac or _mac_from_octets(val)
+            else:
+                _apply_system_var_bind(result, oid_str, val)
+    if mac is None and in_if_column:
+        mac = await _get_snmp_mac(ip, community, engine)
+    return result, mac
+
+
+def _arp_table_mac(ip: str) -> str | None:
+    """Look up `ip` in the kernel ARP table without splitting every line."""
+    try:
+        with open("/proc/net/arp", "rb") as f:
+            table = f.read()
+    except OSError:
+        return None
+    start = table.find(b"\n" + ip.encode() + b" ")
+    if start < 0:
+        return None
+    end = table.find(b"\n", start + 1)
+    parts = table[start + 1 : end if end >= 0 else None].split()
+    if len(parts) < 4:
+        return None
+    mac = parts[3].decode("ascii", errors="replace").lower()
+    if mac != "00:00:00:00:00:00" and len(mac) == 17:
+        return mac
+    return None
 
+
+def _probe_neighbor(ip: str) -> None:
+    """Send one UDP datagram to the discard port so the kernel resolves the neighbor entry."""
     try:
-        with open("/proc/net/arp") as f:
-            for line in f.readlines()[1:]:
-                parts = line.split()
-                if len(parts) >= 4 and parts[0] == ip:
-                    mac = parts[3].lower()
-                    if mac != "00:00:00:00:00:00" and len(mac) == 17:
-                        return mac
-    except (FileNotFoundError, PermissionError):
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.connect((ip, 9))
+            sock.send(b"\x00")
+    except OSError:
         pass
 
+
+def _read_neighbor_table() -> dict[str, str]:
+    """Return IP->MAC from one `ip neigh` dump."""
+    import subprocess
+
+    out: dict[str, str] = {}
     try:
-        out = subprocess.run(
-            ["ip", "neigh", "show", ip],
+        neigh = subprocess.run(
+            ["ip", "neigh"],
             capture_output=True,
             text=True,
-            timeout=3,
-        ).stdout.strip()
-        if "lladdr" in out:
-            parts = out.split()
+            timeout=5,
+        ).stdout
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return out
+    for line in neigh.splitlines():
+        parts = line.split()
+        if "lladdr" in parts:
             idx = parts.index("lladdr")
             if idx + 1 < len(parts):
                 mac = parts[idx + 1].lower()
                 if len(mac) == 17:
-                    return mac
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
-    return None
+                    out[parts[0]] = mac
+    return out
+
+
+def _procfs_arp_available() -> bool:
+    return os.path.exists("/proc/net/arp")
+
+
+def _read_arp_table() -> dict[str, str]:
+    """Return IP->MAC for every resolved entry of /proc/net/arp, parsed in one pass.
+
+    Falls back to an `ip neigh` dump only where procfs is unavailable.
+    """
+    try:
+        with open("/proc/net/arp") as f:
+            lines = f.read().splitlines()[1:]
+    except OSError:
+        return _read_neighbor_table()
+    out: dict[str, str] = {}
+    for line in lines:
+        parts = line.split()
+        if len(parts) >= 4:
+            mac = parts[3].lower()
+            if mac != "00:00:00:00:00:00" and len(mac) == 17:
+                out[parts[0]] = mac
+    return out
+
+
+_arp_table_cache: tuple[float, dict[str, str]] | None = None
+
+
+def _cached_arp_table() -> dict[str, str]:
+    """ARP table shared by concurrent lookups, re-read at most every ARP_TABLE_TTL seconds."""
+    global _arp_table_cache
+    now = time.monotonic()
+    cached = _arp_table_cache
+    if cached is not None and now - cached[0] < ARP_TABLE_TTL:
+        return cached[1]
+    table = _read_arp_table()
+    _arp_table_cache = (now, table)
+    return table
+
+
+def _get_mac_from_arp(ip: str) -> str | None:
+    # The port scan usually resolved the neighbor already; probe only when the entry is missing.
+    if mac := _cached_arp_table().get(ip):
+        return mac
+    _probe_neighbor(ip)
+    for _ in range(ARP_PROBE_POLLS):
+        time.sleep(ARP_PROBE_INTERVAL)
+        mac = _arp_table_mac(ip)
+        if mac:
+            return mac
+
+    # Without procfs the shared table is an `ip neigh` dump, re-read once the probe had time to resolve.
+    if _procfs_arp_available():
+        return None
+    return _cached_arp_table().get(ip)
+
+
+# First-level encoding splits every byte into two nibbles, each offset from "A".
+_NETBIOS_NIBBLE_PAIRS = tuple(bytes((0x41 + (b >> 4), 0x41 + (b & 0x0F))) for b in range(256))
 
 
 def _netbios_encode_name(name: str) -> bytes:
     """Encode a NetBIOS name using first-level encoding (RFC 1001)."""
-    padded = name.upper().ljust(16, " ")[:16]
-    encoded = bytearray()
-    for ch in padded:
-        b = ord(ch)
-        encoded.append(0x41 + (b >> 4))
-        encoded.append(0x41 + (b & 0x0F))
-    return bytes([32]) + bytes(encoded) + b"\x00"
+    padded = name.upper().ljust(16, " ")[:16].encode("latin-1", errors="replace")
+    return b"\x20" + b"".join(map(_NETBIOS_NIBBLE_PAIRS.__getitem__, padded)) + b"\x00"
 
 
 def _netbios_query_packet(name: str) -> bytes:
@@ -288,85 +458,145 @@ def _netbios_parse_response(data: bytes) -> str | None:
     return None
 
 
-def _netbios_resolve(name: str, subnets: list[str] | None = None) -> str | None:
+def _iter_subnet_hosts(subnets: Iterable[str]) -> Iterator[str]:
+    for subnet_str in subnets:
+        try:
+            net = ipaddress.IPv4Network(subnet_str, strict=False)
+        except ValueError:
+            continue
+        yield from map(str, net.hosts())
+
+
+@lru_cache(maxsize=16)
+def _expand_small_subnets(subnets: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(_iter_subnet_hosts(subnets))
+
+
+def _expand_subnets(subnets: tuple[str, ...], limit: int | None = None) -> Sequence[str]:
+    """Host addresses of the given IPv4 subnets, at most `limit` of them.
+
+    Lists of up to `_MAX_CACHED_SUBNET_HOSTS` addresses are expanded once and reused; larger ones are
+    expanded per call so the cache never pins a /16 worth of strings.
+    """
+    size = 0
+    for subnet_str in subnets:
+        try:
+            size += ipaddress.IPv4Network(subnet_str, strict=False).num_addresses
+        except ValueError:
+            continue
+    if size <= _MAX_CACHED_SUBNET_HOSTS:
+        return _expand_small_subnets(subnets)[:limit]
+    return list(islice(_iter_subnet_hosts(subnets), limit))
+
+
+class _NetbiosResponseProtocol(asyncio.DatagramProtocol):
+    """Completes `result` with the first answer that parses as a Name Query Response."""
+
+    def __init__(self, name: str, result: asyncio.Future[str]):
+        self.name = name
+        self.result = result
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        if self.result.done():
+            return
+        parsed_ip = _netbios_parse_response(data)
+        if parsed_ip:
+            logger.info("NetBIOS resolved %s -> %s (unicast from %s)", self.name, parsed_ip, addr[0])
+            self.result.set_result(parsed_ip)
+
+    def error_received(self, exc: Exception) -> None:
+        # Hosts without NetBIOS answer with ICMP errors; keep waiting for the others.
+        pass
+
+
+async def _netbios_resolve(name: str, subnets: list[str] | None = None) -> str | None:
     """Resolve a Windows hostname via NetBIOS name query.
 
     Uses unicast queries to each IP in known subnets (broadcasts
     don't cross Docker bridge networks).  UDP is connectionless, so
-    we blast packets to all hosts and wait for the first response.
+    we blast packets to all hosts and wait for the first response
+    on the event loop.
     """
     if subnets is None:
         raw = os.environ.get("SCAN_SUBNET", "")
         subnets = [s.strip() for s in raw.split(",") if s.strip()]
 
-    targets: list[str] = []
-    for subnet_str in subnets:
-        try:
-            net = ipaddress.IPv4Network(subnet_str, strict=False)
-            targets.extend(str(h) for h in net.hosts())
-        except ValueError:
-            continue
+    cache_key = (name.upper(), tuple(subnets))
+    cached = _NETBIOS_CACHE.get(cache_key)
+    if cached:
+        queried_at, cached_ip = cached
+        ttl = _NETBIOS_CACHE_SECONDS if cached_ip else _NETBIOS_NEGATIVE_CACHE_SECONDS
+        if time.monotonic() - queried_at < ttl:
+            return cached_ip
+
+    targets = _expand_subnets(tuple(subnets), limit=_MAX_NETBIOS_TARGETS + 1)
     if len(targets) > _MAX_NETBIOS_TARGETS:
-        logger.warning(
-            "NetBIOS target list too large (%d), truncating to %d for safety",
-            len(targets),
-            _MAX_NETBIOS_TARGETS,
-        )
+        logger.warning("NetBIOS target list exceeds %d hosts, truncating for safety", _MAX_NETBIOS_TARGETS)
         targets = targets[:_MAX_NETBIOS_TARGETS]
 
     if not targets:
         return None
 
-    packet = _netbios_query_packet(name)
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.setblocking(False)
+    ip = await _netbios_query(name, targets)
+    _NETBIOS_CACHE[cache_key] = (time.monotonic(), ip)
+    return ip
+
 
+async def _netbios_query(name: str, targets: Sequence[str]) -> str | None:
+    packet = _netbios_query_packet(name)
+    loop = asyncio.get_running_loop()
+    result: asyncio.Future[str] = loop.create_future()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _NetbiosResponseProtocol(name, result), family=socket.AF_INET
+    )
     try:
         for ip in targets:
-            try:
-                sock.sendto(packet, (ip, 137))
-            except OSError:
-                pass
-
+            transport.sendto(packet, (ip, 137))
         logger.debug("NetBIOS: sent query for '%s' to %d hosts", name, len(targets))
-
-        import select as _select
-        import time
-
-        end = time.monotonic() + 3.0
-        while time.monotonic() < end:
-            remaining = end - time.monotonic()
-            if remaining <= 0:
-                break
-            ready, _, _ = _select.select([sock], [], [], min(remaining, 0.5))
-            if ready:
-                try:
-                    data, (resp_ip, _) = sock.recvfrom(1024)
-                    parsed_ip = _netbios_parse_response(data)
-                    if parsed_ip:
-                        logger.info("NetBIOS resolved %s -> %s (unicast from %s)", name, parsed_ip, resp_ip)
-                        return parsed_ip
-                except OSError:
-                    pass
+        return await asyncio.wait_for(result, timeout=3.0)
+    except TimeoutError:
+        return None
     finally:
-        sock.close()
+        transport.close()
 
-    return None
 
+def _is_ipv4_literal(address: str) -> bool:
+    # inet_pton only accepts the dotted-quad form, unlike inet_aton ("10.1" would pass there).
+    try:
+        socket.inet_pton(socket.AF_INET, address)
+    except OSError:
+        return False
+    return True
 
-def _resolve_host(address: str) -> str | None:
-    """Resolve hostname to IP via DNS then NetBIOS fallback."""
-    if _re.match(r"^(\d{1,3}\.){3}\d{1,3}$", address):
-        return address
 
+def _resolve_cached(address: str) -> tuple[bool, str | None]:
+    """Answer from IP literals and the resolve cache without blocking: ``(hit, ip)``."""
+    if _is_ipv4_literal(address):
+        return True, address
     cached = _RESOLVE_CACHE.get(address)
+    if cached:
+        resolved_at, ip = cached
+        ttl = _RESOLVE_CACHE_SECONDS if ip else _RESOLVE_NEGATIVE_CACHE_SECONDS
+        if time.monotonic() - resolved_at < ttl:
+            return True, ip
+    return False, None
+
+
+async def _dns_lookup(name: str) -> str:
+    infos = await asyncio.get_running_loop().getaddrinfo(name, None, family=socket.AF_INET, type=socket.SOCK_STREAM)
+    return infos[0][4][0]
+
+
+async def _resolve_host(address: str) -> str | None:
+    """Resolve hostname to IP via DNS then NetBIOS fallback."""
+    hit, cached_ip = _resolve_cached(address)
+    if hit:
+        return cached_ip
     now = time.monotonic()
-    if cached and now - cached[0] < _RESOLVE_CACHE_SECONDS:
-        return cached[1]
 
     # 1. DNS
     try:
-        resolved = socket.gethostbyname(address)
+        resolved = await _dns_lookup(address)
         _RESOLVE_CACHE[address] = (time.monotonic(), resolved)
         return resolved
     except socket.gaierror:
@@ -375,14 +605,14 @@ def _resolve_host(address: str) -> str | None:
     if "." not in address:
         for suffix in [".local", ".lan"]:
             try:
-                resolved = socket.gethostbyname(address + suffix)
+                resolved = await _dns_lookup(address + suffix)
                 _RESOLVE_CACHE[address] = (time.monotonic(), resolved)
                 return resolved
             except socket.gaierror:
                 pass
 
     # 2. NetBIOS (for Windows hostnames)
-    ip = _netbios_resolve(address)
+    ip = await _netbios_resolve(address)
     if ip:
         _RESOLVE_CACHE[address] = (time.monotonic(), ip)
         return ip
@@ -395,28 +625,44 @@ def _resolve_host(address: str) -> str | None:
     return None
 
 
+async def _await_snmp(
+    snmp_task: asyncio.Future[tuple[dict, str | None]], deadline: float | None
+) -> tuple[dict, str | None]:
+    """Result of the SNMP request, or nothing if it does not finish by the loop time `deadline`."""
+    if deadline is not None:
+        timeout = max(deadline - asyncio.get_running_loop().time(), 0)
+        done, _ = await asyncio.wait({snmp_task}, timeout=timeout)
+        if not done:
+            return {}, None
+    return await snmp_task
+
+
 async def poll_device(address: str, community: str = "public") -> DeviceStatus:
     """Poll a network device for status information.
 
     ``address`` can be an IP address or hostname.
     """
+    from pysnmp.hlapi.asyncio import SnmpEngine
+
     status = DeviceStatus()
 
-    ip = await asyncio.to_thread(_resolve_host, address)
+    ip = await _resolve_host(address)
     if not ip:
         media_player_ops_total.labels(operation="poll_device", result="error").inc()
         status.is_online = False
         return status
 
-    ports_task = _scan_ports(ip)
-    snmp_task = _get_snmp_info(ip, community)
-    mac_task = _get_snmp_mac(ip, community)
-
-    open_ports, snmp_info, mac = await asyncio.gather(
-        ports_task,
-        snmp_task,
-        mac_task,
-    )
+    # One engine per poll: its transport dispatcher is bound to this call's event loop, so it
+    # cannot outlive it, but the bulk request and any fallback share its dispatcher and MIB state.
+    engine = SnmpEngine()
+    snmp_task = asyncio.ensure_future(_get_snmp_info_and_mac(ip, community, engine))
+    offline_deadline = asyncio.get_running_loop().time() + SNMP_TIMEOUT + SNMP_OFFLINE_GRACE
+    try:
+        open_ports = await _scan_ports(ip)
+        snmp_info, mac = await _await_snmp(snmp_task, None if open_ports else offline_deadline)
+    finally:
+        snmp_task.cancel()
+        engine.closeDispatcher()
 
     status.open_ports = open_ports
     status.is_online = bool(open_ports) or bool(snmp_info)
@@ -430,7 +676,8 @@ async def poll_device(address: str, community: str = "public") -> DeviceStatus:
         status.hostname = address
 
     status.mac_address = mac
-    if not mac:
+    # An offline host has no neighbor entry to find, so skip the ARP probe and its polling delay.
+    if not mac and status.is_online:
         arp_mac = await asyncio.to_thread(_get_mac_from_arp, ip)
         if arp_mac:
             status.mac_address = arp_mac
@@ -444,90 +691,21 @@ async def poll_device(address: str, community: str = "public") -> DeviceStatus:
 
 def _check_arp_for_mac(target_mac: str) -> str | None:
     """Check current ARP table for a MAC address (no scanning)."""
-    import subprocess
-
     target_mac = target_mac.lower().strip()
-
-    try:
-        with open("/proc/net/arp") as f:
-            for line in f.readlines()[1:]:
-                parts = line.split()
-                if len(parts) >= 4 and parts[3].lower() == target_mac:
-                    return parts[0]
-    except (FileNotFoundError, PermissionError):
-        pass
-
-    try:
-        out = subprocess.run(
-            ["ip", "neigh"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        ).stdout
-        for line in out.strip().split("\n"):
-            if target_mac in line.lower():
-                parts = line.split()
-                if parts:
-                    return parts[0]
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
+    for ip, mac in _cached_arp_table().items():
+        if mac == target_mac:
+            return ip
     return None
 
 
-async def _async_ping(ip: str) -> None:
-    """Fire-and-forget async ping to populate ARP cache."""
-    try:
-        proc = await asyncio.create_subprocess_exec(
-            *_ping_command(ip),
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL,
-        )
-        await asyncio.wait_for(proc.wait(), timeout=2)
-    except (TimeoutError, OSError):
-        pass
-
-
 async def find_device_by_mac(mac: str, subnets: list[str] | None = None) -> str | None:
     results = await find_devices_by_macs([mac], subnets=subnets)
     return results.get(mac.lower().strip())
 
 
 def _arp_table_mac_to_ip() -> dict[str, str]:
-    """Build MAC->IP map from ARP/neigh tables."""
-    import subprocess
-
-    out: dict[str, str] = {}
-    try:
-        with open("/proc/net/arp") as f:
-            for line in f.readlines()[1:]:
-                parts = line.split()
-                if len(parts) >= 4:
-                    ip = parts[0]
-                    mac = parts[3].lower()
-                    if mac != "00:00:00:00:00:00" and len(mac) == 17:
-                        out[mac] = ip
-    except (FileNotFoundError, PermissionError):
-        pass
-
-    try:
-        neigh = subprocess.run(
-            ["ip", "neigh"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        ).stdout
-        for line in neigh.strip().split("\n"):
-            parts = line.split()
-            if "lladdr" in parts:
-                ip = parts[0]
-                idx = parts.index("lladdr")
-                if idx + 1 < len(parts):
-                    mac = parts[idx + 1].lower()
-                    if len(mac) == 17:
-                        out[mac] = ip
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
-    return out
+    """Build MAC->IP map from a fresh read of the ARP table; sweeps re-read it while waiting for new entries."""
+    return {mac: ip for ip, mac in _read_arp_table().items()}
 
 
 async def find_devices_by_macs(macs: list[str], subnets: list[str] | None = None) -> dict[str, str]:
@@ -535,7 +713,7 @@ async def find_devices_by_macs(macs: list[str], subnets: list[str] | None = None
 
     Optimized for batch lookups:
     1. Checks ARP table once for all MACs.
-    2. If unresolved, does bounded ping sweep once, rechecking ARP in batches.
+    2. If unresolved, probes the subnets once in bounded batches, rechecking ARP after each.
     """
     targets = {m.lower().strip() for m in macs if m and m.strip()}
     if not targets:
@@ -556,23 +734,20 @@ async def find_devices_by_macs(macs: list[str], subnets: list[str] | None = None
         raw = os.environ.get("SCAN_SUBNET", "")
         subnets = [s.strip() for s in raw.split(",") if s.strip()]
 
-    hosts: list[str] = []
-    for subnet_str in subnets:
-        try:
-            net = ipaddress.IPv4Network(subnet_str, strict=False)
-            hosts.extend(str(h) for h in net.hosts())
-        except ValueError:
-            continue
+    hosts = _expand_subnets(tuple(subnets))
 
     if not hosts:
         media_player_ops_total.labels(operation="find_by_mac", result="error").inc()
         return found
 
-    # Ping sweep in bounded batches to avoid self-induced packet storms.
+    # Probe in bounded batches to avoid self-induced packet storms. A UDP datagram makes the kernel
+    # resolve the neighbor just like a ping would, without spawning a process per host.
     batch_size = _PING_SWEEP_CONCURRENCY
     for i in range(0, len(hosts), batch_size):
         batch = hosts[i : i + batch_size]
-        await asyncio.gather(*[_async_ping(h) for h in batch])
+        for host in batch:
+            _probe_neighbor(host)
+        await asyncio.sleep(ARP_SWEEP_SETTLE)
         arp_map = await asyncio.to_thread(_arp_table_mac_to_ip)
         for mac in targets - found.keys():
             ip = arp_map.get(mac)
@@ -588,6 +763,20 @@ async def find_devices_by_macs(macs: list[str], subnets: list[str] | None = None
     return found
 
 
+# Polls requested from inside a running event loop are handed to these threads.
+_POLL_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="device-poll")
+atexit.register(_POLL_EXECUTOR.shutdown, wait=False)
+
+
+def _run_coroutine[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run on uvloop's libuv event loop when available; the port scan opens many sockets at once.
+
+    Each call gets a fresh loop that is closed afterwards: callers are often short-lived pool
+    threads, and a loop kept per thread would leak its selector and sockets when the thread exits.
+    """
+    return asyncio.run(coro, loop_factory=uvloop.new_event_loop if uvloop is not None else None)
+
+
 def poll_device_sync(address: str, community: str = "public") -> DeviceStatus:
     """Synchronous wrapper for poll_device.
 
@@ -599,9 +788,6 @@ def poll_device_sync(address: str, community: str = "public") -> DeviceStatus:
         loop = None
 
     if loop and loop.is_running():
-        import concurrent.futures
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-            return pool.submit(asyncio.run, poll_device(address, community)).result()
+        return _POLL_EXECUTOR.submit(_run_coroutine, poll_device(address, community)).result()
     else:
-        return asyncio.run(poll_device(address, community))
+        return _run_coroutine(poll_device(address, community))
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import ipaddress
-import json
 import logging
 import re
-from dataclasses import asdict, dataclass, field
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from itertools import combinations
 from time import perf_counter
+from typing import TYPE_CHECKING
 
 import httpx
+from pydantic_core import from_json, to_json, to_jsonable_python
 
 from app.core.config import settings
 from app.core.redis import get_redis
@@ -18,13 +21,24 @@ from app.observability.metrics import (
     network_discovery_runs_total,
 )
 from app.services.net_inventory import parse_arp_table
+from app.services.ping import async_check_port
+
+if TYPE_CHECKING:
+    from pysnmp.hlapi.asyncio import SnmpEngine
 
 logger = logging.getLogger(__name__)
 
 DISCOVERY_TTL = 600
 _DISCOVERY_TCP_SEMAPHORE = asyncio.Semaphore(max(settings.SCAN_TCP_CONCURRENCY, 1))
+# Hosts swept at once; each holds up to len(ports) sockets from _DISCOVERY_TCP_SEMAPHORE.
+_DISCOVERY_HOST_CONCURRENCY = 64
 _DISCOVERY_HTTP_TIMEOUT = 2.0
+# Status endpoints are only probed when the main page is inconclusive; real players answer fast.
+_ICONBIT_FALLBACK_TIMEOUT = 1.0
 _DISCOVERY_IDENTIFY_CONCURRENCY = 32
+# Minimum spacing between "running" progress writes while sweeping ports.
+_PROGRESS_UPDATE_INTERVAL = 0.5
+_ICONBIT_AUTH = ("admin", "admin")
 
 _PRINTER_HINTS = (
     "printer",
@@ -57,7 +71,7 @@ _SWITCH_HINTS = (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredNetworkDevice:
     ip: str
     mac: str | None = None
@@ -84,31 +98,47 @@ def _lock_key(kind: str) -> str:
     return f"discover:{kind}:lock"
 
 
-def _parse_subnets(subnet_str: str) -> list[str]:
-    all_ips: list[str] = []
-    seen: set[str] = set()
-    max_hosts = max(settings.SCAN_MAX_HOSTS, 1)
+type _Network = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+def _host_count(network: _Network) -> int:
+    """len(list(network.hosts())) without enumerating them."""
+    if network.num_addresses <= 2:
+        return network.num_addresses
+    return network.num_addresses - (2 if network.version == 4 else 1)
+
+
+def _parse_subnets(subnet_str: str) -> tuple[list[_Network], int]:
+    """Valid networks in `subnet_str` and their number of distinct hosts, capped at SCAN_MAX_HOSTS."""
+    networks: list[_Network] = []
     for part in subnet_str.split(","):
         part = part.strip()
         if not part:
             continue
         try:
-            network = ipaddress.ip_network(part, strict=False)
-            for ip in network.hosts():
-                ip_str = str(ip)
-                if ip_str in seen:
-                    continue
-                seen.add(ip_str)
-                all_ips.append(ip_str)
-                if len(all_ips) > max_hosts:
-                    raise ValueError(
-                        f"Too many hosts to scan ({len(all_ips)}). Limit is {max_hosts}; split subnet ranges."
-                    )
-        except ValueError as exc:
-            if "Too many hosts" in str(exc):
-                raise
+            networks.append(ipaddress.ip_network(part, strict=False))
+        except ValueError:
             logger.warning("Invalid discovery subnet: %s", part)
-    return all_ips
+    max_hosts = max(settings.SCAN_MAX_HOSTS, 1)
+    counts = [_host_count(network) for network in networks]
+    total = sum(counts)
+    if max(counts, default=0) <= max_hosts and any(a.overlaps(b) for a, b in combinations(networks, 2)):
+        # Overlapping ranges are rare; count their shared hosts once, the slow way.
+        total = len({ip for network in networks for ip in network.hosts()})
+    if total > max_hosts:
+        raise ValueError(f"Too many hosts to scan ({total}). Limit is {max_hosts}; split subnet ranges.")
+    return networks, total
+
+
+def _iter_subnet_ips(networks: list[_Network]) -> Iterator[str]:
+    """Yield each host of `networks` once, in order, as the sweep asks for it."""
+    seen: set[str] = set()
+    for network in networks:
+        for ip in network.hosts():
+            ip_str = str(ip)
+            if ip_str not in seen:
+                seen.add(ip_str)
+                yield ip_str
 
 
 def _parse_ports(ports_str: str) -> list[int]:
@@ -134,25 +164,21 @@ def _parse_ports(ports_str: str) -> list[int]:
 
 
 async def _tcp_check(ip: str, port: int) -> bool:
-    timeout = max(settings.SCAN_TCP_TIMEOUT, 0.1)
-    retries = max(settings.SCAN_TCP_RETRIES, 0)
-    for attempt in range(retries + 1):
-        try:
-            async with _DISCOVERY_TCP_SEMAPHORE:
-                _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout=timeout)
-                writer.close()
-                await writer.wait_closed()
-                return True
-        except (TimeoutError, OSError):
-            if attempt < retries:
-                await asyncio.sleep(0.05 * (attempt + 1))
-    return False
+    async with _DISCOVERY_TCP_SEMAPHORE:
+        return await async_check_port(ip, port, max(settings.SCAN_TCP_TIMEOUT, 0.1))
 
 
 async def _check_ports(ip: str, ports: list[int]) -> list[int]:
-    tasks = [_tcp_check(ip, port) for port in ports]
-    results = await asyncio.gather(*tasks)
-    return [port for port, is_open in zip(ports, results) if is_open]
+    # Retries cover only the ports that failed, and the backoff sleeps without holding a socket slot.
+    closed = ports
+    for attempt in range(max(settings.SCAN_TCP_RETRIES, 0) + 1):
+        if attempt:
+            await asyncio.sleep(0.05 * attempt)
+        results = await asyncio.gather(*[_tcp_check(ip, port) for port in closed])
+        closed = [port for port, is_open in zip(closed, results) if not is_open]
+        if not closed:
+            break
+    return [port for port in ports if port not in closed]
 
 
 def _normalize_vendor(value: str | None) -> str | None:
@@ -170,7 +196,10 @@ def _normalize_vendor(value: str | None) -> str | None:
     return "generic"
 
 
-async def _snmp_switch_fingerprint(ip: str, community: str = "public") -> dict[str, str | None]:
+async def _snmp_switch_fingerprint(
+    ip: str, community: str = "public", engine: SnmpEngine | None = None
+) -> dict[str, str | None]:
+    """Identify a switch by its SNMP system group; pass `engine` to share one across a scan."""
     try:
         from pysnmp.hlapi.asyncio import (
             CommunityData,
@@ -187,7 +216,9 @@ async def _snmp_switch_fingerprint(ip: str, community: str = "public") -> dict[s
         target = UdpTransportTarget((ip, 161), timeout=2, retries=0)
     except Exception:
         return {}
-    engine = SnmpEngine()
+    owns_engine = engine is None
+    if engine is None:
+        engine = SnmpEngine()
     oid_sys_descr = "1.3.6.1.2.1.1.1.0"
     oid_sys_name = "1.3.6.1.2.1.1.5.0"
     oid_sys_object_id = "1.3.6.1.2.1.1.2.0"
@@ -224,6 +255,9 @@ async def _snmp_switch_fingerprint(ip: str, community: str = "public") -> dict[s
         return values
     except Exception:
         return {}
+    finally:
+        if owns_engine:
+            engine.closeDispatcher()
 
 
 def _is_likely_iconbit_response(main_text: str, status_xml_text: str | None, now_text: str | None) -> bool:
@@ -242,29 +276,48 @@ def _is_likely_iconbit_response(main_text: str, status_xml_text: str | None, now
     return page_hints or status_hints or now_hints
 
 
-async def _iconbit_fingerprint(ip: str) -> dict[str, str | None]:
+def _iconbit_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=_DISCOVERY_HTTP_TIMEOUT,
+        follow_redirects=True,
+        auth=_ICONBIT_AUTH,
+        limits=httpx.Limits(
+            max_connections=_DISCOVERY_IDENTIFY_CONCURRENCY * 2,
+            max_keepalive_connections=_DISCOVERY_IDENTIFY_CONCURRENCY,
+        ),
+    )
+
+
+def _ok_text(response: httpx.Response | BaseException) -> str | None:
+    if isinstance(response, httpx.Response) and response.status_code == 200:
+        return response.text[:5000]
+    return None
+
+
+async def _iconbit_fingerprint(ip: str, client: httpx.AsyncClient | None = None) -> dict[str, str | None]:
+    """Identify an Iconbit player; pass `client` to share one connection pool across a scan."""
+    if client is None:
+        async with _iconbit_client() as own_client:
+            return await _iconbit_fingerprint(ip, own_client)
     base = f"http://{ip}:8081"
-    auth = ("admin", "admin")
     try:
-        async with httpx.AsyncClient(timeout=_DISCOVERY_HTTP_TIMEOUT, follow_redirects=True, auth=auth) as client:
-            main = await client.get(base)
-            if main.status_code != 200:
-                return {}
-            text = main.text[:5000]
-            status_xml = await client.get(f"{base}/status.xml")
-            now = await client.get(f"{base}/now")
-            if not _is_likely_iconbit_response(
-                text,
-                status_xml.text[:5000] if status_xml.status_code == 200 else None,
-                now.text[:5000] if now.status_code == 200 else None,
-            ):
+        main = await client.get(base)
+        if main.status_code != 200:
+            return {}
+        text = main.text[:5000]
+        if not _is_likely_iconbit_response(text, None, None):
+            status_xml, now = await asyncio.gather(
+                client.get(f"{base}/status.xml", timeout=_ICONBIT_FALLBACK_TIMEOUT),
+                client.get(f"{base}/now", timeout=_ICONBIT_FALLBACK_TIMEOUT),
+                return_exceptions=True,
+            )
+            if not _is_likely_iconbit_response(text, _ok_text(status_xml), _ok_text(now)):
                 return {}
-            model_match = re.search(r"<title>([^<]+)</title>", text, re.IGNORECASE)
-            model = model_match.group(1).strip() if model_match else "Iconbit"
-            return {"model_info": model, "device_kind": "iconbit"}
+        model_match = re.search(r"<title>([^<]+)</title>", text, re.IGNORECASE)
+        model = model_match.group(1).strip() if model_match else "Iconbit"
+        return {"model_info": model, "device_kind": "iconbit"}
     except Exception:
         return {}
-    return {}
 
 
 async def _update_progress(
@@ -272,7 +325,7 @@ async def _update_progress(
 ) -> None:
     r = await get_redis()
     payload = {"status": status, "scanned": scanned, "total": total, "found": found, "message": message}
-    await r.setex(_progress_key(kind), DISCOVERY_TTL, json.dumps(payload))
+    await r.setex(_progress_key(kind), DISCOVERY_TTL, to_json(payload))
 
 
 async def run_discovery_scan(kind: str, subnet: str, ports_str: str, known_devices: list[dict]) -> list[dict]:
@@ -285,8 +338,8 @@ async def run_discovery_scan(kind: str, subnet: str, ports_str: str, known_devic
     await r.setex(lock_key, 300, "1")
     started = perf_counter()
     try:
-        all_ips = _parse_subnets(subnet)
-        if not all_ips:
+        networks, total = _parse_subnets(subnet)
+        if not total:
             raise ValueError("No valid IPs to scan")
         ports = _parse_ports(ports_str)
         if not ports:
@@ -295,48 +348,61 @@ async def run_discovery_scan(kind: str, subnet: str, ports_str: str, known_devic
         known_by_ip = {d["ip_address"]: d for d in known_devices if d.get("ip_address")}
         known_by_mac = {d["mac_address"].lower(): d for d in known_devices if d.get("mac_address")}
 
-        await _update_progress(kind, "running", 0, len(all_ips), 0)
-        devices: list[DiscoveredNetworkDevice] = []
-        batch_size = 64
+        await _update_progress(kind, "running", 0, total, 0)
+        found: dict[int, DiscoveredNetworkDevice] = {}
         scanned = 0
-        for i in range(0, len(all_ips), batch_size):
-            batch = all_ips[i : i + batch_size]
-            results = await asyncio.gather(*[_check_ports(ip, ports) for ip in batch])
-            for ip, open_ports in zip(batch, results):
-                if not open_ports:
-                    continue
-                device = DiscoveredNetworkDevice(ip=ip, open_ports=open_ports)
-                if ip in known_by_ip:
-                    device.is_known = True
-                    device.known_device_id = str(known_by_ip[ip]["id"])
-                devices.append(device)
-            scanned += len(batch)
-            await _update_progress(kind, "running", scanned, len(all_ips), len(devices))
+        last_progress = perf_counter()
+        pending_ips = enumerate(_iter_subnet_ips(networks))
+
+        # A fixed set of workers pulls hosts from one iterator, so a slow host never holds back a whole batch.
+        async def _sweep_hosts() -> None:
+            nonlocal scanned, last_progress
+            for index, ip in pending_ips:
+                open_ports = await _check_ports(ip, ports)
+                scanned += 1
+                if open_ports:
+                    device = DiscoveredNetworkDevice(ip=ip, open_ports=open_ports)
+                    if ip in known_by_ip:
+                        device.is_known = True
+                        device.known_device_id = str(known_by_ip[ip]["id"])
+                    found[index] = device
+                # Large sweeps finish hosts every few ms; one Redis write per interval is enough for the UI.
+                now = perf_counter()
+                if now - last_progress >= _PROGRESS_UPDATE_INTERVAL:
+                    last_progress = now
+                    await _update_progress(kind, "running", scanned, total, len(found))
+
+        await asyncio.gather(*[_sweep_hosts() for _ in range(min(_DISCOVERY_HOST_CONCURRENCY, total))])
+        devices = [found[index] for index in sorted(found)]
 
         if devices:
-            await _update_progress(
-                kind, "running", len(all_ips), len(all_ips), len(devices), "Идентификация устройств…"
-            )
+            await _update_progress(kind, "running", total, total, len(devices), "Идентификация устройств…")
+            # The sweep already resolved every responder's neighbor entry, so read ARP while identifying.
+            arp_task = asyncio.ensure_future(asyncio.to_thread(parse_arp_table))
+            semaphore = asyncio.BoundedSemaphore(_DISCOVERY_IDENTIFY_CONCURRENCY)
             if kind == "iconbit":
-                semaphore = asyncio.Semaphore(_DISCOVERY_IDENTIFY_CONCURRENCY)
-
-                async def _identify_iconbit(dev: DiscoveredNetworkDevice) -> None:
-                    if 8081 not in dev.open_ports:
-                        return
-                    async with semaphore:
-                        info = await _iconbit_fingerprint(dev.ip)
-                    if not info:
-                        return
-                    dev.device_kind = "iconbit"
-                    dev.model_info = info.get("model_info")
-
-                await asyncio.gather(*[_identify_iconbit(dev) for dev in devices])
+                async with _iconbit_client() as client:
+
+                    async def _identify_iconbit(dev: DiscoveredNetworkDevice) -> None:
+                        if 8081 not in dev.open_ports:
+                            return
+                        async with semaphore:
+                            info = await _iconbit_fingerprint(dev.ip, client)
+                        if not info:
+                            return
+                        dev.device_kind = "iconbit"
+                        dev.model_info = info.get("model_info")
+
+                    await asyncio.gather(*[_identify_iconbit(dev) for dev in devices])
             else:
-                semaphore = asyncio.Semaphore(_DISCOVERY_IDENTIFY_CONCURRENCY)
+                from pysnmp.hlapi.asyncio import SnmpEngine
+
+                # One engine (dispatcher, UDP transport, MIB state) serves every fingerprint in the scan.
+                engine = SnmpEngine()
 
                 async def _identify_switch(dev: DiscoveredNetworkDevice) -> None:
                     async with semaphore:
-                        info = await _snmp_switch_fingerprint(dev.ip)
+                        info = await _snmp_switch_fingerprint(dev.ip, engine=engine)
                     if not info:
                         return
                     dev.hostname = info.get("hostname")
@@ -344,10 +410,13 @@ async def run_discovery_scan(kind: str, subnet: str, ports_str: str, known_devic
                     dev.device_kind = "switch"
                     dev.vendor = _normalize_vendor(dev.model_info)
 
-                await asyncio.gather(*[_identify_switch(dev) for dev in devices])
+                try:
+                    await asyncio.gather(*[_identify_switch(dev) for dev in devices])
+                finally:
+                    engine.closeDispatcher()
 
             # Best-effort ARP enrich and known by MAC.
-            arp = await asyncio.to_thread(parse_arp_table)
+            arp = await arp_task
             for dev in devices:
                 mac = arp.get(dev.ip)
                 if mac:
@@ -365,9 +434,9 @@ async def run_discovery_scan(kind: str, subnet: str, ports_str: str, known_devic
         else:
             devices = [d for d in devices if d.device_kind == "switch"]
 
-        result = [asdict(d) for d in devices]
-        await r.setex(_results_key(kind), DISCOVERY_TTL, json.dumps(result))
-        await _update_progress(kind, "done", len(all_ips), len(all_ips), len(result))
+        result = to_jsonable_python(devices)
+        await r.setex(_results_key(kind), DISCOVERY_TTL, to_json(result))
+        await _update_progress(kind, "done", total, total, len(result))
         network_discovery_runs_total.labels(kind=kind, result="success").inc()
         network_discovery_devices_total.labels(kind=kind).inc(len(result))
         return result
@@ -386,7 +455,7 @@ async def get_discovery_progress(kind: str) -> dict:
     r = await get_redis()
     data = await r.get(_progress_key(kind))
     if data:
-        return json.loads(data)
+        return from_json(data)
     return {"status": "idle", "scanned": 0, "total": 0, "found": 0, "message": None}
 
 
@@ -394,5 +463,5 @@ async def get_discovery_results(kind: str) -> list[dict]:
     r = await get_redis()
     data = await r.get(_results_key(kind))
     if data:
-        return json.loads(data)
+        return from_json(data)
     return []
@@ -16,6 +16,7 @@ Common endpoints:
 
 from __future__ import annotations
 
+import atexit
 import logging
 import re
 import time
@@ -37,6 +38,23 @@ _FIRMWARE_HINTS: dict[str, str] = {}
 _WARN_COOLDOWN_SECONDS = 600.0
 _WARN_LAST_SEEN: dict[str, float] = {}
 
+_NOW_TRACK_RE = re.compile(r"<b>(.*?)</b>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SIZE_PATTERN = r"\d+[\.,]?\d*\s*[GMKT]B"
+_FREE_SPACE_RU_RE = re.compile(rf"[Дд]оступно\s+({_SIZE_PATTERN})\s*/\s*({_SIZE_PATTERN})", re.IGNORECASE)
+_FREE_SPACE_PAIR_RE = re.compile(rf"({_SIZE_PATTERN})\s*/\s*({_SIZE_PATTERN})", re.IGNORECASE)
+_FREE_SPACE_AVAILABLE_RE = re.compile(rf"({_SIZE_PATTERN})\s+available", re.IGNORECASE)
+_DELETE_LINK_RE = re.compile(r'delete\?file=([^"&\']+)', re.IGNORECASE)
+
+# Shared across threads so repeated operations on one player (polls, bulk deletes) reuse its keep-alive socket.
+_client = httpx.Client(
+    auth=AUTH_CREDS,
+    timeout=TIMEOUT,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+)
+atexit.register(_client.close)
+
 
 def _log_warning_with_cooldown(key: str, message: str, *args) -> None:
     now = time.monotonic()
@@ -63,7 +81,7 @@ def _base_url(ip: str) -> str:
 
 def _get(url: str, **kwargs) -> httpx.Response | None:
     try:
-        resp = httpx.get(url, auth=AUTH_CREDS, timeout=TIMEOUT, follow_redirects=True, **kwargs)
+        resp = _client.get(url, **kwargs)
         media_player_ops_total.labels(
             operation="iconbit_http_get",
             result="success" if resp.status_code < 500 else "error",
@@ -81,7 +99,7 @@ def _get(url: str, **kwargs) -> httpx.Response | None:
 
 def _post(url: str, **kwargs) -> httpx.Response | None:
     try:
-        resp = httpx.post(url, auth=AUTH_CREDS, follow_redirects=True, **kwargs)
+        resp = _client.post(url, **kwargs)
         media_player_ops_total.labels(
             operation="iconbit_http_post",
             result="success" if resp.status_code < 500 else "error",
@@ -109,12 +127,12 @@ def _parse_status_xml(text: str) -> dict | None:
 
 def _parse_now_html(text: str) -> str | None:
     """Extract track name from /now HTML response."""
-    match = re.search(r"<b>(.*?)</b>", text, re.IGNORECASE | re.DOTALL)
+    match = _NOW_TRACK_RE.search(text)
     if match:
         track = match.group(1).strip()
         if track and track.lower() not in ("", "none", "нет", "nothing", "-"):
             return track
-    clean = re.sub(r"<[^>]+>", "", text).strip()
+    clean = _TAG_RE.sub("", text).strip()
     if clean and len(clean) < 200 and clean.lower() not in ("", "none", "нет"):
         return clean
     return None
@@ -122,13 +140,13 @@ def _parse_now_html(text: str) -> str | None:
 
 def _parse_free_space(html: str) -> str | None:
     """Extract free space from main page HTML."""
-    m = re.search(r"[Дд]оступно\s+(\d+[\.,]?\d*\s*[GMKT]B)\s*/\s*(\d+[\.,]?\d*\s*[GMKT]B)", html, re.IGNORECASE)
+    m = _FREE_SPACE_RU_RE.search(html)
     if m:
         return f"{m.group(1)} / {m.group(2)}"
-    m = re.search(r"(\d+[\.,]?\d*\s*[GMKT]B)\s*/\s*(\d+[\.,]?\d*\s*[GMKT]B)", html, re.IGNORECASE)
+    m = _FREE_SPACE_PAIR_RE.search(html)
     if m:
         return f"{m.group(1)} / {m.group(2)}"
-    m = re.search(r"(\d+[\.,]?\d*\s*[GMKT]B)\s+available", html, re.IGNORECASE)
+    m = _FREE_SPACE_AVAILABLE_RE.search(html)
     if m:
         return m.group(1)
     return None
@@ -146,7 +164,7 @@ def get_status(ip: str) -> IconbitStatus:
         return status
     if main_resp and main_resp.status_code == 200:
         html = main_resp.text
-        file_matches = re.findall(r'delete\?file=([^"&\']+)', html, re.IGNORECASE)
+        file_matches = _DELETE_LINK_RE.findall(html)
         status.files = [f.strip() for f in file_matches if f.strip()]
         status.free_space = _parse_free_space(html)
 
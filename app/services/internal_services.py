@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
-from typing import Any
+from typing import Any, NoReturn
 from urllib.parse import urlparse
 
 import httpx
 from fastapi import HTTPException
+from pydantic import ValidationError
 
 from app.core.config import settings
 from app.observability.metrics import observe_service_edge
@@ -16,7 +17,7 @@ _RETRYABLE_STATUS_CODES = {502, 503, 504}
 _http_client: httpx.AsyncClient | None = None
 
 
-def _raise_proxy_http_error(*, status_code: int, kind: str, code: str, detail: str) -> None:
+def _raise_proxy_http_error(*, status_code: int, kind: str, code: str, detail: str) -> NoReturn:
     raise HTTPException(
         status_code=status_code,
         detail={
@@ -40,7 +41,7 @@ def _headers() -> dict[str, str]:
     return {}
 
 
-async def _proxy_request(
+async def _send_proxy_request(
     *,
     base_url: str,
     method: str,
@@ -50,7 +51,7 @@ async def _proxy_request(
     json_body: dict[str, Any] | None = None,
     data: dict[str, Any] | None = None,
     files: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+) -> httpx.Response:
     url = f"{base_url.rstrip('/')}{path}"
     target = (urlparse(base_url).hostname or "unknown").strip() or "unknown"
     normalized_method = method.upper().strip()
@@ -79,15 +80,7 @@ async def _proxy_request(
                     timeout=request_timeout,
                 )
             response.raise_for_status()
-            data = response.json()
-            if isinstance(data, dict):
-                return data
-            _raise_proxy_http_error(
-                status_code=502,
-                kind="integration",
-                code="invalid_payload",
-                detail="internal service returned invalid payload",
-            )
+            return response
         except httpx.HTTPStatusError as exc:
             status = exc.response.status_code if exc.response is not None else None
             should_retry = status in _RETRYABLE_STATUS_CODES and attempt < attempts
@@ -120,6 +113,76 @@ async def _proxy_request(
     )
 
 
+async def _proxy_request(
+    *,
+    base_url: str,
+    method: str,
+    path: str,
+    timeout: float | None = None,
+    params: dict[str, Any] | None = None,
+    json_body: dict[str, Any] | None = None,
+    data: dict[str, Any] | None = None,
+    files: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    response = await _send_proxy_request(
+        base_url=base_url,
+        method=method,
+        path=path,
+        timeout=timeout,
+        params=params,
+        json_body=json_body,
+        data=data,
+        files=files,
+    )
+    payload = response.json()
+    if not isinstance(payload, dict):
+        _raise_proxy_http_error(
+            status_code=502,
+            kind="integration",
+            code="invalid_payload",
+            detail="internal service returned invalid payload",
+        )
+    return payload
+
+
+async def _proxy_request_bytes(
+    *,
+    base_url: str,
+    method: str,
+    path: str,
+    timeout: float | None = None,
+    params: dict[str, Any] | None = None,
+    json_body: dict[str, Any] | None = None,
+    data: dict[str, Any] | None = None,
+    files: dict[str, Any] | None = None,
+) -> bytes:
+    """Return the raw response body so callers can parse it with `Model.model_validate_json`."""
+    response = await _send_proxy_request(
+        base_url=base_url,
+        method=method,
+        path=path,
+        timeout=timeout,
+        params=params,
+        json_body=json_body,
+        data=data,
+        files=files,
+    )
+    return response.content
+
+
+def _parse_proxy_payload[T](parse: Callable[[bytes], T], payload: bytes) -> T:
+    """Validate a body from `_proxy_request_bytes`; a malformed one is an upstream fault (502), not ours."""
+    try:
+        return parse(payload)
+    except ValidationError:
+        _raise_proxy_http_error(
+            status_code=502,
+            kind="integration",
+            code="invalid_payload",
+            detail="internal service returned invalid payload",
+        )
+
+
 async def maybe_proxy(
     *,
     enabled: bool,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import socket
 
 ZEBRA_RAW_PORT = 9100
@@ -15,3 +16,25 @@ def check_port(ip: str, port: int = ZEBRA_RAW_PORT, timeout: float = DEFAULT_TIM
             return True
     except (OSError, TimeoutError):
         return False
+
+
+async def async_check_port(ip: str, port: int, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """Async variant of `check_port` for sweeps.
+
+    Uses a bare non-blocking connect on the running loop instead of `asyncio.open_connection`,
+    so no transport, protocol or stream objects are built for every probed port.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        # Running out of descriptors mid-sweep must fail this probe, not the whole gather.
+        sock = socket.socket(socket.AF_INET6 if ":" in ip else socket.AF_INET, socket.SOCK_STREAM)
+    except OSError:
+        return False
+    sock.setblocking(False)
+    try:
+        await asyncio.wait_for(loop.sock_connect(sock, (ip, port)), timeout=timeout)
+        return True
+    except (OSError, TimeoutError):
+        return False
+    finally:
+        sock.close()
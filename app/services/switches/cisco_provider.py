@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+import sys
 import time
 
 from app.domains.inventory.models import NetworkSwitch
@@ -106,11 +107,12 @@ class CiscoSwitchProvider:
             if len(parts) < 7:
                 continue
             port_name = parts[0]
-            media_type = parts[-1]
-            speed_text = parts[-2]
-            duplex_text = parts[-3]
-            vlan_text = parts[-4]
-            status_text = parts[-5]
+            # Status columns repeat across every port of the switch; intern them so rows share one string.
+            media_type = sys.intern(parts[-1])
+            speed_text = sys.intern(parts[-2])
+            duplex_text = sys.intern(parts[-3])
+            vlan_text = sys.intern(parts[-4])
+            status_text = sys.intern(parts[-5])
             name_text = " ".join(parts[1:-5]).strip()
             oper_state = "up" if status_text == "connected" else "down"
             port_mode = "trunk" if vlan_text.lower() == "trunk" else ("access" if vlan_text.isdigit() else None)
@@ -0,0 +1,9 @@
+import json
+
+from app.core.responses import FastJSONResponse
+
+
+def test_fast_json_response_renders_non_finite_floats_as_null():
+    response = FastJSONResponse({"toner": float("nan"), "score": float("inf"), "drum": -float("inf"), "ok": 1.5})
+
+    assert json.loads(response.body) == {"toner": None, "score": None, "drum": None, "ok": 1.5}
@@ -1,7 +1,11 @@
+import uuid
+from datetime import UTC, datetime
+
 import pytest
 from pydantic import ValidationError
 
-from app.schemas import PrinterCreate
+from app.models import Printer
+from app.schemas import PrinterCreate, PrintersPublic
 
 
 def test_printer_create_requires_ip_for_ip_connection():
@@ -25,3 +29,35 @@ def test_printer_create_allows_usb_without_ip():
     )
     assert model.connection_type == "usb"
     assert model.ip_address is None
+
+
+def test_printers_public_from_rows_skips_validation():
+    printer = Printer(
+        id=uuid.uuid4(),
+        store_name="Store",
+        model="HP",
+        ip_address="10.0.0.5",
+        created_at=datetime.now(UTC),
+    )
+    result = PrintersPublic.from_rows([printer], count=1)
+    assert result.count == 1
+    assert result.data[0].ip_address == "10.0.0.5"
+    assert result.data[0].printer_type == "laser"
+
+
+def test_printer_public_accepts_legacy_type_values_from_the_database():
+    from app.schemas import PrinterPublic
+
+    printer = Printer(
+        id=uuid.uuid4(),
+        printer_type="inkjet",
+        connection_type="serial",
+        store_name="Store",
+        model="Epson",
+        created_at=datetime.now(UTC),
+    )
+
+    public = PrinterPublic.model_validate(printer)
+
+    assert public.printer_type == "inkjet"
+    assert public.connection_type == "serial"
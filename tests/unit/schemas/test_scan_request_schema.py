@@ -0,0 +1,32 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import ScanRequest
+
+
+def test_scan_request_accepts_subnet_list():
+    model = ScanRequest(subnet="10.10.98.0/24, 10.10.0.0/16", ports="9100,631")
+    assert model.subnet == "10.10.98.0/24, 10.10.0.0/16"
+
+
+@pytest.mark.parametrize("subnet", ["10.10.98.0/255.255.255.0", "fd00::/120", "10.10.98.7"])
+def test_scan_request_accepts_any_ip_network_form(subnet: str):
+    assert ScanRequest(subnet=subnet).subnet == subnet
+
+
+@pytest.mark.parametrize(
+    ("subnet", "message"),
+    [
+        ("10.0.0.0/8", "too large"),
+        ("10.0.0.0/33", "Invalid subnet"),
+        ("printers", "Invalid subnet"),
+    ],
+)
+def test_scan_request_rejects_bad_subnets(subnet: str, message: str):
+    with pytest.raises(ValidationError, match=message):
+        ScanRequest(subnet=subnet)
+
+
+def test_scan_request_rejects_non_numeric_port():
+    with pytest.raises(ValidationError, match="must be integer"):
+        ScanRequest(subnet="10.10.98.0/24", ports="80,http")
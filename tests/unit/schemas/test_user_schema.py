@@ -1,7 +1,11 @@
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
 import pytest
 from pydantic import ValidationError
 
-from app.schemas import UserCreate
+from app.schemas import UserCreate, UserPublic
 
 
 def test_user_create_requires_strong_password():
@@ -12,3 +16,19 @@ def test_user_create_requires_strong_password():
 def test_user_create_accepts_valid_password():
     model = UserCreate(email="user@example.com", password="Pass1234")
     assert model.email == "user@example.com"
+
+
+def test_user_public_from_orm_trusted_copies_trusted_rows():
+    row = SimpleNamespace(
+        id=uuid.uuid4(),
+        email="user@example.com",
+        full_name="User",
+        is_active=True,
+        is_superuser=False,
+        last_seen_at=None,
+        created_at=datetime.now(UTC),
+        hashed_password="secret",
+    )
+    result = UserPublic.from_orm_trusted(row)
+    assert result.email == "user@example.com"
+    assert "hashed_password" not in result.model_dump()
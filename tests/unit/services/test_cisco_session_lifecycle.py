@@ -127,3 +127,682 @@ def test_cisco_ssh_close_closes_channel_and_transport():
     assert "exit\n" in shell.sent
     assert client.transport.closed is True
     assert client.closed is True
+
+
+def test_switch_info_and_access_points_share_pooled_session(monkeypatch):
+    from app.services import cisco_ssh
+
+    class _FakeSSH:
+        connect_calls = 0
+        close_calls = 0
+
+        def __init__(self, *_args, **_kwargs):
+            self.ip = "10.0.0.10"
+
+        def connect(self):
+            _FakeSSH.connect_calls += 1
+            return True
+
+        def is_alive(self):
+            return True
+
+        def is_reusable(self):
+            return True
+
+        def execute(self, cmd: str):
+            raise AssertionError(f"read-only command {cmd!r} sent to the interactive shell")
+
+        def execute_exec(self, cmd: str):
+            return "sw1 uptime is 1 day\n" if cmd == "show version" else ""
+
+        def close(self):
+            _FakeSSH.close_calls += 1
+
+    monkeypatch.setattr(cisco_ssh, "CiscoSSH", _FakeSSH)
+    monkeypatch.setattr(cisco_ssh, "_SESSION_POOL", cisco_ssh._SessionPool())
+    monkeypatch.setattr(cisco_ssh, "_SWITCH_INFO_CACHE", cisco_ssh._TTLCache(15))
+    monkeypatch.setattr(cisco_ssh, "_ACCESS_POINT_CACHE", cisco_ssh._TTLCache(30))
+
+    info = cisco_ssh.get_switch_info("10.0.0.10", "admin", "pass", "enable")
+    aps = cisco_ssh.get_access_points("10.0.0.10", "admin", "pass", "enable")
+
+    assert info.hostname == "sw1"
+    assert aps == []
+    assert _FakeSSH.connect_calls == 1
+    assert _FakeSSH.close_calls == 0
+
+
+def test_pooled_session_is_dropped_after_failure(monkeypatch):
+    from app.services import cisco_ssh
+
+    class _FakeSSH:
+        connect_calls = 0
+        close_calls = 0
+
+        def __init__(self, *_args, **_kwargs):
+            pass
+
+        def connect(self):
+            _FakeSSH.connect_calls += 1
+            return True
+
+        def is_alive(self):
+            return True
+
+        def is_reusable(self):
+            return True
+
+        def execute_batch(self, cmds: list[str]):
+            raise OSError("channel closed")
+
+        def close(self):
+            _FakeSSH.close_calls += 1
+
+    monkeypatch.setattr(cisco_ssh, "CiscoSSH", _FakeSSH)
+    monkeypatch.setattr(cisco_ssh, "_SESSION_POOL", cisco_ssh._SessionPool())
+
+    assert cisco_ssh.reboot_ap("10.0.0.10", "admin", "pass", "enable", 22, "Gi1/0/1") is False
+    assert cisco_ssh.poe_cycle_ap("10.0.0.10", "admin", "pass", "enable", 22, "Gi1/0/1") is False
+
+    assert _FakeSSH.connect_calls == 2
+    assert _FakeSSH.close_calls == 2
+
+
+def test_recv_until_prompt_wakes_on_data():
+    import select
+    import socket
+    import time
+
+    reader, writer = socket.socketpair()
+
+    class _SocketShell:
+        closed = False
+        eof_received = False
+
+        def fileno(self):
+            return reader.fileno()
+
+        def recv_ready(self):
+            return bool(select.select([reader], [], [], 0)[0])
+
+        def recv(self, size):
+            return reader.recv(size)
+
+    ssh = CiscoSSH("10.0.0.10", "admin", "pass")
+    ssh.shell = _SocketShell()  # type: ignore[assignment]
+    writer.sendall(b"show clock\r\n10:00:00.000 UTC\r\nsw1#")
+
+    started = time.monotonic()
+    output = ssh._recv_until_prompt(timeout=5)
+
+    assert output.endswith("sw1#")
+    assert time.monotonic() - started < 0.4
+    reader.close()
+    writer.close()
+
+
+def test_recv_until_prompt_stops_when_switch_sends_eof():
+    import socket
+    import time
+
+    reader, writer = socket.socketpair()
+
+    class _EofShell:
+        closed = False
+        eof_received = True
+
+        def fileno(self):
+            return reader.fileno()
+
+        def recv_ready(self):
+            return False
+
+    ssh = CiscoSSH("10.0.0.10", "admin", "pass")
+    ssh.shell = _EofShell()  # type: ignore[assignment]
+    # paramiko marks the channel readable on EOF even though no data is buffered.
+    writer.sendall(b"\0")
+
+    started = time.monotonic()
+    output = ssh._recv_until_prompt(timeout=3)
+
+    assert output == ""
+    assert time.monotonic() - started < 0.5
+    reader.close()
+    writer.close()
+
+
+def test_access_point_commands_run_on_exec_channels(monkeypatch):
+    from app.services import cisco_ssh
+
+    cdp = (
+        "Device ID: AP-FLOOR-01\n"
+        "Interface: GigabitEthernet1/0/10, Port ID (outgoing port): GigabitEthernet0\n"
+        "Platform: cisco C9120AXI-R, Capabilities: Router Switch IGMP Trans-Bridge\n"
+    )
+
+    class _FakeSSH:
+        def __init__(self, *_args, **_kwargs):
+            self.ip = "10.0.0.10"
+            self.shell_commands: list[str] = []
+            self.exec_commands: list[str] = []
+
+        def connect(self):
+            return True
+
+        def is_alive(self):
+            return True
+
+        def is_reusable(self):
+            return True
+
+        def execute(self, cmd: str):
+            self.shell_commands.append(cmd)
+            return ""
+
+        def execute_exec(self, cmd: str):
+            self.exec_commands.append(cmd)
+            if cmd.startswith("show cdp"):
+                return cdp
+            if cmd.startswith("show mac"):
+                return "  20    0011.2233.4455    DYNAMIC     Gi1/0/10\n"
+            return ""
+
+        def close(self):
+            pass
+
+    pool = cisco_ssh._SessionPool()
+    monkeypatch.setattr(cisco_ssh, "CiscoSSH", _FakeSSH)
+    monkeypatch.setattr(cisco_ssh, "_SESSION_POOL", pool)
+    monkeypatch.setattr(cisco_ssh, "_ACCESS_POINT_CACHE", cisco_ssh._TTLCache(30))
+
+    aps = cisco_ssh.get_access_points("10.0.0.10", "admin", "pass", "enable")
+
+    (ssh, _), *_ = pool._idle.values()
+    assert ssh.shell_commands == []
+    assert ssh.exec_commands[0] == "show cdp neighbors detail"
+    assert sorted(ssh.exec_commands[1:]) == [
+        "show ip arp vlan 20",
+        "show mac address-table vlan 20",
+        "show power inline",
+    ]
+    assert aps[0].mac_address == "00:11:22:33:44:55"
+
+
+def test_switch_results_are_cached_until_reboot(monkeypatch):
+    from app.services import cisco_ssh
+
+    calls: list[str] = []
+
+    class _FakeSSH:
+        def __init__(self, *_args, **_kwargs):
+            self.ip = "10.0.0.10"
+
+        def connect(self):
+            return True
+
+        def is_alive(self):
+            return True
+
+        def is_reusable(self):
+            return True
+
+        def execute_batch(self, cmds: list[str]):
+            return ""
+
+        def execute_exec(self, cmd: str):
+            calls.append(cmd)
+            return "sw1 uptime is 1 day\n" if cmd == "show version" else ""
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(cisco_ssh, "CiscoSSH", _FakeSSH)
+    monkeypatch.setattr(cisco_ssh, "_SESSION_POOL", cisco_ssh._SessionPool())
+    monkeypatch.setattr(cisco_ssh, "_SWITCH_INFO_CACHE", cisco_ssh._TTLCache(15))
+    monkeypatch.setattr(cisco_ssh, "_ACCESS_POINT_CACHE", cisco_ssh._TTLCache(30))
+    monkeypatch.setattr(cisco_ssh.time, "sleep", lambda _seconds: None)
+
+    first = cisco_ssh.get_switch_info("10.0.0.10", "admin", "pass")
+    second = cisco_ssh.get_switch_info("10.0.0.10", "admin", "pass")
+    cisco_ssh.get_access_points("10.0.0.10", "admin", "pass")
+    cisco_ssh.get_access_points("10.0.0.10", "admin", "pass")
+    assert first == second
+    assert first is not second
+    assert calls == ["show version", "show cdp neighbors detail"]
+
+    assert cisco_ssh.reboot_ap("10.0.0.10", "admin", "pass", "", 22, "Gi1/0/1") is True
+    cisco_ssh.get_access_points("10.0.0.10", "admin", "pass")
+    assert calls[-1] == "show cdp neighbors detail"
+    assert len(calls) == 3
+
+
+def test_execute_batch_waits_for_every_prompt():
+    import select
+    import socket
+    import threading
+
+    reader, writer = socket.socketpair()
+
+    class _SocketShell:
+        closed = False
+        eof_received = False
+
+        def __init__(self):
+            self.sent: list[str] = []
+
+        def fileno(self):
+            return reader.fileno()
+
+        def recv_ready(self):
+            return bool(select.select([reader], [], [], 0)[0])
+
+        def recv(self, size):
+            return reader.recv(size)
+
+        def send(self, data):
+            self.sent.append(data)
+            writer.sendall(b"configure terminal\r\nEnter configuration commands.\r\nsw1(config)#")
+
+    ssh = CiscoSSH("10.0.0.10", "admin", "pass")
+    shell = _SocketShell()
+    ssh.shell = shell  # type: ignore[assignment]
+
+    def _finish_block():
+        writer.sendall(b"interface Gi1/0/1\r\nsw1(config-if)#end\r\nsw1#")
+
+    timer = threading.Timer(0.05, _finish_block)
+    timer.start()
+    output = ssh.execute_batch(["configure terminal", "interface Gi1/0/1", "end"], timeout=5)
+    timer.join()
+
+    assert shell.sent == ["configure terminal\ninterface Gi1/0/1\nend\n"]
+    assert output.endswith("sw1#")
+    reader.close()
+    writer.close()
+
+
+def test_keyboard_interactive_opens_shell_on_bare_transport(monkeypatch):
+    class _FakeChannel:
+        closed = False
+
+        def __init__(self):
+            self.calls: list[str] = []
+
+        def get_pty(self):
+            self.calls.append("pty")
+
+        def invoke_shell(self):
+            self.calls.append("shell")
+
+        def settimeout(self, _timeout):
+            pass
+
+        def send(self, data):
+            self.calls.append(data)
+
+        def close(self):
+            self.closed = True
+
+    class _FakeTransport:
+        def __init__(self):
+            self.channel = _FakeChannel()
+            self.closed = False
+
+        def set_keepalive(self, _interval):
+            pass
+
+        def auth_interactive(self, _username, handler):
+            assert handler("", "", [("Password:", False)]) == ["pass"]
+
+        def open_session(self, timeout=None):
+            return self.channel
+
+        def is_active(self):
+            return not self.closed
+
+        def close(self):
+            self.closed = True
+
+    transport = _FakeTransport()
+    ssh = CiscoSSH("10.0.0.10", "admin", "pass")
+    monkeypatch.setattr(ssh, "_open_transport", lambda: transport)
+    monkeypatch.setattr(ssh, "_recv_until_prompt", lambda *_args, **_kwargs: "sw1#")
+
+    assert ssh._connect_keyboard_interactive() is True
+    assert ssh.client is None
+    assert ssh.transport is transport
+    assert transport.channel.calls == ["pty", "shell", "enable\n", "terminal length 0\n"]
+    assert ssh.is_alive() is True
+
+    ssh.close()
+    assert transport.closed is True
+    assert ssh.is_alive() is False
+
+
+def test_refused_exec_channel_is_remembered_per_switch(monkeypatch):
+    import paramiko
+
+    from app.services import cisco_ssh
+
+    class _FakeSSH:
+        ip = "10.0.0.10"
+        alive = True
+
+        def __init__(self):
+            self.exec_attempts = 0
+            self.shell_commands: list[str] = []
+
+        def is_alive(self):
+            return self.alive
+
+        def execute(self, cmd: str):
+            self.shell_commands.append(cmd)
+            return "sw1#"
+
+        def execute_exec(self, cmd: str):
+            self.exec_attempts += 1
+            raise paramiko.ChannelException(1, "Administratively prohibited")
+
+    monkeypatch.setattr(cisco_ssh, "_EXEC_CHANNEL_REFUSED", {})
+    ssh = _FakeSSH()
+
+    assert cisco_ssh._execute_show(ssh, "show version") == "sw1#"
+    assert cisco_ssh._execute_concurrently(ssh, ["show power inline", "show ip arp"]) == ["sw1#", "sw1#"]
+    assert ssh.exec_attempts == 1
+    assert ssh.shell_commands == ["show version", "show power inline", "show ip arp"]
+
+
+def test_transient_exec_failure_does_not_mark_switch_as_refusing(monkeypatch):
+    from app.services import cisco_ssh
+
+    class _FakeSSH:
+        ip = "10.0.0.14"
+
+        def __init__(self):
+            self.exec_attempts = 0
+
+        def is_alive(self):
+            return True
+
+        def execute(self, cmd: str):
+            return f"shell:{cmd}"
+
+        def execute_exec(self, cmd: str):
+            self.exec_attempts += 1
+            raise TimeoutError("timed out")
+
+    monkeypatch.setattr(cisco_ssh, "_EXEC_CHANNEL_REFUSED", {})
+    ssh = _FakeSSH()
+
+    assert cisco_ssh._execute_show(ssh, "show version") == "shell:show version"
+    assert cisco_ssh._execute_concurrently(ssh, ["show mac", "show ip arp"]) == ["shell:show mac", "shell:show ip arp"]
+    assert ssh.exec_attempts == 3
+    assert cisco_ssh._EXEC_CHANNEL_REFUSED == {}
+
+
+def test_exec_failure_on_dead_session_is_not_retried_on_the_shell(monkeypatch):
+    import paramiko
+    import pytest
+
+    from app.services import cisco_ssh
+
+    class _FakeSSH:
+        ip = "10.0.0.11"
+
+        def is_alive(self):
+            return False
+
+        def execute(self, cmd: str):
+            raise AssertionError("a dead session must not be reused")
+
+        def execute_exec(self, cmd: str):
+            raise paramiko.SSHException("SSH session not active")
+
+    monkeypatch.setattr(cisco_ssh, "_EXEC_CHANNEL_REFUSED", {})
+
+    with pytest.raises(paramiko.SSHException):
+        cisco_ssh._execute_show(_FakeSSH(), "show version")
+    assert cisco_ssh._EXEC_CHANNEL_REFUSED == {}
+
+
+def test_only_failed_exec_commands_are_rerun_on_the_shell(monkeypatch):
+    import threading
+
+    import paramiko
+
+    from app.services import cisco_ssh
+
+    class _FakeSSH:
+        ip = "10.0.0.12"
+
+        def __init__(self):
+            self.shell_commands: list[str] = []
+            self.open_channels = 0
+            self.peak_channels = 0
+            self.lock = threading.Lock()
+
+        def is_alive(self):
+            return True
+
+        def is_reusable(self):
+            return True
+
+        def execute(self, cmd: str):
+            self.shell_commands.append(cmd)
+            return f"shell:{cmd}"
+
+        def execute_exec(self, cmd: str):
+            with self.lock:
+                self.open_channels += 1
+                self.peak_channels = max(self.peak_channels, self.open_channels)
+            try:
+                if cmd == "show power inline":
+                    raise paramiko.ChannelException(4, "Resource shortage")
+                return f"exec:{cmd}"
+            finally:
+                with self.lock:
+                    self.open_channels -= 1
+
+    monkeypatch.setattr(cisco_ssh, "_EXEC_CHANNEL_REFUSED", {})
+    ssh = _FakeSSH()
+
+    outputs = cisco_ssh._execute_concurrently(ssh, ["show mac", "show power inline", "show ip arp"])
+
+    assert outputs == ["exec:show mac", "shell:show power inline", "exec:show ip arp"]
+    assert ssh.shell_commands == ["show power inline"]
+    assert ssh.peak_channels <= cisco_ssh.EXEC_CHANNEL_CONCURRENCY
+    assert cisco_ssh._EXEC_CHANNEL_REFUSED == {}
+
+
+def test_exec_channel_error_text_is_rerun_on_the_shell(monkeypatch):
+    from app.services import cisco_ssh
+
+    class _Channel:
+        def __init__(self):
+            self.chunks = [b"% Authorization failed.\r\n", b""]
+
+        def settimeout(self, timeout):
+            pass
+
+        def exec_command(self, cmd):
+            pass
+
+        def recv(self, size):
+            return self.chunks.pop(0)
+
+        def close(self):
+            pass
+
+    class _Transport:
+        def is_active(self):
+            return True
+
+        def open_session(self, timeout=None):
+            return _Channel()
+
+    ssh = CiscoSSH("10.0.0.13", "admin", "pass")
+    ssh.transport = _Transport()  # type: ignore[assignment]
+    monkeypatch.setattr(ssh, "is_alive", lambda: True)
+    monkeypatch.setattr(ssh, "execute", lambda cmd: f"shell:{cmd}")
+    monkeypatch.setattr(cisco_ssh, "_EXEC_CHANNEL_REFUSED", {})
+
+    assert cisco_ssh._execute_show(ssh, "show version") == "shell:show version"
+    assert cisco_ssh._execute_concurrently(ssh, ["show mac", "show ip arp"]) == ["shell:show mac", "shell:show ip arp"]
+
+
+def test_timed_out_config_block_is_not_returned_to_the_pool():
+    import select
+    import socket
+
+    import pytest
+
+    from app.services import cisco_ssh
+
+    reader, writer = socket.socketpair()
+
+    class _SocketShell:
+        closed = False
+        eof_received = False
+
+        def fileno(self):
+            return reader.fileno()
+
+        def recv_ready(self):
+            return bool(select.select([reader], [], [], 0)[0])
+
+        def recv(self, size):
+            return reader.recv(size)
+
+        def send(self, data):
+            writer.sendall(b"configure terminal\r\nsw1(config)#interface Gi1/0/1\r\n")
+
+        def close(self):
+            self.closed = True
+
+    class _Transport:
+        def is_active(self):
+            return True
+
+        def close(self):
+            pass
+
+    ssh = CiscoSSH("10.0.0.10", "admin", "pass")
+    ssh.shell = _SocketShell()  # type: ignore[assignment]
+    ssh.transport = _Transport()  # type: ignore[assignment]
+
+    with pytest.raises(TimeoutError):
+        ssh.execute_batch(["configure terminal", "interface Gi1/0/1", "shutdown"], timeout=0.2)
+    assert ssh.is_reusable() is False
+
+    writer.sendall(b"sw1(config-if)#")
+    ssh._recv_until_prompt(timeout=1)
+    assert ssh.is_reusable() is False
+
+    writer.sendall(b"end\r\nsw1#")
+    ssh._recv_until_prompt(timeout=1)
+    assert ssh.is_reusable() is True
+
+    writer.sendall(b"%LINK-3-UPDOWN: late output\r\n")
+    select.select([reader], [], [], 1)
+    assert ssh.is_reusable() is False
+
+    pool = cisco_ssh._SessionPool()
+    pool._release(("10.0.0.10", 22, "admin", "pass", ""), ssh)
+    assert pool._idle == {}
+    assert ssh.shell is None
+    reader.close()
+    writer.close()
+
+
+def test_switch_cache_keeps_only_successful_results(monkeypatch):
+    from app.services import cisco_ssh
+
+    connects: list[int] = []
+
+    class _FakeSSH:
+        reachable = False
+
+        def __init__(self, *_args, **_kwargs):
+            self.ip = "10.0.0.13"
+
+        def connect(self):
+            connects.append(1)
+            return _FakeSSH.reachable
+
+        def is_alive(self):
+            return True
+
+        def is_reusable(self):
+            return True
+
+        def execute_exec(self, cmd: str):
+            return "sw1 uptime is 1 day\n"
+
+        def close(self):
+            pass
+
+    cache = cisco_ssh._TTLCache(15)
+    monkeypatch.setattr(cisco_ssh, "CiscoSSH", _FakeSSH)
+    monkeypatch.setattr(cisco_ssh, "_SESSION_POOL", cisco_ssh._SessionPool())
+    monkeypatch.setattr(cisco_ssh, "_SWITCH_INFO_CACHE", cache)
+
+    assert cisco_ssh.get_switch_info("10.0.0.13", "admin", "s3cret").is_online is False
+    _FakeSSH.reachable = True
+    info = cisco_ssh.get_switch_info("10.0.0.13", "admin", "s3cret")
+    info.hostname = "mutated"
+
+    assert cisco_ssh.get_switch_info("10.0.0.13", "admin", "s3cret").hostname == "sw1"
+    assert len(connects) == 2
+    assert "s3cret" not in repr(list(cache._store))
+
+
+def test_ttl_cache_prunes_expired_entries_and_their_locks(monkeypatch):
+    from app.services import cisco_ssh
+
+    now = 1000.0
+    monkeypatch.setattr(cisco_ssh.time, "monotonic", lambda: now)
+    cache = cisco_ssh._TTLCache(15)
+
+    cache.get_or_set(("10.0.0.1",), lambda: "up")
+    cache.get_or_set(("10.0.0.2",), lambda: None)
+    assert list(cache._key_locks) == [("10.0.0.1",)]
+
+    now += 15
+    cache.get_or_set(("10.0.0.3",), lambda: "up")
+    assert list(cache._store) == [("10.0.0.3",)]
+    assert list(cache._key_locks) == [("10.0.0.3",)]
+
+
+def test_ttl_cache_keeps_a_key_lock_handed_out_before_prune(monkeypatch):
+    import threading
+
+    from app.services import cisco_ssh
+
+    cache = cisco_ssh._TTLCache(15)
+
+    class _PruneAfterRelease:
+        """Runs a prune in the gap between handing out a key lock and acquiring it."""
+
+        def __init__(self):
+            self.inner = threading.Lock()
+            self.armed = True
+
+        def __enter__(self):
+            self.inner.acquire()
+
+        def __exit__(self, *_exc):
+            self.inner.release()
+            if self.armed:
+                self.armed = False
+                cache._prune()
+
+    cache._lock = _PruneAfterRelease()  # type: ignore[assignment]
+    seen: list[bool] = []
+
+    def fetch():
+        seen.append(("10.0.0.1",) in cache._key_locks)
+        return "up"
+
+    assert cache.get_or_set(("10.0.0.1",), fetch) == "up"
+    assert seen == [True]
+    assert cache._key_users == {}
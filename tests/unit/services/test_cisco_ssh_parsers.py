@@ -1,4 +1,15 @@
-from app.services.cisco_ssh import _enrich_mac_from_table, _normalize_port, _parse_cdp_access_points
+from app.services.cisco_ssh import (
+    APInfo,
+    SwitchInfo,
+    _enrich_arp,
+    _enrich_mac_from_table,
+    _enrich_poe,
+    _format_mac,
+    _is_ap_platform,
+    _normalize_port,
+    _parse_cdp_access_points,
+    _parse_show_version,
+)
 
 
 def test_parse_cdp_access_points_filters_non_ap_entries():
@@ -35,3 +46,106 @@ IP address: 10.10.20.10
     _enrich_mac_from_table(aps, mac_output)
     assert aps[0].mac_address == "aa:bb:cc:dd:ee:01"
     assert _normalize_port("GigabitEthernet1/0/10") == "Gi1/0/10"
+
+
+def test_enrich_poe_and_arp_scan_multiline_output():
+    aps = [APInfo(mac_address="aa:bb:cc:dd:ee:01", port="GigabitEthernet1/0/10", vlan=20)]
+    poe_output = (
+        "Interface Admin  Oper       Power   Device              Class Max\r\n"
+        "--------- ------ ---------- ------- ------------------- ----- ----\r\n"
+        "Gi1/0/9   auto   off        0.0     n/a                 n/a   30.0\r\n"
+        "Gi1/0/10  auto   on         15.4    C9120AXI-R          4     30.0\r\n"
+    )
+    arp_output = (
+        "Protocol  Address          Age (min)  Hardware Addr   Type   Interface\r\n"
+        "Internet  10.10.20.10             3   aabb.ccdd.ee01  ARPA   Vlan20\r\n"
+        "Internet  10.10.20.11             5   aabb.ccdd.ee02  ARPA   Vlan20\r\n"
+    )
+
+    _enrich_poe(aps, poe_output)
+    _enrich_arp(aps, arp_output)
+
+    assert aps[0].poe_status == "on"
+    assert aps[0].poe_power == "15.4W"
+    assert aps[0].ip_address == "10.10.20.10"
+
+
+def test_format_mac_converts_cisco_notation():
+    assert _format_mac("AABB.ccdd.EE01") == "aa:bb:cc:dd:ee:01"
+    assert _format_mac("aabb.ccdd") == "aabb.ccdd"
+    assert _format_mac("zzzz.zzzz.zzzz") == "zzzz.zzzz.zzzz"
+
+
+def test_normalize_port_abbreviates_known_prefixes():
+    assert _normalize_port(" FastEthernet0/1 ") == "Fa0/1"
+    assert _normalize_port("TenGigabitEthernet1/1/1") == "Te1/1/1"
+    assert _normalize_port("TwentyFiveGigE1/0/1") == "Twe1/0/1"
+    assert _normalize_port("Gi1/0/10") == "Gi1/0/10"
+    assert _normalize_port("Port-channel1") == "Port-channel1"
+
+
+def test_parse_show_version_prefers_ios_software_line():
+    output = (
+        "Cisco IOS Software, C2960X Software (C2960X-UNIVERSALK9-M), Version 15.2(7)E2, RELEASE SOFTWARE (fc3)\r\n"
+        "ROM: Bootstrap program is C2960X boot loader\r\n"
+        "sw-floor1 uptime is 12 weeks, 3 days, 4 hours\r\n"
+        "cisco WS-C2960X-48FPD-L (APM86XXX) processor with 524288K bytes of memory.\r\n"
+        "Model number                    : WS-C2960X-48FPD-L\r\n"
+    )
+    info = SwitchInfo()
+    _parse_show_version(info, output)
+    assert info.hostname == "sw-floor1"
+    assert info.uptime == "12 weeks, 3 days, 4 hours"
+    assert info.ios_version == "15.2(7)E2"
+    assert info.model_info == "WS-C2960X-48FPD-L"
+
+
+def test_parse_show_version_tracks_uptime_across_polls():
+    template = (
+        "Cisco IOS Software, C2960X Software (C2960X-UNIVERSALK9-M), Version 15.2(7)E2, RELEASE SOFTWARE (fc3)\r\n"
+        "sw-floor2 uptime is {}\r\n"
+        "Model number                    : WS-C2960X-24PS-L\r\n"
+    )
+    first, second = SwitchInfo(), SwitchInfo()
+    _parse_show_version(first, template.format("1 day, 2 hours"))
+    _parse_show_version(second, template.format("1 day, 3 hours"))
+
+    assert first.uptime == "1 day, 2 hours"
+    assert second.uptime == "1 day, 3 hours"
+    assert (second.hostname, second.ios_version, second.model_info) == ("sw-floor2", "15.2(7)E2", "WS-C2960X-24PS-L")
+
+
+def test_is_ap_platform_matches_tokens_case_insensitively():
+    assert _is_ap_platform("cisco AIR-AP2802I-E-K9")
+    assert _is_ap_platform("Cisco C9130AXI-E")
+    assert not _is_ap_platform("cisco WS-C2960X-48FPS-L")
+
+
+def test_is_ap_platform_collapses_whitespace_and_keeps_air_prefix_case_sensitive():
+    assert _is_ap_platform("Cisco  AP")
+    assert _is_ap_platform("Cisco\tAP")
+    assert not _is_ap_platform("cisco chair-01")
+
+
+def test_parse_cdp_access_points_keeps_first_address_per_entry():
+    cdp_output = """
+-------------------------
+Device ID: AP-Floor1
+Entry address(es):
+  IP address: 10.0.20.11
+Platform: cisco AIR-AP2802I-E-K9,  Capabilities: Trans-Bridge Source-Route-Bridge IGMP
+Interface: GigabitEthernet1/0/5,  Port ID (outgoing port): GigabitEthernet0
+Management address(es):
+  IP address: 10.0.99.11
+-------------------------
+Device ID: bridge-01
+Entry address(es):
+  IP address: 10.0.20.12
+Platform: Linux,  Capabilities: Trans-Bridge
+Interface: GigabitEthernet1/0/6,  Port ID (outgoing port): eth0
+"""
+    aps = _parse_cdp_access_points(cdp_output, vlan=20)
+    assert [(ap.cdp_name, ap.ip_address, ap.port, ap.cdp_platform) for ap in aps] == [
+        ("AP-Floor1", "10.0.20.11", "GigabitEthernet1/0/5", "cisco AIR-AP2802I-E-K9"),
+        ("bridge-01", "10.0.20.12", "GigabitEthernet1/0/6", "Linux"),
+    ]
@@ -0,0 +1,297 @@
+import asyncio
+
+from pysnmp.hlapi.asyncio import SnmpEngine, cmdgen
+from pysnmp.proto.rfc1902 import OctetString, TimeTicks
+
+from app.services import device_poll
+
+
+def test_snmp_bulk_reads_system_scalars_and_first_mac(monkeypatch):
+    requested: list[tuple[int, int]] = []
+
+    async def fake_bulk_cmd(engine, community, target, context, non_repeaters, max_repetitions, *var_binds):
+        requested.append((non_repeaters, max_repetitions))
+        table = [
+            [
+                ("1.3.6.1.2.1.1.1.0", OctetString("Linux nettop 5.15")),
+                ("1.3.6.1.2.1.1.5.0", OctetString("nettop-01")),
+                ("1.3.6.1.2.1.1.3.0", TimeTicks(360000)),
+                ("1.3.6.1.2.1.2.2.1.6.1", OctetString(b"")),
+            ],
+            [("1.3.6.1.2.1.2.2.1.6.2", OctetString(b"\x00\x11\x22\x33\x44\x55"))],
+        ]
+        return None, 0, 0, table
+
+    monkeypatch.setattr(cmdgen, "bulkCmd", fake_bulk_cmd)
+
+    info, mac = asyncio.run(device_poll._get_snmp_info_and_mac("10.0.0.5", "public", SnmpEngine()))
+
+    assert requested == [(3, device_poll.SNMP_BULK_REPETITIONS)]
+    assert info["hostname"] == "nettop-01"
+    assert info["os_info"] == "Linux nettop 5.15"
+    assert info["uptime"]
+    assert mac == "00:11:22:33:44:55"
+
+
+def test_arp_table_mac_matches_whole_address(monkeypatch):
+    import io
+
+    table = (
+        b"IP address       HW type     Flags       HW address            Mask     Device\n"
+        b"10.0.0.10        0x1         0x2         aa:bb:cc:dd:ee:10     *        eth0\n"
+        b"10.0.0.1         0x1         0x2         AA:BB:CC:DD:EE:01     *        eth0\n"
+        b"10.0.0.2         0x1         0x0         00:00:00:00:00:00     *        eth0\n"
+    )
+    monkeypatch.setattr(device_poll, "open", lambda *_args, **_kwargs: io.BytesIO(table), raising=False)
+
+    assert device_poll._arp_table_mac("10.0.0.1") == "aa:bb:cc:dd:ee:01"
+    assert device_poll._arp_table_mac("10.0.0.2") is None
+    assert device_poll._arp_table_mac("10.0.0.3") is None
+
+
+def test_neighbor_dump_is_shared_between_lookups_without_procfs(monkeypatch):
+    calls: list[int] = []
+
+    def fake_read():
+        calls.append(1)
+        return {"10.0.0.7": "aa:bb:cc:dd:ee:07"}
+
+    def missing_procfs(*_args, **_kwargs):
+        raise FileNotFoundError("/proc/net/arp")
+
+    monkeypatch.setattr(device_poll, "open", missing_procfs, raising=False)
+    monkeypatch.setattr(device_poll, "_read_neighbor_table", fake_read)
+    monkeypatch.setattr(device_poll, "_arp_table_cache", None)
+    monkeypatch.setattr(device_poll, "_procfs_arp_available", lambda: False)
+    monkeypatch.setattr(device_poll, "_probe_neighbor", lambda _ip: None)
+    monkeypatch.setattr(device_poll, "ARP_PROBE_INTERVAL", 0)
+
+    assert device_poll._get_mac_from_arp("10.0.0.7") == "aa:bb:cc:dd:ee:07"
+    assert device_poll._get_mac_from_arp("10.0.0.8") is None
+    assert device_poll._check_arp_for_mac("AA:BB:CC:DD:EE:07") == "10.0.0.7"
+    assert len(calls) == 1
+
+
+def test_arp_table_reads_procfs_without_spawning_ip_neigh(monkeypatch):
+    import io
+
+    table = "IP address HW type Flags HW address Mask Device\n10.0.0.7 0x1 0x2 aa:bb:cc:dd:ee:07 * eth0\n"
+    neighbor_reads: list[int] = []
+
+    def fake_neighbor_read():
+        neighbor_reads.append(1)
+        return {"10.0.0.9": "aa:bb:cc:dd:ee:09"}
+
+    monkeypatch.setattr(device_poll, "_read_neighbor_table", fake_neighbor_read)
+    monkeypatch.setattr(device_poll, "open", lambda *_args, **_kwargs: io.StringIO(table), raising=False)
+
+    assert device_poll._arp_table_mac_to_ip() == {"aa:bb:cc:dd:ee:07": "10.0.0.7"}
+    assert neighbor_reads == []
+
+    def missing_procfs(*_args, **_kwargs):
+        raise FileNotFoundError("/proc/net/arp")
+
+    monkeypatch.setattr(device_poll, "open", missing_procfs, raising=False)
+
+    assert device_poll._arp_table_mac_to_ip() == {"aa:bb:cc:dd:ee:09": "10.0.0.9"}
+    assert neighbor_reads == [1]
+
+
+def test_arp_table_is_shared_between_lookups_within_ttl(monkeypatch):
+    now = 1000.0
+    calls: list[int] = []
+
+    def fake_read():
+        calls.append(1)
+        return {"10.0.0.7": "aa:bb:cc:dd:ee:07"}
+
+    monkeypatch.setattr(device_poll.time, "monotonic", lambda: now)
+    monkeypatch.setattr(device_poll, "_read_arp_table", fake_read)
+    monkeypatch.setattr(device_poll, "_arp_table_cache", None)
+
+    assert device_poll._get_mac_from_arp("10.0.0.7") == "aa:bb:cc:dd:ee:07"
+    assert device_poll._check_arp_for_mac("AA:BB:CC:DD:EE:07") == "10.0.0.7"
+    assert len(calls) == 1
+
+    now += device_poll.ARP_TABLE_TTL
+    device_poll._cached_arp_table()
+    assert len(calls) == 2
+
+
+def test_snmp_mac_walk_pages_with_getbulk(monkeypatch):
+    requested: list[tuple[int, int]] = []
+
+    async def fake_bulk_walk_cmd(engine, community, target, context, non_repeaters, max_repetitions, *var_binds, **_kw):
+        requested.append((non_repeaters, max_repetitions))
+        yield None, 0, 0, [("1.3.6.1.2.1.2.2.1.6.1", OctetString(b""))]
+        yield None, 0, 0, [("1.3.6.1.2.1.2.2.1.6.2", OctetString(b"\x00\x11\x22\x33\x44\x66"))]
+
+    monkeypatch.setattr(cmdgen, "bulkWalkCmd", fake_bulk_walk_cmd)
+
+    mac = asyncio.run(device_poll._get_snmp_mac("10.0.0.5", "public", SnmpEngine()))
+
+    assert requested == [(0, device_poll.SNMP_BULK_REPETITIONS)]
+    assert mac == "00:11:22:33:44:66"
+
+
+def test_resolve_cache_expires_failures_sooner(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(device_poll.time, "monotonic", lambda: now)
+    monkeypatch.setattr(
+        device_poll,
+        "_RESOLVE_CACHE",
+        {"printer-1": (now - 60, "10.0.0.9"), "ghost": (now - 60, None)},
+    )
+
+    assert device_poll._resolve_cached("10.0.0.1") == (True, "10.0.0.1")
+    assert device_poll._resolve_cached("printer-1") == (True, "10.0.0.9")
+    assert device_poll._resolve_cached("ghost") == (False, None)
+
+
+def _netbios_answer(name: str, ip: str) -> bytes:
+    import socket
+    import struct
+
+    return (
+        struct.pack(">HHHHHH", 1, 0x8500, 0, 1, 0, 0)
+        + device_poll._netbios_encode_name(name)
+        + struct.pack(">HH", 0x0020, 0x0001)
+        + b"\xc0\x0c"
+        + struct.pack(">HHIH", 0x0020, 0x0001, 300, 6)
+        + b"\x00\x00"
+        + socket.inet_aton(ip)
+    )
+
+
+def test_netbios_protocol_completes_with_first_parsed_answer():
+    async def receive() -> str:
+        result = asyncio.get_running_loop().create_future()
+        protocol = device_poll._NetbiosResponseProtocol("WS-042", result)
+        protocol.error_received(ConnectionRefusedError())
+        protocol.datagram_received(b"\x00" * 12, ("10.0.0.1", 137))
+        assert not result.done()
+        protocol.datagram_received(_netbios_answer("WS-042", "10.0.0.42"), ("10.0.0.42", 137))
+        protocol.datagram_received(_netbios_answer("WS-042", "10.0.0.43"), ("10.0.0.43", 137))
+        return await result
+
+    assert asyncio.run(receive()) == "10.0.0.42"
+
+
+def test_netbios_misses_are_cached_per_name(monkeypatch):
+    queried: list[str] = []
+
+    async def fake_query(name, targets):
+        queried.append(name)
+        return None
+
+    monkeypatch.setattr(device_poll, "_netbios_query", fake_query)
+    monkeypatch.setattr(device_poll, "_NETBIOS_CACHE", {})
+
+    assert asyncio.run(device_poll._netbios_resolve("ws-042", subnets=["10.0.0.0/30"])) is None
+    assert asyncio.run(device_poll._netbios_resolve("WS-042", subnets=["10.0.0.0/30"])) is None
+    assert queried == ["ws-042"]
+
+
+def test_expand_subnets_skips_invalid_entries_and_is_memoized():
+    device_poll._expand_small_subnets.cache_clear()
+
+    hosts = device_poll._expand_subnets(("10.0.0.0/30", "bogus", "10.0.1.0/31"))
+
+    assert hosts == ("10.0.0.1", "10.0.0.2", "10.0.1.0", "10.0.1.1")
+    assert device_poll._expand_subnets(("10.0.0.0/30", "bogus", "10.0.1.0/31")) is hosts
+
+
+def test_expand_subnets_does_not_cache_large_networks():
+    device_poll._expand_small_subnets.cache_clear()
+
+    hosts = device_poll._expand_subnets(("10.0.0.0/16",))
+
+    assert len(hosts) == 65534
+    assert device_poll._expand_small_subnets.cache_info().currsize == 0
+    assert device_poll._expand_subnets(("10.0.0.0/16",), limit=3) == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+
+
+def test_snmp_get_maps_system_values_by_position(monkeypatch):
+    async def fake_get_cmd(engine, community, target, context, *var_binds):
+        return (
+            None,
+            0,
+            0,
+            [
+                ("1.3.6.1.2.1.1.1.0", OctetString("RouterOS CCR1009")),
+                ("1.3.6.1.2.1.1.5.0", OctetString("edge-gw")),
+                ("1.3.6.1.2.1.1.3.0", TimeTicks(9000000)),
+            ],
+        )
+
+    monkeypatch.setattr(cmdgen, "getCmd", fake_get_cmd)
+
+    info = asyncio.run(device_poll._get_snmp_info("10.0.0.6", "public", SnmpEngine()))
+
+    assert info == {"os_info": "RouterOS CCR1009", "hostname": "edge-gw", "uptime": device_poll._format_uptime(9000000)}
+
+
+def test_poll_device_gives_up_on_snmp_shortly_after_an_empty_port_scan(monkeypatch):
+    import time
+
+    async def no_ports(_ip):
+        return []
+
+    async def silent_agent(_ip, _community, _engine):
+        await asyncio.sleep(30)
+
+    def arp_lookup(_ip):
+        raise AssertionError("offline hosts must not be looked up in ARP")
+
+    monkeypatch.setattr(device_poll, "_scan_ports", no_ports)
+    monkeypatch.setattr(device_poll, "_get_snmp_info_and_mac", silent_agent)
+    monkeypatch.setattr(device_poll, "_get_mac_from_arp", arp_lookup)
+    monkeypatch.setattr(device_poll, "SNMP_TIMEOUT", 0.05)
+    monkeypatch.setattr(device_poll, "SNMP_OFFLINE_GRACE", 0.05)
+
+    started = time.monotonic()
+    status = asyncio.run(device_poll.poll_device("10.0.0.77"))
+
+    assert status.is_online is False
+    assert time.monotonic() - started < 5
+
+
+def test_poll_device_waits_for_snmp_retry_when_every_port_is_refused(monkeypatch):
+    async def refused_ports(_ip):
+        return []
+
+    async def retried_agent(_ip, _community, _engine):
+        # The first datagram was lost; the retransmission after SNMP_TIMEOUT gets the answer.
+        await asyncio.sleep(0.2)
+        return {"hostname": "snmp-only"}, "aa:bb:cc:dd:ee:ff"
+
+    monkeypatch.setattr(device_poll, "_scan_ports", refused_ports)
+    monkeypatch.setattr(device_poll, "_get_snmp_info_and_mac", retried_agent)
+    monkeypatch.setattr(device_poll, "SNMP_TIMEOUT", 0.15)
+    monkeypatch.setattr(device_poll, "SNMP_OFFLINE_GRACE", 0.1)
+
+    status = asyncio.run(device_poll.poll_device("10.0.0.78"))
+
+    assert status.is_online is True
+    assert status.hostname == "snmp-only"
+
+
+def test_run_coroutine_does_not_leak_loops_across_threads():
+    import os
+    import threading
+
+    async def tick():
+        await asyncio.sleep(0)
+        return True
+
+    def fd_count():
+        return len(os.listdir("/proc/self/fd"))
+
+    device_poll._run_coroutine(tick())
+    before = fd_count()
+    for _ in range(20):
+        thread = threading.Thread(target=device_poll._run_coroutine, args=(tick(),))
+        thread.start()
+        thread.join()
+
+    assert fd_count() <= before
@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import discovery
+
+
+def test_iconbit_fingerprint_uses_the_shared_client():
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        assert request.headers["authorization"].startswith("Basic ")
+        if request.url.path == "/":
+            return httpx.Response(200, text="<html><title>Iconbit XDS</title><a href='/play'>play</a></html>")
+        return httpx.Response(404)
+
+    async def fingerprint():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler), auth=discovery._ICONBIT_AUTH) as client:
+            return await discovery._iconbit_fingerprint("10.0.0.50", client)
+
+    assert asyncio.run(fingerprint()) == {"model_info": "Iconbit XDS", "device_kind": "iconbit"}
+    assert requested == ["/"]
+
+
+def test_iconbit_fingerprint_probes_status_pages_only_when_main_page_is_inconclusive():
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path == "/":
+            return httpx.Response(200, text="<html><title>Media</title></html>")
+        if request.url.path == "/status.xml":
+            raise httpx.ConnectTimeout("timed out", request=request)
+        return httpx.Response(200, text="<b>Now playing</b> promo.mp4")
+
+    async def fingerprint():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await discovery._iconbit_fingerprint("10.0.0.51", client)
+
+    assert asyncio.run(fingerprint()) == {"model_info": "Media", "device_kind": "iconbit"}
+    assert sorted(requested) == ["/", "/now", "/status.xml"]
+
+
+def test_check_ports_retries_only_the_ports_that_failed(monkeypatch):
+    attempts: list[int] = []
+    flaky = {8081}
+
+    async def fake_check_port(_ip, port, _timeout):
+        attempts.append(port)
+        if port in flaky:
+            flaky.discard(port)
+            return False
+        return port != 23
+
+    monkeypatch.setattr(discovery, "async_check_port", fake_check_port)
+    monkeypatch.setattr(discovery.settings, "SCAN_TCP_RETRIES", 1)
+
+    assert asyncio.run(discovery._check_ports("10.0.0.60", [22, 23, 8081])) == [22, 8081]
+    assert sorted(attempts) == [22, 23, 23, 8081, 8081]
+
+
+def test_parse_subnets_counts_hosts_without_expanding_them():
+    networks, total = discovery._parse_subnets("10.0.0.0/24, invalid, 10.0.0.0/25, 10.0.1.0/31")
+
+    assert total == 256
+    assert list(discovery._iter_subnet_ips(networks))[-3:] == ["10.0.0.254", "10.0.1.0", "10.0.1.1"]
+    with pytest.raises(ValueError, match="Too many hosts"):
+        discovery._parse_subnets("10.0.0.0/8")
@@ -0,0 +1,31 @@
+import httpx
+
+from app.services import iconbit
+
+
+def test_delete_all_files_reuses_the_module_client(monkeypatch):
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        assert request.headers["authorization"].startswith("Basic ")
+        if request.url.path == "/":
+            return httpx.Response(200, text="<a href='delete?file=a.mp4'>x</a><a href='delete?file=b.mp4'>x</a>")
+        if request.url.path == "/delete":
+            return httpx.Response(200)
+        return httpx.Response(404)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler), auth=iconbit.AUTH_CREDS)
+    monkeypatch.setattr(iconbit, "_client", client)
+
+    assert iconbit.delete_all_files("10.0.0.70") is True
+    assert "http://10.0.0.70:8081/delete?file=a.mp4" in requested
+    assert "http://10.0.0.70:8081/delete?file=b.mp4" in requested
+
+
+def test_parsers_extract_track_and_free_space():
+    assert iconbit._parse_now_html("<html><b> promo.mp4 </b></html>") == "promo.mp4"
+    assert iconbit._parse_now_html("<p>none</p>") is None
+    assert iconbit._parse_free_space("Доступно 1,5 GB / 8 GB") == "1,5 GB / 8 GB"
+    assert iconbit._parse_free_space("used 2 GB / 16 GB") == "2 GB / 16 GB"
+    assert iconbit._parse_free_space("512 MB available") == "512 MB"
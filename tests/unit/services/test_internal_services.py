@@ -71,3 +71,14 @@ async def test_proxy_request_does_not_retry_post_by_default(monkeypatch):
         )
 
     assert calls["count"] == 1
+
+
+@pytest.mark.parametrize("body", [b"[1, 2]", b"not json", b'{"progress": "bad"}'])
+def test_parse_proxy_payload_maps_invalid_body_to_502(body):
+    from app.domains.inventory.schemas import ScanResults
+
+    with pytest.raises(HTTPException) as exc_info:
+        internal_services._parse_proxy_payload(ScanResults.from_json_bytes, body)
+
+    assert exc_info.value.status_code == 502
+    assert exc_info.value.detail["code"] == "invalid_payload"
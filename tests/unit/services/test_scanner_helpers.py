@@ -18,3 +18,41 @@ def test_parse_subnets_ignores_invalid_entries():
 def test_parse_ports_filters_invalid_and_deduplicates():
     ports = _parse_ports("9100, 631, not-a-port, 9100, 70000, 0")
     assert ports == [9100, 631]
+
+
+def test_async_check_port_reports_listening_and_closed_ports():
+    import asyncio
+    import socket
+
+    from app.services.ping import async_check_port
+
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    open_port = listener.getsockname()[1]
+    closed = socket.socket()
+    closed.bind(("127.0.0.1", 0))
+    closed_port = closed.getsockname()[1]
+    try:
+        assert asyncio.run(async_check_port("127.0.0.1", open_port, timeout=1)) is True
+        assert asyncio.run(async_check_port("127.0.0.1", closed_port, timeout=1)) is False
+    finally:
+        listener.close()
+        closed.close()
+
+
+def test_async_check_port_reports_closed_when_out_of_descriptors(monkeypatch):
+    import asyncio
+    import errno
+
+    from app.services import ping
+
+    def exhausted(*_args, **_kwargs):
+        raise OSError(errno.EMFILE, "Too many open files")
+
+    async def probe():
+        # Patched inside the loop, which needs its own socketpair to start.
+        monkeypatch.setattr(ping.socket, "socket", exhausted)
+        return await ping.async_check_port("127.0.0.1", 9100, timeout=1)
+
+    assert asyncio.run(probe()) is False